@@ -2,8 +2,11 @@
 from .value import ReactiveValue as ReactiveValue
 from .view import ReactiveView as ReactiveView
 from .property import ReactiveProperty as ReactiveProperty
+from .array import ReactiveArrayProperty as ReactiveArrayProperty
+from .computed import ReactiveComputed as ReactiveComputed
 from . import functions
 from .object import ReactiveObject as ReactiveObject
 
 RV = ReactiveView
 RP = ReactiveProperty
+RC = ReactiveComputed
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import TypeVar, Generic, Optional, Deque, Any
+
+from rx import Observable
+from rx.core.typing import Disposable
+
+T = TypeVar("T")
+
+
+# An asynchronous iterator over the values of an observable, which can be consumed with 'async for'. It subscribes to
+# the observable when it is first iterated, and disposes the subscription when it gets closed or cancelled.
+#
+# Values which arrive faster than they are consumed are kept in a buffer. If the buffer has a limited size, the oldest
+# values are discarded when it is full, so a buffer size of 1 only keeps the latest value.
+class ObservableIterator(Generic[T]):
+
+    def __init__(self, observable: Observable, buffer_size: Optional[int] = None) -> None:
+        if observable is None:
+            raise ValueError("Argument 'observable' is required.")
+
+        if buffer_size is not None and buffer_size < 1:
+            raise ValueError("Argument 'buffer_size' must be a positive integer.")
+
+        self._observable = observable
+        self._buffer: Deque[T] = deque(maxlen=buffer_size)
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._subscription: Optional[Disposable] = None
+        self._waiter: Optional[asyncio.Future] = None
+
+        self._completed = False
+        self._error: Optional[Exception] = None
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def __aiter__(self) -> ObservableIterator[T]:
+        return self
+
+    async def __anext__(self) -> T:
+        if self._closed:
+            raise StopAsyncIteration
+
+        if self._subscription is None:
+            self._subscribe()
+
+        try:
+            while not self._buffer:
+                if self._error is not None:
+                    raise self._error
+
+                if self._completed:
+                    raise StopAsyncIteration
+
+                assert self._loop is not None
+
+                self._waiter = self._loop.create_future()
+
+                try:
+                    await self._waiter
+                finally:
+                    self._waiter = None
+        except (asyncio.CancelledError, StopAsyncIteration):
+            self.close()
+            raise
+
+        return self._buffer.popleft()
+
+    async def __aenter__(self) -> ObservableIterator[T]:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    async def aclose(self) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+
+        self._closed = True
+        self._buffer.clear()
+
+        if self._subscription is not None:
+            self._subscription.dispose()
+
+        self._wake()
+
+    def _subscribe(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._subscription = self._observable.subscribe(self._on_next, self._on_error, self._on_completed)
+
+    def _on_next(self, value: T) -> None:
+        self._call(self._push, value)
+
+    def _on_error(self, error: Exception) -> None:
+        self._call(self._fail, error)
+
+    def _on_completed(self) -> None:
+        self._call(self._complete)
+
+    # Notifications may come from a different thread, when the value is observed with a scheduler.
+    def _call(self, callback, *args: Any) -> None:
+        assert self._loop is not None
+
+        running: Optional[asyncio.AbstractEventLoop]
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is self._loop:
+            callback(*args)
+        elif not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(callback, *args)
+
+    def _push(self, value: T) -> None:
+        if not self._closed:
+            self._buffer.append(value)
+            self._wake()
+
+    def _fail(self, error: Exception) -> None:
+        self._error = error
+        self._wake()
+
+    def _complete(self) -> None:
+        self._completed = True
+        self._wake()
+
+    def _wake(self) -> None:
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
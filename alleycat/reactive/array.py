@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Optional, Tuple, List, NamedTuple
+
+from returns.context import RequiresContext
+from rx import Observable
+from rx import operators as ops
+from rx.core.typing import Scheduler
+
+from . import ReactiveValue, ReactiveView, stats, timing
+from .property import ValueSubject
+from .value import BATCH, GLITCH_FREE_KEY, LAZY_KEY, THREAD_SAFE_KEY, Modifier, batch, get_lock
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type:ignore
+
+# An index of elements in an array, which can be anything NumPy accepts as an index (e.g. a slice, a boolean mask, or
+# an array of integers).
+Index = Any
+
+
+class ArrayChange(NamedTuple):
+    # A read-only view of the whole array, rather than a copy of it, so it reflects the later updates as well. Copy it
+    # (e.g. with 'np.array(change.values)') if you need to keep the values as they were after the change.
+    values: Any
+    # The elements which have changed.
+    index: Index
+
+
+# A property which stores a field for a whole population of entities in a single NumPy array, so that it can be
+# updated for all of them at once. Instead of the values themselves, it emits an ArrayChange for each update.
+class ReactiveArrayProperty(ReactiveValue[Any]):
+
+    def __init__(
+            self,
+            init_value: Callable[[Any], Any],
+            dtype: Any = None,
+            read_only=False,
+            lazy: Optional[bool] = None,
+            scheduler: Optional[Scheduler] = None) -> None:
+        if np is None:
+            raise ImportError("ReactiveArrayProperty requires NumPy to be installed.")
+
+        super().__init__(read_only, scheduler)
+
+        self._init_value = init_value
+        self._dtype = dtype
+        self._lazy = lazy
+
+    @property
+    def init_value(self) -> Callable[[Any], Any]:
+        return self._init_value
+
+    @property
+    def dtype(self) -> Any:
+        return self._dtype
+
+    @property
+    def lazy(self) -> Optional[bool]:
+        return self._lazy
+
+    def is_lazy(self, cls: type) -> bool:
+        return getattr(cls, LAZY_KEY, False) if self.lazy is None else self.lazy
+
+    def pipe(self, modifiers: Callable[[Any], Tuple[Modifier, ...]]) -> ReactiveView:
+        def create(obj: Any) -> Observable:
+            return self.context(obj).pipe(*timing.instrument(modifiers(obj)))
+
+        return ReactiveView(RequiresContext(create), self.read_only, (self,), self.scheduler)
+
+    def update(self, obj: Any, index: Index, values: Any) -> None:
+        if obj is None:
+            raise ValueError("Cannot update a property of a None object.")
+
+        if self.read_only:
+            raise AttributeError("Cannot modify a read-only property.")
+
+        if getattr(type(obj), THREAD_SAFE_KEY, False):
+            with get_lock(obj):
+                self._update(obj, index, values)
+        else:
+            self._update(obj, index, values)
+
+    def _update(self, obj: Any, index: Index, values: Any) -> None:
+        data = self._get_data(obj)
+
+        assert isinstance(data, ReactiveArrayProperty.ArrayData)
+
+        if getattr(type(obj), GLITCH_FREE_KEY, False):
+            with batch():
+                data.update(index, values)
+        else:
+            data.update(index, values)
+
+    # Observes a single element of the array, which emits its value whenever an update includes the element.
+    def observe_item(self, obj: Any, index: int, scheduler: Optional[Scheduler] = None) -> Observable:
+        if obj is None:
+            raise ValueError("Cannot observe a None object.")
+
+        def includes(change: ArrayChange) -> bool:
+            return _includes(change.index, index, len(change.values))
+
+        return self.observable(obj, scheduler).pipe(ops.filter(includes), ops.map(lambda c: c.values[index]))
+
+    class ArrayData(ReactiveValue.Data[Any]):
+        __slots__ = ("_array", "_property", "_pending")
+
+        def __init__(self, name: str, value: Any):
+            assert name is not None
+            assert value is not None
+
+            super().__init__(name, None)
+
+            self._property: Optional[ValueSubject] = None
+            self._pending: List[Index] = []
+
+            self._replace(value)
+
+            self._initialized = True
+
+        def _replace(self, value: Any) -> None:
+            self._array = value
+
+            # Expose a read-only view, so that the array can't be modified without notifying the observers.
+            self._value = value.view()
+            self._value.flags.writeable = False
+
+        def _materialize(self) -> None:
+            self._property = ValueSubject(ArrayChange(self._value, slice(None)))
+            self._observable = self._property
+
+        def update(self, index: Index, values: Any) -> None:
+            self._check_disposed()
+
+            self._array[index] = values
+            self._version += 1
+            self._notify(index)
+
+        def assign(self, value: Any) -> None:
+            self._check_disposed()
+
+            if value.shape == self._array.shape:
+                self._array[...] = value
+            else:
+                self._replace(value)
+                self._pending.clear()
+
+            self._version += 1
+            self._notify(slice(None))
+
+        def _notify(self, index: Index) -> None:
+            # Nobody has observed the property yet.
+            if self._property is None:
+                return
+
+            batch = BATCH.get()
+
+            self._pending.append(index)
+
+            if batch is None or batch.flushing:
+                self._publish()
+            else:
+                batch.updates[self] = self._publish
+
+        def _publish(self) -> None:
+            assert self._property is not None
+
+            if len(self._pending) == 1:
+                index = self._pending[0]
+            else:
+                # Merge the updates made in a batch into a single change.
+                index = np.zeros(self._array.shape, dtype=bool)
+
+                for i in self._pending:
+                    index[i] = True
+
+            self._pending.clear()
+
+            if stats.COLLECTOR is not None:
+                stats.COLLECTOR.on_emit(self)
+
+            self._property.on_next(ArrayChange(self._value, index))
+
+    def _create_data(self, obj: Any) -> ArrayData:
+        assert obj is not None
+        assert self.name is not None
+
+        # Always copy the initial value, as each instance should have its own array.
+        value = np.array(self.init_value(obj), dtype=self.dtype)
+
+        return self.ArrayData(self.name, value)
+
+    def _set_value(self, obj: Any, data: ReactiveValue.Data, value: Any) -> None:
+        assert obj is not None
+        assert isinstance(data, ReactiveArrayProperty.ArrayData)
+
+        array = np.array(value, dtype=self.dtype)
+
+        if getattr(type(obj), GLITCH_FREE_KEY, False):
+            with batch():
+                data.assign(array)
+        else:
+            data.assign(array)
+
+    def _save(self, obj: Any, state: Dict[str, Any]) -> None:
+        assert self.name is not None
+
+        # Copy the array, so that the snapshot isn't affected by the later updates.
+        state[self.name] = np.array(self._get_data(obj).value)
+
+    def _restore(self, obj: Any, value: Any) -> None:
+        data = self._get_data(obj)
+
+        assert isinstance(data, ReactiveArrayProperty.ArrayData)
+
+        data.assign(np.array(value, dtype=self.dtype))
+
+
+# Tells if the index includes the given item along the first axis of the array (i.e. a row of a multidimensional one).
+def _includes(index: Index, item: int, size: int) -> bool:
+    if index is Ellipsis:
+        return True
+
+    # Only the first part of a multidimensional index selects the rows.
+    if isinstance(index, tuple):
+        return len(index) == 0 or _includes(index[0], item, size)
+
+    if isinstance(index, slice):
+        (start, stop, step) = index.indices(size)
+
+        return item in range(start, stop, step)
+
+    if isinstance(index, (int, np.integer)):
+        return index == item or index + size == item
+
+    index = np.asarray(index)
+
+    if index.dtype == bool:
+        return bool(index[item].any())
+
+    return bool((index == item).any() or (index == item - size).any())
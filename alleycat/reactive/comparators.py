@@ -0,0 +1,79 @@
+# Comparators to be used with the 'eq' argument of a property, which decides if a new value is the same as the
+# current one, so that the assignment can be ignored.
+from math import isclose
+from typing import Any, Callable, Sequence
+
+Comparator = Callable[[Any, Any], bool]
+
+
+def equals(a: Any, b: Any) -> bool:
+    if a is b:
+        return True
+
+    try:
+        result = a == b
+    except ValueError:
+        # e.g. NumPy arrays of shapes which can't be broadcast together (older versions return False instead).
+        return False
+
+    if result is True or result is False:
+        return result
+
+    # Array-likes (e.g. NumPy arrays) are compared element-wise, so we need to reduce the result.
+    reduce = getattr(result, "all", None)
+
+    if reduce is None:
+        return bool(result)
+
+    return getattr(a, "shape", ()) == getattr(b, "shape", ()) and bool(reduce())
+
+
+def identical(a: Any, b: Any) -> bool:
+    return a is b
+
+
+def approx(tolerance: float = 1e-9) -> Comparator:
+    if tolerance < 0:
+        raise ValueError("Argument 'tolerance' must be zero or a positive number.")
+
+    def compare(a: float, b: float) -> bool:
+        return a is b or isclose(a, b, rel_tol=0, abs_tol=tolerance)
+
+    return compare
+
+
+def approx_tuple(tolerance: float = 1e-9) -> Comparator:
+    if tolerance < 0:
+        raise ValueError("Argument 'tolerance' must be zero or a positive number.")
+
+    # Avoid using isclose() and generators here as it's likely to be used for positions or vectors, which can be
+    # updated many times per frame.
+    def compare(a: Sequence[float], b: Sequence[float]) -> bool:
+        if a is b:
+            return True
+
+        if len(a) != len(b):
+            return False
+
+        for (x, y) in zip(a, b):
+            if abs(x - y) > tolerance:
+                return False
+
+        return True
+
+    return compare
+
+
+# Comparators for NumPy arrays, which don't require NumPy to be installed as they only use the methods of the arrays.
+def array_equals(a: Any, b: Any) -> bool:
+    return a is b or (a.shape == b.shape and bool((a == b).all()))
+
+
+def array_approx(tolerance: float = 1e-9) -> Comparator:
+    if tolerance < 0:
+        raise ValueError("Argument 'tolerance' must be zero or a positive number.")
+
+    def compare(a: Any, b: Any) -> bool:
+        return a is b or (a.shape == b.shape and (a.size == 0 or bool(abs(a - b).max() <= tolerance)))
+
+    return compare
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from typing import TypeVar, Generic, Any, Callable, Tuple, Sequence, Optional
+from weakref import ref
+
+import rx
+from returns.context import RequiresContext
+from rx import Observable
+from rx.core.typing import Disposable, Observer, Scheduler
+
+from . import ReactiveValue, ReactiveView, stats, timing, utils
+from .value import Modifier, coalesce, is_observer, weak_ref
+
+T = TypeVar("T")
+
+
+# A value derived from other values of the same object, which is computed when it is read, rather than whenever its
+# sources change. It caches the result until any of them changes, and it doesn't build any Rx pipeline unless it is
+# observed.
+class ReactiveComputed(Generic[T], ReactiveValue[T]):
+
+    def __init__(
+            self,
+            function: Callable[..., T],
+            sources: Sequence[ReactiveValue],
+            scheduler: Optional[Scheduler] = None) -> None:
+        if function is None:
+            raise ValueError("Argument 'function' is required.")
+
+        if len(sources) == 0:
+            raise ValueError("At least one source is required.")
+
+        super().__init__(True, scheduler)
+
+        self._function = function
+        self._sources = tuple(sources)
+        self._level = max(s.level + 1 for s in self._sources)
+
+    @property
+    def function(self) -> Callable[..., T]:
+        return self._function
+
+    @property
+    def sources(self) -> Tuple[ReactiveValue, ...]:
+        return self._sources
+
+    @property
+    def level(self) -> int:
+        return self._level
+
+    # There's nothing to compute until it is first read or observed.
+    def is_lazy(self, cls: type) -> bool:
+        return True
+
+    def pipe(self, modifiers: Callable[[Any], Tuple[Modifier, ...]]) -> ReactiveView:
+        def create(obj: Any) -> Observable:
+            return self.context(obj).pipe(*timing.instrument(modifiers(obj)))
+
+        return ReactiveView(RequiresContext(create), True, (self,), self.scheduler)
+
+    class ComputedData(ReactiveValue.Data[T]):
+        __slots__ = ("_compute", "_sources", "_checked")
+
+        def __init__(
+                self,
+                name: Optional[str],
+                compute: Callable[..., T],
+                sources: Tuple[ReactiveValue.Data, ...],
+                level: int):
+            assert compute is not None
+            assert len(sources) > 0
+
+            super().__init__(name, None, level=level)
+
+            self._compute = compute
+            self._sources = sources
+
+            # The sum of the versions of the sources when the value was last computed. Since the versions only
+            # increase, it is enough to tell if any of them has changed since then.
+            self._checked = -1
+
+        @property
+        def initialized(self) -> bool:
+            return self._initialized or all(s.initialized for s in self._sources)
+
+        @property
+        def version(self) -> int:
+            self._refresh()
+
+            return self._version
+
+        def _refresh(self) -> None:
+            checked = 0
+
+            for source in self._sources:
+                checked += source.version
+
+            if checked == self._checked:
+                return
+
+            self._value = self._compute(*(s.value for s in self._sources))
+            self._initialized = True
+            self._version += 1
+            self._checked = checked
+
+            if stats.COLLECTOR is not None:
+                stats.COLLECTOR.on_emit(self)
+
+        @property
+        def value(self) -> T:
+            if self._initialized or self.initialized:
+                self._refresh()
+
+                return self._value  # type:ignore
+
+            # See ReactiveValue.Data.value.
+            observed = utils.get_current_frame(3).bind(utils.get_observe_receiver).map(is_observer).value_or(False)
+
+            if observed:
+                return None  # type:ignore
+
+            raise AttributeError(f"Property '{self.label()}' is not initialized yet.")
+
+        # Recomputes the value whenever one of the sources emits, and notifies the observers only if it has changed,
+        # so that they receive it once even when several sources emit for the same change (e.g. in a batch).
+        def _materialize(self) -> None:
+            sources = self._sources
+
+            # The observable is kept by the data, so it shouldn't keep a strong reference back to it.
+            data = ref(self)
+
+            def subscribe(observer: Observer, scheduler=None) -> Disposable:
+                last = [-1]
+
+                def on_next(_: Any) -> None:
+                    target = data()
+
+                    if target is None or not target.initialized:
+                        return
+
+                    try:
+                        version = target.version
+                    except Exception as e:
+                        observer.on_error(e)
+                        return
+
+                    if version != last[0]:
+                        last[0] = version
+
+                        observer.on_next(target._value)
+
+                return rx.merge(*(s.observable for s in sources)) \
+                    .subscribe_(on_next, observer.on_error, observer.on_completed, scheduler)
+
+            self._observable = Observable(subscribe).pipe(coalesce(self._level))
+
+    def _create_data(self, obj: Any) -> ComputedData:
+        assert obj is not None
+
+        # The data belongs to the object, so it shouldn't keep a strong reference back to it.
+        owner = weak_ref(obj)
+        function = self.function
+
+        def compute(*values: Any) -> T:
+            return function(owner(), *values)
+
+        sources = tuple(s._get_data(obj) for s in self.sources)
+
+        return self.ComputedData(self.name, compute, sources, self.level)
+
+    def _set_value(self, obj: Any, data: ReactiveValue.Data, value: Any) -> None:
+        raise AttributeError("Cannot modify a computed value.")
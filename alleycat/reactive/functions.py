@@ -1,41 +1,82 @@
+from contextlib import nullcontext
 from types import FrameType
-from typing import Any, Callable, Optional, Sequence, Tuple, TypeVar
+from typing import Any, Callable, ContextManager, Dict, Mapping, NamedTuple, Optional, Sequence, Tuple, TypeVar
 
 import rx
 from returns.context import RequiresContext
 from returns.iterables import Fold
 from returns.maybe import Maybe, Nothing
 from rx import Observable
+from rx.core.typing import Scheduler
 
 from . import ReactiveValue, utils
+from .aio import ObservableIterator
+from .array import ReactiveArrayProperty
+from .comparators import Comparator
+from .computed import ReactiveComputed
+from .journal import disable as disable_journal, enable as enable_journal, entries as journal, replay as replay
 from .property import ReactiveProperty
-from .value import DATA_KEY
+from .shared import SharedMirror, SharedReader
+from .stats import disable as disable_stats, enable as enable_stats, snapshot as stats
+from .timing import disable as disable_timing, enable as enable_timing, exposition as export_timings, \
+    snapshot as timings
+from .value import THREAD_SAFE_KEY, batch as batch, get_data, get_lock, get_state, observer, set_state
 from .view import ReactiveView
 
 T = TypeVar("T")
 
 
-def new_property(read_only=False) -> ReactiveProperty:
-    return ReactiveProperty(Nothing, read_only)
+def new_property(
+        read_only=False,
+        lazy: Optional[bool] = None,
+        dedupe=False,
+        eq: Optional[Comparator] = None,
+        scheduler: Optional[Scheduler] = None) -> ReactiveProperty:
+    return ReactiveProperty(Nothing, read_only, lazy=lazy, dedupe=dedupe, eq=eq, scheduler=scheduler)
 
 
-def new_view(read_only=True) -> ReactiveView:
-    return ReactiveView(RequiresContext(lambda _: rx.empty()), read_only)
+def new_view(read_only=True, scheduler: Optional[Scheduler] = None) -> ReactiveView:
+    return ReactiveView(RequiresContext(lambda _: rx.empty()), read_only, scheduler=scheduler)
 
 
-def from_value(value: Optional[T], read_only=False) -> ReactiveProperty[T]:
-    return ReactiveProperty(Maybe.from_optional(value), read_only)
+def from_value(
+        value: Optional[T],
+        read_only=False,
+        lazy: Optional[bool] = None,
+        dedupe=False,
+        eq: Optional[Comparator] = None,
+        scheduler: Optional[Scheduler] = None) -> ReactiveProperty[T]:
+    return ReactiveProperty(
+        Maybe.from_optional(value), read_only, lazy=lazy, dedupe=dedupe, eq=eq, scheduler=scheduler)
 
 
-def from_observable(value: Optional[Observable] = None, read_only=True) -> ReactiveView:
+def from_array(
+        value: Any,
+        dtype: Any = None,
+        read_only=False,
+        lazy: Optional[bool] = None,
+        scheduler: Optional[Scheduler] = None) -> ReactiveArrayProperty:
+    if value is None:
+        raise ValueError("Argument 'value' is required.")
+
+    return ReactiveArrayProperty(lambda _: value, dtype, read_only, lazy, scheduler)
+
+
+def from_observable(
+        value: Optional[Observable] = None,
+        read_only=True,
+        scheduler: Optional[Scheduler] = None) -> ReactiveView:
     init_value: RequiresContext[Observable, Any] = \
         RequiresContext(lambda _: Maybe.from_optional(value).value_or(rx.empty()))
 
-    return ReactiveView(init_value, read_only)
+    return ReactiveView(init_value, read_only, scheduler=scheduler)
 
 
-def from_instance(value: Callable[[Any], Observable], read_only=True) -> ReactiveView:
-    return ReactiveView(RequiresContext(value), read_only)
+def from_instance(
+        value: Callable[[Any], Observable],
+        read_only=True,
+        scheduler: Optional[Scheduler] = None) -> ReactiveView:
+    return ReactiveView(RequiresContext(value), read_only, scheduler=scheduler)
 
 
 def combine(*values: ReactiveValue) -> Callable[[Callable[[Tuple[Observable, ...]], Observable]], ReactiveView]:
@@ -50,7 +91,7 @@ def combine(*values: ReactiveValue) -> Callable[[Callable[[Tuple[Observable, ...
         init_value = Fold.collect([v.context for v in values], RequiresContext.from_value(())) \
             .map(lambda v: modifier(*v))  # type:ignore
 
-        return ReactiveView(init_value)
+        return ReactiveView(init_value, dependencies=values)
 
     return process
 
@@ -80,12 +121,53 @@ def _combine_with(values: Sequence[ReactiveValue], combinator: Callable[[Tuple[O
         init_value = Fold.collect([v.context for v in values], RequiresContext.from_value(())) \
             .map(lambda v: combinator(*v)).map(modifier)  # type:ignore
 
-        return ReactiveView(init_value)
+        return ReactiveView(init_value, dependencies=values)
 
     return process
 
 
-def observe(obj, name: Optional[str] = None) -> Observable:
+# Unlike the combinators above, it takes a function which receives the object and the current values of the sources,
+# and calls it only when the result is read after any of them has changed.
+def computed(
+        *values: ReactiveValue,
+        scheduler: Optional[Scheduler] = None) -> Callable[[Callable[..., T]], ReactiveComputed[T]]:
+    if len(values) == 0:
+        raise ValueError("At least one argument is required.")
+
+    def process(function: Callable[..., T]) -> ReactiveComputed[T]:
+        return ReactiveComputed(function, values, scheduler)
+
+    return process
+
+
+# A reference to a reactive value of an object, which can be passed to 'observe' in place of the value itself.
+class Reference(NamedTuple):
+    obj: Any
+    name: str
+
+
+class _Referrer:
+    __slots__ = ("_obj",)
+
+    def __init__(self, obj: Any) -> None:
+        self._obj = obj
+
+    def __getattr__(self, name: str) -> Reference:
+        return Reference(self._obj, name)
+
+
+# Returns a proxy whose attributes are references to the reactive values of the object, so that they can be observed
+# with the same syntax as 'observe(obj.value)' (i.e. 'observe(ref(obj).value)'), but without reading the values or
+# relying on the bytecode of the caller to find out their names.
+def ref(obj) -> Any:
+    if obj is None:
+        raise ValueError("Cannot refer to a None object.")
+
+    return _Referrer(obj)
+
+
+@observer
+def observe(obj, name: Optional[str] = None, scheduler: Optional[Scheduler] = None) -> Observable:
     def infer_name(extractor: Callable[[FrameType], Maybe[T]], depth: int) -> Callable[[], T]:
         def process():
             value = utils.get_current_frame(depth + 1).bind(extractor).value_or(None)
@@ -98,24 +180,121 @@ def observe(obj, name: Optional[str] = None) -> Observable:
 
         return process
 
+    if isinstance(obj, Reference):
+        if name is not None:
+            raise ValueError("Argument 'name' cannot be used with a reference.")
+
+        (obj, name) = obj
+
     (target, key) = Maybe \
         .from_optional(name) \
         .map(lambda n: (obj, n)) \
         .or_else_call(infer_name(utils.get_property_reference, 3))
 
-    prop: ReactiveValue = getattr(type(target), key)
+    return _get_value(target, key).observable(target, scheduler)
 
-    if not isinstance(prop, ReactiveValue):
-        raise AttributeError(f"Unknown property name: '{key}'.")
 
-    return prop.observable(target)
+# Unlike 'observe', it requires the name of the property since it can't be inferred from the argument of an 'async for'
+# statement. The iterator keeps up to 'buffer_size' values which are not consumed yet (all of them, if it is None).
+# noinspection PyShadowingBuiltins
+def aiter(
+        obj,
+        name: str,
+        buffer_size: Optional[int] = None,
+        scheduler: Optional[Scheduler] = None) -> ObservableIterator:
+    if name is None:
+        raise ValueError("Argument 'name' is required.")
+
+    return ObservableIterator(observe(obj, name, scheduler), buffer_size)
+
+
+# Waits for the next change of the property, ignoring its current value.
+async def next_change(obj, name: str, scheduler: Optional[Scheduler] = None) -> Any:
+    if name is None:
+        raise ValueError("Argument 'name' is required.")
+
+    # Skip the current value before it reaches the scheduler, as it may arrive after the subscription otherwise.
+    changes = _get_value(obj, name).observable(obj, scheduler, skip_current=True)
+
+    iterator: ObservableIterator = ObservableIterator(changes, 1)
+
+    try:
+        return await iterator.__anext__()
+    finally:
+        iterator.close()
 
 
 def dispose(obj) -> None:
     if obj is None:
         raise ValueError("Cannot dispose a None object.")
 
-    properties = getattr(obj, DATA_KEY, {}).values()
+    with _lock_if_thread_safe(obj):
+        for p in get_data(obj):
+            p.dispose()
+
+
+def update(obj, **values: Any) -> None:
+    if obj is None:
+        raise ValueError("Cannot update a None object.")
+
+    # Hold the lock until the end of the batch, so that the changes get published in the order they are made.
+    with _lock_if_thread_safe(obj), batch():
+        for (name, value) in values.items():
+            setattr(obj, name, value)
+
+
+# Returns the current values of the properties of the object as a plain dictionary, which can be passed to 'restore'
+# later (e.g. to load a saved game) or to another process.
+def snapshot(obj) -> Dict[str, Any]:
+    if obj is None:
+        raise ValueError("Cannot take a snapshot of a None object.")
+
+    with _lock_if_thread_safe(obj):
+        return get_state(obj)
+
+
+def restore(obj, state: Mapping[str, Any]) -> None:
+    if obj is None:
+        raise ValueError("Cannot restore a None object.")
+
+    if state is None:
+        raise ValueError("Argument 'state' is required.")
+
+    with _lock_if_thread_safe(obj):
+        set_state(obj, state)
+
+
+# Mirrors the given numeric properties of the object into a block of shared memory, which other processes can read with
+# 'open_mirror' by its name. The block is freed when the mirror is disposed.
+def mirror(obj, *names: str, name: Optional[str] = None) -> SharedMirror:
+    with _lock_if_thread_safe(obj):
+        return SharedMirror(obj, names, name)
+
+
+def open_mirror(name: str) -> SharedReader:
+    return SharedReader(name)
+
+
+# Returns the lock of the object, which can be used to make a series of changes (e.g. in a batch) atomic with respect
+# to the other threads. Only thread-safe classes use it to guard their reactive values, however.
+def lock(obj) -> ContextManager:
+    if obj is None:
+        raise ValueError("Cannot lock a None object.")
+
+    return get_lock(obj)
+
+
+def _get_value(obj, name: str) -> ReactiveValue:
+    prop = getattr(type(obj), name)
+
+    if not isinstance(prop, ReactiveValue):
+        raise AttributeError(f"Unknown property name: '{name}'.")
+
+    return prop
+
+
+def _lock_if_thread_safe(obj) -> ContextManager:
+    if getattr(type(obj), THREAD_SAFE_KEY, False):
+        return get_lock(obj)
 
-    for p in properties:
-        p.dispose()
+    return nullcontext()
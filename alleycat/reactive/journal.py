@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+from array import array
+from itertools import count
+from threading import Lock
+from time import sleep, time
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .value import THREAD_SAFE_KEY, get_lock, set_state
+
+DEFAULT_CAPACITY = 65_536
+
+
+class Entry(NamedTuple):
+    # The time of the change in seconds since the epoch.
+    timestamp: float
+    # The id() of the object, which may be reused by another one once it's freed.
+    object_id: int
+    cls: type
+    property: str
+    value: Any
+
+
+# Records the values assigned to the properties of reactive objects in a ring buffer of a fixed size, which keeps only
+# the latest changes once it's full. The buffer is allocated in advance as a set of parallel arrays, so that recording a
+# change doesn't allocate anything but the timestamp.
+class Journal:
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, classes: Optional[Iterable[type]] = None) -> None:
+        if capacity < 1:
+            raise ValueError("Argument 'capacity' must be a positive integer.")
+
+        self._capacity = capacity
+        # Only the changes of instances of these classes are recorded, or those of all classes if it's None.
+        self._classes = None if classes is None else tuple(classes)
+
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._ids = array("q", bytes(8 * capacity))
+        self._types: List[Optional[type]] = [None] * capacity
+        self._names: List[Optional[str]] = [None] * capacity
+        self._values: List[Any] = [None] * capacity
+
+        # Taking a number from the sequence is atomic, so each entry gets its own slot even when the changes are
+        # recorded from different threads, without the cost of a lock.
+        self._sequence = count()
+
+        # The number of entries recorded so far, including the overwritten ones. The threads may finish writing their
+        # entries in a different order than they took their numbers, so it's only ever increased, under a lock.
+        self._count = 0
+        self._count_lock = Lock()
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    # The number of entries which have been overwritten by the newer ones.
+    @property
+    def dropped(self) -> int:
+        return max(self._count - self._capacity, 0)
+
+    def record(self, obj: Any, name: str, value: Any) -> None:
+        if self._classes is not None and not isinstance(obj, self._classes):
+            return
+
+        sequence = next(self._sequence)
+        i = sequence % self._capacity
+
+        self._timestamps[i] = time()
+        self._ids[i] = id(obj)
+        self._types[i] = type(obj)
+        self._names[i] = name
+        self._values[i] = value
+
+        with self._count_lock:
+            if sequence >= self._count:
+                self._count = sequence + 1
+
+    # Returns the entries in the order they were recorded, which match all the given criteria. It doesn't stop the
+    # other threads from recording, so the oldest entries may be overwritten while they're being read.
+    def entries(
+            self,
+            cls: Optional[type] = None,
+            object_id: Optional[int] = None,
+            name: Optional[str] = None,
+            since: Optional[float] = None) -> List[Entry]:
+        end = self._count
+        size = min(end, self._capacity)
+
+        result: List[Entry] = []
+
+        for i in (j % self._capacity for j in range(end - size, end)):
+            (timestamp, oid, kind, key) = (self._timestamps[i], self._ids[i], self._types[i], self._names[i])
+
+            # The slot may have been cleared by another thread in the meantime.
+            if kind is None or key is None:
+                continue
+
+            if (cls is None or issubclass(kind, cls)) and \
+                    (object_id is None or oid == object_id) and \
+                    (name is None or key == name) and \
+                    (since is None or timestamp >= since):
+                result.append(Entry(timestamp, oid, kind, key, self._values[i]))
+
+        return result
+
+    def clear(self) -> None:
+        self._types = [None] * self._capacity
+        self._names = [None] * self._capacity
+        self._values = [None] * self._capacity
+
+        self._sequence = count()
+
+        with self._count_lock:
+            self._count = 0
+
+
+# Applies the given entries to fresh objects, one for each object in the journal, which are created by the factory
+# unless they are given in 'objects' (keyed by the ids of the original ones). If 'speed' is given, it waits between
+# the changes to reproduce their timing (e.g. 2.0 to replay them twice as fast), instead of applying them at once.
+#
+# Returns the objects keyed by the ids of the original ones.
+def replay(
+        entries: Iterable[Entry],
+        objects: Optional[Dict[int, Any]] = None,
+        factory: Callable[[type], Any] = lambda cls: cls(),
+        speed: Optional[float] = None) -> Dict[int, Any]:
+    if entries is None:
+        raise ValueError("Argument 'entries' is required.")
+
+    if speed is not None and speed <= 0:
+        raise ValueError("Argument 'speed' must be a positive number.")
+
+    targets = dict(objects or {})
+
+    previous: Optional[Tuple[float, float]] = None
+
+    for entry in entries:
+        target = targets.get(entry.object_id)
+
+        if target is None:
+            target = factory(entry.cls)
+            targets[entry.object_id] = target
+
+        if speed is not None:
+            now = time()
+
+            if previous is not None:
+                (recorded, replayed) = previous
+                delay = (entry.timestamp - recorded) / speed - (now - replayed)
+
+                if delay > 0:
+                    sleep(delay)
+
+            previous = (entry.timestamp, time())
+
+        # The values in the journal have already been validated, so we restore them as they are instead of assigning
+        # them, which would validate them again and fail with read-only properties. Like rv.restore(), it holds the
+        # lock of a thread-safe object while doing so.
+        if getattr(type(target), THREAD_SAFE_KEY, False):
+            with get_lock(target):
+                set_state(target, {entry.property: entry.value})
+        else:
+            set_state(target, {entry.property: entry.value})
+
+    return targets
+
+
+# The active journal, or None if journaling is disabled, which is the default.
+JOURNAL: Optional[Journal] = None
+
+
+# Starts a new journal, which replaces the current one if there is.
+def enable(capacity: int = DEFAULT_CAPACITY, classes: Optional[Iterable[type]] = None) -> None:
+    global JOURNAL
+
+    JOURNAL = Journal(capacity, classes)
+
+
+def disable() -> None:
+    global JOURNAL
+
+    JOURNAL = None
+
+
+def entries(
+        cls: Optional[type] = None,
+        object_id: Optional[int] = None,
+        name: Optional[str] = None,
+        since: Optional[float] = None) -> List[Entry]:
+    return [] if JOURNAL is None else JOURNAL.entries(cls, object_id, name, since)
@@ -1,8 +1,8 @@
-from typing import TypeVar
+from typing import Optional, TypeVar
 
 from returns.functions import identity
 from rx import Observable, operators as ops
-from rx.core.typing import Disposable
+from rx.core.typing import Disposable, Scheduler
 
 from alleycat.reactive import functions as rv
 
@@ -16,14 +16,14 @@ class ReactiveObject(Disposable):
     def on_dispose(self) -> Observable:
         return rv.observe(self, "disposed").pipe(ops.filter(identity), ops.map(lambda _: None))
 
-    def observe(self, name: str) -> Observable:
+    def observe(self, name: str, scheduler: Optional[Scheduler] = None) -> Observable:
         try:
             if self.disposed:
                 raise RuntimeError("Cannot observe a disposed object.")
         except AttributeError:
             pass
 
-        return rv.observe(self, name).pipe(ops.take_until(self.on_dispose))
+        return rv.observe(self, name, scheduler).pipe(ops.take_until(self.on_dispose))
 
     def dispose(self) -> None:
         if not self.disposed:
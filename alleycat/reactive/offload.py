@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Executor, Future
+from threading import Lock
+from typing import Any, Callable, Deque, List, Optional, cast
+
+from rx import Observable
+from rx.core.typing import Disposable, Observer, Scheduler
+from rx.disposable import Disposable as AnonymousDisposable
+
+Modifier = Callable[[Observable], Observable]
+
+
+# Returns an operator which applies the given function to each value in the pool (e.g. a ProcessPoolExecutor), so that
+# an expensive computation doesn't hold the GIL of the thread which emits the values.
+#
+# By default, only the result of the latest value is emitted, and the computations of older values are cancelled if
+# they haven't started yet. If 'ordered' is True, the results of all values are emitted in the order of the values.
+#
+# The results are emitted from the thread which completes the computation, unless a scheduler is given.
+def offload(
+        function: Callable[[Any], Any],
+        pool: Executor,
+        ordered=False,
+        scheduler: Optional[Scheduler] = None) -> Modifier:
+    if function is None:
+        raise ValueError("Argument 'function' is required.")
+
+    if pool is None:
+        raise ValueError("Argument 'pool' is required.")
+
+    def process(source: Observable) -> Observable:
+        def subscribe(observer: Observer, _=None) -> Disposable:
+            offloader = Offloader(function, pool, ordered, scheduler, observer)
+
+            subscription = source.subscribe_(offloader.on_next, offloader.on_error, offloader.on_completed)
+
+            def dispose() -> None:
+                subscription.dispose()
+                offloader.dispose()
+
+            return AnonymousDisposable(dispose)
+
+        return Observable(subscribe)
+
+    # Name it after the function, so that it can be identified when timing it (see timing.instrument()).
+    process.__name__ = f"offload({getattr(function, '__name__', 'function')})"
+
+    return process
+
+
+class Offloader:
+
+    def __init__(
+            self,
+            function: Callable[[Any], Any],
+            pool: Executor,
+            ordered: bool,
+            scheduler: Optional[Scheduler],
+            observer: Observer) -> None:
+        self._function = function
+        self._pool = pool
+        self._ordered = ordered
+        self._scheduler = scheduler
+        self._observer = observer
+
+        # The computations whose results are not emitted yet, in the order of their values.
+        self._pending: Deque[Future] = deque()
+
+        self._lock = Lock()
+
+        # The actions waiting to be run on the scheduler, which runs them one at a time to keep them in order.
+        self._outbox: Deque[Callable[[], None]] = deque()
+
+        # An error of the source, which waits until the results being emitted by another thread are done.
+        self._error: Optional[Exception] = None
+
+        self._completed = False
+        self._stopped = False
+        self._draining = False
+        self._delivering = False
+
+    def on_next(self, value: Any) -> None:
+        stale: List[Future] = []
+
+        with self._lock:
+            if self._stopped:
+                return
+
+            if not self._ordered:
+                # A computation which has already started can't be cancelled, but its result is discarded anyway
+                # once it's no longer pending.
+                stale = list(self._pending)
+
+                self._pending.clear()
+
+            future = self._pool.submit(self._function, value)
+
+            self._pending.append(future)
+
+        _cancel(stale)
+
+        future.add_done_callback(lambda _: self._drain())
+
+    def on_error(self, error: Exception) -> None:
+        with self._lock:
+            if self._stopped:
+                return
+
+            self._error = error
+
+            stale = self._stop()
+
+        _cancel(stale)
+
+        # Emit it in the same way as the results, so that it can't overlap with one emitted by another thread.
+        self._drain()
+
+    def on_completed(self) -> None:
+        with self._lock:
+            self._completed = True
+
+        self._drain()
+
+    # Emits the results which are ready, as long as they are not preceded by one which isn't. It doesn't hold the lock
+    # while emitting, so that it can't deadlock with the observers, but only one thread emits at a time to keep the
+    # results in order.
+    def _drain(self) -> None:
+        with self._lock:
+            if self._draining:
+                return
+
+            self._draining = True
+
+        while True:
+            with self._lock:
+                action = self._next()
+
+                # Stop draining while holding the lock, so that a result which gets ready in the meantime isn't missed.
+                if action is None:
+                    self._draining = False
+                    return
+
+            try:
+                self._deliver(action)
+            except BaseException:
+                with self._lock:
+                    self._draining = False
+
+                raise
+
+    def _next(self) -> Optional[Callable[[], None]]:
+        if self._error is not None:
+            source_error = self._error
+
+            self._error = None
+
+            return lambda: self._observer.on_error(source_error)
+
+        while not self._stopped and self._pending and self._pending[0].done():
+            future = self._pending.popleft()
+
+            if future.cancelled():
+                continue
+
+            error = future.exception()
+
+            if error is not None:
+                stale = self._stop()
+                failure = cast(Exception, error)
+
+                def fail() -> None:
+                    _cancel(stale)
+
+                    self._observer.on_error(failure)
+
+                return fail
+
+            result = future.result()
+
+            return lambda: self._observer.on_next(result)
+
+        if self._completed and not self._stopped and not self._pending:
+            self._stopped = True
+
+            return self._observer.on_completed
+
+        return None
+
+    # With a scheduler which may run the actions concurrently (e.g. a thread pool), scheduling each of them separately
+    # could reorder them. Instead, we queue them and schedule a single action at a time which runs all of them.
+    def _deliver(self, action: Callable[[], None]) -> None:
+        if self._scheduler is None:
+            action()
+            return
+
+        with self._lock:
+            self._outbox.append(action)
+
+            if self._delivering:
+                return
+
+            self._delivering = True
+
+        self._scheduler.schedule(lambda *_: self._run_outbox())
+
+    def _run_outbox(self) -> None:
+        while True:
+            with self._lock:
+                if not self._outbox:
+                    self._delivering = False
+                    return
+
+                action = self._outbox.popleft()
+
+            try:
+                action()
+            except BaseException:
+                with self._lock:
+                    self._delivering = False
+
+                raise
+
+    # Returns the pending computations, which should be cancelled after releasing the lock, as cancelling a future
+    # invokes its callbacks in the same thread.
+    def _stop(self) -> List[Future]:
+        self._stopped = True
+
+        stale = list(self._pending)
+
+        self._pending.clear()
+
+        return stale
+
+    def dispose(self) -> None:
+        with self._lock:
+            stale = self._stop()
+
+        _cancel(stale)
+
+
+def _cancel(futures: List[Future]) -> None:
+    for future in futures:
+        future.cancel()
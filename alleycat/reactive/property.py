@@ -1,32 +1,66 @@
 from __future__ import annotations
 
-from typing import TypeVar, Generic, Callable, Optional, Any, cast, Tuple
+from functools import partial
+from weakref import ref
+from typing import TypeVar, Generic, Callable, Optional, Any, Tuple, Dict
 
 import rx
-from returns import pipeline
 from returns.functions import identity
 from returns.maybe import Maybe, Nothing
 from rx import Observable
-from rx.subject import BehaviorSubject
+from rx.core import typing
+from rx.core.typing import Scheduler
+from rx.disposable import Disposable
+from rx.subject import BehaviorSubject, Subject
 
-from . import ReactiveValue, ReactiveView
-from .value import Modifier
+from . import ReactiveValue, ReactiveView, comparators, journal, stats, timing
+from .comparators import Comparator
+from .value import BATCH, GLITCH_FREE_KEY, LAZY_KEY, Batch, Modifier, Stage, batch, fuse, weak_ref
 
 T = TypeVar("T")
 
 
+# The default validator, which accepts any value as it is.
+def _accept(_: Any, value: Any) -> Any:
+    return value
+
+
+# The default modifier, which leaves the values as they are.
+def _no_modifier(_: Any) -> Modifier:
+    return identity
+
+
+# A function which returns the operators of a pipeline for the given object (see ReactiveProperty.pipe()).
+Pipe = Callable[[Any], Tuple[Modifier, ...]]
+
+
 class ReactiveProperty(Generic[T], ReactiveValue[T]):
 
     def __init__(
             self,
             init_value: Maybe[T] = Nothing,
             read_only=False,
-            modifier: Callable[[Any], Modifier] = lambda _: identity,
-            validator: Callable[[Any, T], T] = lambda _, v: v) -> None:
+            modifier: Callable[[Any], Modifier] = _no_modifier,
+            validator: Callable[[Any, T], T] = _accept,
+            lazy: Optional[bool] = None,
+            dedupe: bool = False,
+            eq: Optional[Comparator] = None,
+            scheduler: Optional[Scheduler] = None) -> None:
 
-        super().__init__(read_only)
+        super().__init__(read_only, scheduler)
 
         self._init_value = init_value
+        self._lazy = lazy
+        # Specifying a comparator implies deduplication.
+        self._eq = (eq or comparators.equals) if dedupe or eq is not None else None
+
+        # Validators and modifiers added by validate(), pipe(), map() or filter() are kept in flat tuples rather than
+        # wrapping the previous ones, so that a deep chain of them doesn't cost a nested call for each link. The
+        # trailing map or filter stages are fused into a single operator (see _compile()).
+        self._pipes: Tuple[Pipe, ...] = () if modifier is _no_modifier else (lambda obj: (modifier(obj),),)
+        self._stages: Tuple[Stage, ...] = ()
+        self._validators: Tuple[Callable[[Any, T], T], ...] = () if validator is _accept else (validator,)
+
         self._modifier = modifier
         self._validator = validator
 
@@ -42,47 +76,157 @@ class ReactiveProperty(Generic[T], ReactiveValue[T]):
     def modifier(self) -> Callable[[Any], Modifier]:
         return self._modifier
 
+    @property
+    def lazy(self) -> Optional[bool]:
+        return self._lazy
+
+    # The comparator used to ignore assignments of the same value, or None if the property doesn't deduplicate them.
+    @property
+    def eq(self) -> Optional[Comparator]:
+        return self._eq
+
+    def is_lazy(self, cls: type) -> bool:
+        # Follow the class level setting unless it is explicitly specified for the property.
+        return getattr(cls, LAZY_KEY, False) if self.lazy is None else self.lazy
+
+    # Changes of a property in a glitch-free class are propagated in the same way as in a batch, so that the views
+    # depending on it emit once in the topological order, without any intermediate state.
+    @staticmethod
+    def is_glitch_free(cls: type) -> bool:
+        return getattr(cls, GLITCH_FREE_KEY, False)
+
     def as_view(self) -> ReactiveView[T]:
-        return ReactiveView(self.context, self.read_only)
+        return ReactiveView(self.context, self.read_only, (self,), self.scheduler)
 
-    def pipe(self, modifiers: Callable[[Any], Tuple[Modifier, ...]]) -> ReactiveProperty:
-        def stack(obj: Any):
-            # FIXME: Not sure why both PyCharm and Mypy fails to resolve pipeline.pipe(). Should investigate later.
-            # noinspection PyUnresolvedReferences
-            return pipeline.pipe(*([self.modifier(obj)] + list(modifiers(obj))))  # type:ignore
+    def pipe(self, modifiers: Pipe) -> ReactiveProperty:
+        def instrumented(obj: Any) -> Tuple[Modifier, ...]:
+            return timing.instrument(modifiers(obj))
 
-        return ReactiveProperty(self.init_value, self.read_only, stack, self.validator)
+        return self._derive(self._close_stages() + (instrumented,), (), self._validators)
 
     def validate(self, validator: Callable[[Any, T], T]) -> ReactiveProperty[T]:
         if validator is None:
             raise ValueError("Argument 'modifier' is required.")
 
-        def validate(obj: Any, v: T) -> T:
-            return validator(obj, self.validator(obj, v))
+        return self._derive(self._pipes, self._stages, self._validators + (validator,))
+
+    def _fuse(self, stage: Stage) -> ReactiveProperty:
+        return self._derive(self._pipes, self._stages + (stage,), self._validators)
+
+    # Turns the pending map or filter stages into a single operator, which comes before any modifier added after them.
+    def _close_stages(self) -> Tuple[Pipe, ...]:
+        stages = self._stages
+
+        if len(stages) == 0:
+            return self._pipes
+
+        def fused(obj: Any) -> Tuple[Modifier, ...]:
+            return timing.instrument((fuse(stages, obj),))
+
+        return self._pipes + (fused,)
+
+    def _derive(
+            self,
+            pipes: Tuple[Pipe, ...],
+            stages: Tuple[Stage, ...],
+            validators: Tuple[Callable[[Any, T], T], ...]) -> ReactiveProperty:
+        prop: ReactiveProperty = ReactiveProperty(
+            self.init_value, self.read_only, lazy=self.lazy, eq=self.eq, scheduler=self.scheduler)
+
+        prop._pipes = pipes
+        prop._stages = stages
+        prop._validators = validators
+
+        prop._compile()
+
+        return prop
+
+    # Compiles the chains of validators and modifiers into a single function each, which runs all of them in a loop.
+    def _compile(self) -> None:
+        validators = self._validators
+
+        if len(validators) == 0:
+            self._validator = _accept
+        elif len(validators) == 1:
+            self._validator = validators[0]
+        else:
+            def validate(obj: Any, value: T) -> T:
+                for validator in validators:
+                    value = validator(obj, value)
+
+                return value
+
+            self._validator = validate
 
-        return ReactiveProperty(self.init_value, self.read_only, self.modifier, validate)
+        pipes = self._close_stages()
+
+        if len(pipes) == 0:
+            self._modifier = _no_modifier
+            return
+
+        def modifier(obj: Any) -> Modifier:
+            operators = tuple(op for p in pipes for op in p(obj) if op is not identity)
+
+            if len(operators) == 0:
+                return identity
+
+            if len(operators) == 1:
+                return operators[0]
+
+            return lambda source: source.pipe(*operators)
+
+        self._modifier = modifier
+
+    def _validate(self, obj: Any, value: Any) -> T:
+        # Don't bother measuring the default validator, which does nothing.
+        if timing.TIMER is None or self.validator is _accept:
+            return self.validator(obj, value)
+
+        return timing.TIMER.time((type(obj).__qualname__, self.label(), "validator"), self.validator, obj, value)
 
     class PropertyData(ReactiveValue.Data[T]):
+        __slots__ = ("_property", "_eq", "_pending")
 
+        # The data doesn't keep the validator, which is bound to the owner of the property, as it would otherwise form
+        # a reference cycle between them. Instead, the property validates the values before passing them (see
+        # ReactiveProperty._set_value()), so the initial value should also be a validated one.
         def __init__(
                 self,
                 name: str,
                 init_value: Maybe[T],
                 modifier: Modifier,
-                validator: Callable[[T], T]):
+                lazy: bool = False,
+                eq: Optional[Comparator] = None):
 
             assert name is not None
             assert init_value is not None
             assert modifier is not None
-            assert validator is not None
 
-            self._validator = validator
-            self._property: Optional[BehaviorSubject] = None
+            self._property: Optional[Subject] = None
+            self._eq = eq
+
+            # The value of the update waiting for the end of the current batch, if any.
+            self._pending: Optional[T] = None
+
+            # A property without a modifier doesn't need a full Rx pipeline, so we 'fuse' it into a single subject
+            # which also serves as its observable (see ValueSubject). If it's lazy, we can even defer creating the
+            # subject until it gets observed.
+            if modifier is identity:
+                super().__init__(name, None, modifier)
+
+                if init_value != Nothing:
+                    self._value = init_value.unwrap()
+                    self._initialized = True
+
+                if not lazy:
+                    self._materialize()
+
+                return
 
             obs: Observable
 
             if init_value != Nothing:
-                self._property = BehaviorSubject(init_value.map(validator).unwrap())
+                self._property = BehaviorSubject(init_value.unwrap())
 
                 obs = self._property
             else:
@@ -90,32 +234,119 @@ class ReactiveProperty(Generic[T], ReactiveValue[T]):
 
             super().__init__(name, obs, modifier)
 
-        # Must override to appease Mypy... I hate Python.
         @property
-        def value(self) -> T:
-            return super().value
+        def fused(self) -> bool:
+            return self._modifier is identity
 
-        @value.setter
-        def value(self, value: T):
+        def _materialize(self) -> None:
+            if self.fused:
+                self._property = ValueSubject(self._value) if self.initialized else ValueSubject()
+                self._observable = self._property
+            elif self.initialized:
+                self._property = BehaviorSubject(self._value)
+
+                self._connect(self._property)
+            else:
+                super()._materialize()
+
+        # Reuse the getter of the parent to avoid an extra function call with every property read. Mypy doesn't
+        # understand a setter added to an inherited property, so we have to silence it here.
+        @ReactiveValue.Data.value.setter  # type:ignore
+        def value(self, validated: T):
             self._check_disposed()
 
-            if self.initialized:
+            batch = BATCH.get()
+
+            if self._eq is not None and self._is_current(validated, batch):
+                return
+
+            if self.fused:
+                self._value = validated
+                self._initialized = True
+                self._version += 1
+
+                # The subject may not exist yet if the property is lazy and has not been observed.
+                if self._property is None:
+                    return
+
+            # Defer notifying the observers until the end of the batch, if we are in one (see functions.batch()).
+            if batch is None or batch.flushing:
+                self._publish(validated)
+            else:
+                self._pending = validated
+
+                batch.updates[self] = partial(self._publish, validated)
+
+        # Adds the last value assigned to the property to the given snapshot. It's the input of the modifier rather
+        # than its output, so that restoring it doesn't apply the modifier twice.
+        def save(self, state: Dict[str, Any]) -> None:
+            assert self._name is not None
+
+            if self.fused:
+                if self.initialized:
+                    state[self._name] = self._value
+            elif isinstance(self._property, BehaviorSubject):
+                state[self._name] = self._property.value
+
+        def _is_current(self, value: T, batch: Optional[Batch]) -> bool:
+            assert self._eq is not None
+
+            if not self.initialized:
+                return False
+
+            if batch is not None and self in batch.updates:
                 assert self._property is not None
 
-                self._property.on_next(self.validator(value))
+                if self._eq(self._pending, value):
+                    return True
+
+                # If the value is back to the one the observers have last received (e.g. 'm = 3; m = 2' in a batch),
+                # cancel the pending update as if the value had never changed.
+                if not self._eq(self._property.value, value):  # type:ignore
+                    return False
+
+                del batch.updates[self]
+
+                self._pending = None
+
+                if self.fused:
+                    self._value = value
+                    self._version += 1
+
+                return True
+
+            if self.fused:
+                return self._eq(self._value, value)
+
+            # The value of a property with a modifier is the output of its pipeline, so we compare the new value with
+            # the last input instead.
+            if isinstance(self._property, BehaviorSubject):
+                return self._eq(self._property.value, value)
+
+            return False
+
+        def _publish(self, value: T) -> None:
+            self._pending = None
+
+            if self.fused or self.initialized:
+                assert self._property is not None
+
+                # Values of other properties are counted as they come out of their pipelines.
+                if self.fused and stats.COLLECTOR is not None:
+                    stats.COLLECTOR.on_emit(self)
+
+                self._property.on_next(value)
             else:
-                self._property = BehaviorSubject(self.validator(value))
+                self._property = BehaviorSubject(value)
 
                 self.observable = self._property
 
-        @property
-        def validator(self) -> Callable[[T], T]:
-            return self._validator
-
         def dispose(self) -> None:
             self._check_disposed()
 
-            if self._property:
+            # Completing the inner subject doesn't complete the pipeline (see switch_latest), so we don't do it with a
+            # fused subject either, to keep observers from receiving the completion.
+            if self._property and not self.fused:
                 self._property.on_completed()
 
             super().dispose()
@@ -124,18 +355,122 @@ class ReactiveProperty(Generic[T], ReactiveValue[T]):
         assert obj is not None
         assert self.name is not None
 
-        def validate(v: T) -> T:
-            return self.validator(obj, v)
-
-        return self.PropertyData(self.name, self.init_value, self.modifier(obj), validate)
+        init_value = self.init_value.map(lambda v: self._validate(obj, v))
 
-    def _get_data(self, obj: Any) -> PropertyData:
-        assert obj is not None
+        lazy = self.is_lazy(type(obj))
 
-        return cast(ReactiveProperty.PropertyData, super()._get_data(obj))
+        return self.PropertyData(self.name, init_value, self.modifier(obj), lazy, self.eq)
 
     def _set_value(self, obj: Any, data: ReactiveValue.Data, value: Any) -> None:
         assert obj is not None
         assert isinstance(data, ReactiveProperty.PropertyData)
 
+        validated = self._validate(obj, value)
+
+        if journal.JOURNAL is not None:
+            assert self.name is not None
+
+            journal.JOURNAL.record(obj, self.name, validated)
+
+        if self.is_glitch_free(type(obj)):
+            with batch():
+                data.value = validated
+        else:
+            data.value = validated
+
+    def _save(self, obj: Any, state: Dict[str, Any]) -> None:
+        data = self._get_data(obj)
+
+        assert isinstance(data, ReactiveProperty.PropertyData)
+
+        data.save(state)
+
+    def _restore(self, obj: Any, value: Any) -> None:
+        if journal.JOURNAL is not None:
+            assert self.name is not None
+
+            journal.JOURNAL.record(obj, self.name, value)
+
+        data = self._get_data(obj)
+
+        assert isinstance(data, ReactiveProperty.PropertyData)
+
         data.value = value
+
+
+# A subject which replays its latest value to new observers, if it has any. Unlike BehaviorSubject, it can be created
+# without an initial value, in which case new observers won't receive anything until the first value arrives.
+class ValueSubject(Subject):
+
+    def __init__(self, *value: Any) -> None:
+        super().__init__()
+
+        self.has_value = len(value) > 0
+        self.value = value[0] if self.has_value else None
+
+    def _subscribe_core(self, observer, scheduler=None):
+        with self.lock:
+            self.check_disposed()
+
+            if not self.is_stopped:
+                self.observers.append(observer)
+
+                if self.has_value:
+                    observer.on_next(self.value)
+
+                return WeakSubscription(self, observer)
+
+            ex = self.exception
+
+        if ex:
+            observer.on_error(ex)
+        else:
+            observer.on_completed()
+
+        return Disposable()
+
+    # Overridden to notify the observers in a single call, as it is on the path of every property assignment.
+    def on_next(self, value: Any) -> None:
+        with self.lock:
+            self.check_disposed()
+
+            if self.is_stopped:
+                return
+
+            self.value = value
+            self.has_value = True
+
+            observers = self.observers.copy()
+
+        for observer in observers:
+            observer.on_next(value)
+
+    def dispose(self) -> None:
+        with self.lock:
+            self.value = None
+            self.has_value = False
+
+            super().dispose()
+
+
+# Unlike InnerSubscription, it doesn't keep the subject or the observer alive. An observer usually holds its own
+# subscription, so it would otherwise form a reference cycle with the subject, which is also the observable of a fused
+# property (see ValueSubject).
+class WeakSubscription(typing.Disposable):
+
+    def __init__(self, subject: Subject, observer: typing.Observer) -> None:
+        self._subject = ref(subject)
+        self._observer: Optional[Callable[[], Any]] = weak_ref(observer)
+
+    def dispose(self) -> None:
+        subject = self._subject()
+        observer = self._observer() if self._observer else None
+
+        self._observer = None
+
+        if subject is None or observer is None:
+            return
+
+        with subject.lock:
+            if not subject.is_disposed and observer in subject.observers:
+                subject.observers.remove(observer)
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import json
+from multiprocessing.shared_memory import SharedMemory
+from numbers import Real
+from threading import Lock
+from time import sleep
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, cast
+
+import rx
+from rx import Observable, operators as ops
+from rx.core.typing import Disposable, Scheduler
+
+from .value import BATCH, ReactiveValue
+
+# The block starts with a header of three unsigned integers, which are the sequence number, the number of fields, and
+# the size of the layout in bytes. The values of the fields follow as doubles, and then the layout, which is a JSON list
+# of the field names, so that a reader only needs to know the name of the block.
+HEADER_SIZE = 3
+
+ITEM_SIZE = 8
+
+NAN = float("nan")
+
+# The names of the blocks created by this process, which are tracked by its own resource tracker.
+_OWNED: Set[str] = set()
+
+
+# Mirrors the numeric properties of an object into a block of shared memory, so that the other processes (e.g. a
+# renderer or a physics worker) can read them without copying them through a pipe.
+#
+# The block is guarded by a sequence lock. The sequence number is odd while the values are being written, so a reader
+# can tell that it read a consistent set of values if the number is even and hasn't changed after the read. All the
+# changes made in a batch are written at once at the end of it, so a reader never sees only a part of them.
+class SharedMirror:
+
+    def __init__(self, obj: Any, names: Sequence[str], name: Optional[str] = None) -> None:
+        if obj is None:
+            raise ValueError("Cannot mirror a None object.")
+
+        if not names:
+            raise ValueError("At least one property name is required.")
+
+        if len(set(names)) != len(names):
+            raise ValueError("Property names must be unique.")
+
+        props: List[ReactiveValue] = []
+
+        for key in names:
+            prop = getattr(type(obj), key, None)
+
+            if not isinstance(prop, ReactiveValue):
+                raise AttributeError(f"Unknown property name: '{key}'.")
+
+            _check_numeric(obj, key)
+
+            props.append(prop)
+
+        layout = json.dumps(list(names)).encode("utf-8")
+        count = len(names)
+
+        self._names = tuple(names)
+        self._memory = SharedMemory(name, create=True, size=ITEM_SIZE * (HEADER_SIZE + count) + len(layout))
+
+        _OWNED.add(self._memory.name)
+
+        self._header = self._memory.buf[:ITEM_SIZE * HEADER_SIZE].cast("Q")
+        self._values = self._memory.buf[ITEM_SIZE * HEADER_SIZE:ITEM_SIZE * (HEADER_SIZE + count)].cast("d")
+
+        self._header[1] = count
+        self._header[2] = len(layout)
+
+        self._memory.buf[ITEM_SIZE * (HEADER_SIZE + count):] = layout
+
+        # Uninitialized properties are left as NaN until they get a value.
+        for i in range(count):
+            self._values[i] = NAN  # type:ignore
+
+        # The changes waiting to be written, keyed by the index of the field.
+        self._pending: Dict[int, float] = dict()
+
+        # There must be only one writer at a time, even if the object is changed from different threads.
+        self._lock = Lock()
+
+        self._disposed = False
+
+        # Subscribing writes the current values of the initialized properties.
+        self._subscriptions: List[Disposable] = [
+            p.observable(obj).subscribe(self._writer(i)) for (i, p) in enumerate(props)]
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        return self._names
+
+    # The number of times the values have been written.
+    @property
+    def sequence(self) -> int:
+        return self._header[0] // 2
+
+    def _writer(self, index: int) -> Callable[[Any], None]:
+        return lambda value: self._on_next(index, value)
+
+    # It runs in the observer of the property after the value has been assigned, so it must not raise an error. A value
+    # which isn't a number (e.g. None) is written as NaN instead.
+    def _on_next(self, index: int, value: Any) -> None:
+        with self._lock:
+            self._pending[index] = float(value) if isinstance(value, Real) else NAN
+
+        batch = BATCH.get()
+
+        if batch is None:
+            self._write()
+        else:
+            # Like properties, the mirror defers writing until the end of the batch.
+            batch.updates[self] = self._write
+
+    def _write(self) -> None:
+        with self._lock:
+            if self._disposed or not self._pending:
+                return
+
+            self._header[0] += 1
+
+            for (i, value) in self._pending.items():
+                self._values[i] = value  # type:ignore
+
+            self._header[0] += 1
+
+            self._pending.clear()
+
+    # Stops mirroring the object and frees the block, which the readers can still use until they close it.
+    def dispose(self) -> None:
+        with self._lock:
+            if self._disposed:
+                return
+
+            self._disposed = True
+
+        for s in self._subscriptions:
+            s.dispose()
+
+        self._subscriptions.clear()
+
+        self._header.release()
+        self._values.release()
+
+        self._memory.close()
+        self._memory.unlink()
+
+        _OWNED.discard(self._memory.name)
+
+    def __enter__(self) -> SharedMirror:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.dispose()
+
+
+# Reads the values of a mirror from another process (or from the same one) by the name of its block.
+class SharedReader:
+
+    def __init__(self, name: str) -> None:
+        if name is None:
+            raise ValueError("Argument 'name' is required.")
+
+        self._memory = SharedMemory(name)
+
+        # The block belongs to the process which created it. Otherwise, the resource tracker of this process would free
+        # the block when it exits.
+        if self._memory.name not in _OWNED:
+            _untrack(self._memory)
+
+        self._header = self._memory.buf[:ITEM_SIZE * HEADER_SIZE].cast("Q")
+
+        count = self._header[1]
+        offset = ITEM_SIZE * (HEADER_SIZE + count)
+
+        self._names: Tuple[str, ...] = tuple(json.loads(bytes(self._memory.buf[offset:offset + self._header[2]])))
+        self._values = self._memory.buf[ITEM_SIZE * HEADER_SIZE:offset].cast("d").toreadonly()
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        return self._names
+
+    @property
+    def sequence(self) -> int:
+        return self._header[0] // 2
+
+    # The values as doubles in the order of the names, without copying them (e.g. to wrap them in a NumPy array with
+    # 'np.frombuffer'). They may change at any time, so use 'snapshot' to read a consistent set of values.
+    @property
+    def values(self) -> memoryview:
+        return self._values
+
+    def _read(self) -> Tuple[int, List[float]]:
+        while True:
+            start = self._header[0]
+
+            if start % 2 == 0:
+                values = cast(List[float], self._values.tolist())
+
+                if self._header[0] == start:
+                    return start // 2, values
+
+            # The writer is in the middle of an update.
+            sleep(0)
+
+    # Returns the values written by the last update, keyed by their names.
+    def snapshot(self) -> Dict[str, float]:
+        return dict(zip(self._names, self._read()[1]))
+
+    # Polls the block periodically, and emits a snapshot whenever the values have been written since the last one.
+    # There's no notification across the processes, so the changes made between two polls are merged into one.
+    def changes(self, period: float = 1 / 60, scheduler: Optional[Scheduler] = None) -> Observable:
+        if period <= 0:
+            raise ValueError("Argument 'period' must be a positive number.")
+
+        return rx.concat(rx.of(0), rx.interval(period, scheduler)).pipe(
+            ops.map(lambda _: self._read()),
+            ops.distinct_until_changed(lambda r: r[0]),
+            ops.map(lambda r: dict(zip(self._names, r[1]))))
+
+    # The views returned by 'values' must be released before closing the reader.
+    def close(self) -> None:
+        self._header.release()
+        self._values.release()
+
+        self._memory.close()
+
+    def __enter__(self) -> SharedReader:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+
+# Values which aren't initialized yet can't be checked, which are written as NaN if they turn out not to be numbers.
+def _check_numeric(obj: Any, name: str) -> None:
+    try:
+        value = getattr(obj, name)
+    except AttributeError:
+        return
+
+    if value is not None and not isinstance(value, Real):
+        raise TypeError(f"Property '{name}' must have a numeric value: {value!r}.")
+
+
+def _untrack(memory: SharedMemory) -> None:
+    try:
+        import multiprocessing.resource_tracker as resource_tracker
+
+        # noinspection PyProtectedMember
+        resource_tracker.unregister(getattr(memory, "_name", memory.name), "shared_memory")
+    except (ImportError, AttributeError):
+        pass
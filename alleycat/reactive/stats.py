@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Any, Dict, NamedTuple, Optional, Set, Tuple
+from weakref import WeakKeyDictionary
+
+
+class PropertyStats(NamedTuple):
+    # The number of instances of the property's data which are still alive.
+    live: int
+    # The number of them which have built their subjects or pipelines.
+    materialized: int
+    # The number of them which have connected Rx pipelines (i.e. views and properties with a modifier).
+    connected: int
+    # The number of observers subscribed to them.
+    subscribers: int
+    # The number of values emitted by the property since the collection started, including the disposed ones.
+    emissions: int
+    # The number of them which have been disposed but are still referenced from somewhere.
+    disposed: int
+
+
+class ClassStats(NamedTuple):
+    # The number of instances created since the collection started, which are still alive.
+    instances: int
+    properties: Dict[str, PropertyStats]
+
+
+# Keeps track of the reactive objects and their data while collecting statistics is enabled. It only keeps weak
+# references to them, so it doesn't affect their lifecycle.
+class Collector:
+
+    def __init__(self) -> None:
+        self._instances: Dict[type, Set[int]] = defaultdict(set)
+        self._owners: WeakKeyDictionary = WeakKeyDictionary()
+        self._emissions: Dict[Tuple[type, str], int] = defaultdict(int)
+
+    def on_init(self, obj: Any) -> None:
+        self._instances[type(obj)].add(id(obj))
+
+    def on_del(self, obj: Any) -> None:
+        self._instances[type(obj)].discard(id(obj))
+
+    def on_create(self, obj: Any, data: Any) -> None:
+        self._owners[data] = (type(obj), data.label())
+
+    def on_emit(self, data: Any) -> None:
+        key = self._owners.get(data)
+
+        if key is not None:
+            self._emissions[key] += 1
+
+    def snapshot(self) -> Dict[type, ClassStats]:
+        counts: Dict[Tuple[type, str], Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+        # Copy the items first, as the data may be freed while we iterate over them.
+        for (data, key) in list(self._owners.items()):
+            count = counts[key]
+
+            count["live"] += 1
+
+            if data.disposed:
+                count["disposed"] += 1
+                continue
+
+            if data.materialized:
+                count["materialized"] += 1
+                count["subscribers"] += data.observer_count
+
+            if data.connected:
+                count["connected"] += 1
+
+        for key in self._emissions:
+            counts[key]["emissions"] = self._emissions[key]
+
+        classes = set(self._instances.keys()).union(cls for (cls, _) in counts.keys())
+
+        def properties(cls: type) -> Dict[str, PropertyStats]:
+            return {name: PropertyStats(**{f: c[f] for f in PropertyStats._fields})
+                    for ((owner, name), c) in counts.items() if owner is cls}
+
+        return {cls: ClassStats(len(self._instances[cls]), properties(cls)) for cls in classes}
+
+
+# The active collector, or None if collecting statistics is disabled, which is the default. The hot paths only check
+# it against None, so that they don't pay for anything else unless it is enabled.
+COLLECTOR: Optional[Collector] = None
+
+
+def enable() -> None:
+    global COLLECTOR
+
+    if COLLECTOR is None:
+        COLLECTOR = Collector()
+
+
+# Discards the statistics collected so far.
+def disable() -> None:
+    global COLLECTOR
+
+    COLLECTOR = None
+
+
+# Returns the statistics of the reactive objects created while collecting them is enabled, keyed by their classes.
+def snapshot() -> Dict[type, ClassStats]:
+    return {} if COLLECTOR is None else COLLECTOR.snapshot()
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from rx import Observable
+from rx.core.typing import Disposable, Observer, Scheduler
+
+Modifier = Callable[[Observable], Observable]
+
+# The upper bounds of the histogram buckets in seconds, from 1 microsecond to 1 second.
+BUCKETS: Tuple[float, ...] = tuple(m * 10 ** e for e in range(-6, 0) for m in (1, 2.5, 5)) + (1.0,)
+
+# A class name, a property name, and the stage of the pipeline (e.g. 'validator', 'map[0]', or 'subscribers').
+Key = Tuple[str, str, str]
+
+
+class Histogram:
+    __slots__ = ("counts", "count", "sum", "max")
+
+    def __init__(self) -> None:
+        # The last one counts the samples which exceed the largest bucket.
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def record(self, elapsed: float) -> None:
+        self.counts[bisect_left(BUCKETS, elapsed)] += 1
+        self.count += 1
+        self.sum += elapsed
+
+        if elapsed > self.max:
+            self.max = elapsed
+
+    def to_dict(self) -> Dict[str, Any]:
+        cumulative = 0
+        buckets = {}
+
+        for (bound, count) in zip(BUCKETS, self.counts):
+            cumulative += count
+            buckets[bound] = cumulative
+
+        return {"count": self.count, "sum": self.sum, "max": self.max, "buckets": buckets}
+
+
+# Aggregates the time spent in each stage of the reactive values, while timing is enabled.
+class Timer:
+
+    def __init__(self) -> None:
+        self._histograms: Dict[Key, Histogram] = {}
+
+        # The property whose data is being created, to which the stages built in the meantime belong.
+        self._owner: ContextVar[Optional[Tuple[str, str, List[int]]]] = ContextVar("owner", default=None)
+
+    def histogram(self, key: Key) -> Histogram:
+        histogram = self._histograms.get(key)
+
+        if histogram is None:
+            histogram = Histogram()
+            self._histograms[key] = histogram
+
+        return histogram
+
+    @contextmanager
+    def owner(self, cls: type, name: str) -> Iterator[None]:
+        token = self._owner.set((cls.__qualname__, name, [0]))
+
+        try:
+            yield
+        finally:
+            self._owner.reset(token)
+
+    def time(self, key: Key, function: Callable[..., Any], *args: Any) -> Any:
+        start = perf_counter()
+
+        try:
+            return function(*args)
+        finally:
+            self.histogram(key).record(perf_counter() - start)
+
+    def instrument(self, modifiers: Tuple[Modifier, ...]) -> Tuple[Modifier, ...]:
+        owner = self._owner.get()
+
+        (cls, name, counter) = owner if owner is not None else ("?", "(anonymous)", [0])
+
+        def stage(modifier: Modifier) -> Modifier:
+            label = f"{getattr(modifier, '__name__', 'stage')}[{counter[0]}]"
+            counter[0] += 1
+
+            return _measure(modifier, self.histogram((cls, name, label)))
+
+        return tuple(map(stage, modifiers))
+
+    def subscribers(self, cls: type, name: str) -> Modifier:
+        histogram = self.histogram((cls.__qualname__, name, "subscribers"))
+
+        def process(source: Observable) -> Observable:
+            def subscribe(observer: Observer, scheduler=None) -> Disposable:
+                def on_next(value: Any) -> None:
+                    start = perf_counter()
+
+                    try:
+                        observer.on_next(value)
+                    finally:
+                        histogram.record(perf_counter() - start)
+
+                return source.subscribe_(on_next, observer.on_error, observer.on_completed, scheduler)
+
+            return Observable(subscribe)
+
+        return process
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        return [dict(zip(("class", "property", "stage"), key), **h.to_dict()) for (key, h) in self._histograms.items()]
+
+    def exposition(self) -> str:
+        metric = "alleycat_reactive_seconds"
+        lines = [f"# HELP {metric} Time spent in each stage of reactive values.", f"# TYPE {metric} histogram"]
+
+        for (key, histogram) in self._histograms.items():
+            labels = ",".join(f'{k}="{_escape(v)}"' for (k, v) in zip(("class", "property", "stage"), key))
+            data = histogram.to_dict()
+
+            for (bound, count) in data["buckets"].items():
+                lines.append(f'{metric}_bucket{{{labels},le="{bound:g}"}} {count}')
+
+            lines.append(f'{metric}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+            lines.append(f"{metric}_sum{{{labels}}} {histogram.sum:.9f}")
+            lines.append(f"{metric}_count{{{labels}}} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+
+# Measures the time a value spends in the given stage, excluding the time spent by the stages after it.
+def _measure(modifier: Modifier, histogram: Histogram) -> Modifier:
+    def process(source: Observable) -> Observable:
+        def subscribe(observer: Observer, scheduler=None) -> Disposable:
+            downstream = [0.0]
+
+            def enter(inner: Observer) -> Callable[[Any], None]:
+                def on_next(value: Any) -> None:
+                    start = perf_counter()
+                    before = downstream[0]
+
+                    try:
+                        inner.on_next(value)
+                    finally:
+                        histogram.record(perf_counter() - start - (downstream[0] - before))
+
+                return on_next
+
+            def on_next(value: Any) -> None:
+                start = perf_counter()
+
+                try:
+                    observer.on_next(value)
+                finally:
+                    downstream[0] += perf_counter() - start
+
+            def subscribe_entry(o: Observer, s: Optional[Scheduler] = None) -> Disposable:
+                return source.subscribe_(enter(o), o.on_error, o.on_completed, s)
+
+            entry = Observable(subscribe_entry)
+
+            return modifier(entry).subscribe_(on_next, observer.on_error, observer.on_completed, scheduler)
+
+        return Observable(subscribe)
+
+    # Keep the name of the original stage, in case it gets instrumented again (e.g. in a nested pipe).
+    process.__name__ = getattr(modifier, "__name__", "stage")
+
+    return process
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# The active timer, or None if timing is disabled, which is the default. Instrumented stages are only built while it
+# is enabled, so the existing pipelines are not affected by enabling or disabling it.
+TIMER: Optional[Timer] = None
+
+
+def enable() -> None:
+    global TIMER
+
+    if TIMER is None:
+        TIMER = Timer()
+
+
+# Discards the timings collected so far. The stages built while it was enabled keep measuring, but their timings
+# are no longer reported.
+def disable() -> None:
+    global TIMER
+
+    TIMER = None
+
+
+def instrument(modifiers: Tuple[Modifier, ...]) -> Tuple[Modifier, ...]:
+    return modifiers if TIMER is None else TIMER.instrument(modifiers)
+
+
+# Returns the timings as a list of plain dictionaries, which can be easily serialized (e.g. as JSON).
+def snapshot() -> List[Dict[str, Any]]:
+    return [] if TIMER is None else TIMER.snapshot()
+
+
+# Returns the timings in the text exposition format of Prometheus.
+def exposition() -> str:
+    return "" if TIMER is None else TIMER.exposition()
@@ -1,44 +1,58 @@
 import dis
 import inspect
+import warnings
 from dis import Instruction
+from functools import lru_cache
 from itertools import dropwhile, takewhile
-from types import FrameType
-from typing import Tuple, Any, TypeVar, Iterator, Iterable
+from types import FrameType, CodeType
+from typing import Tuple, Any, TypeVar, Iterator, Iterable, List, Mapping, Optional
 
 from returns.maybe import Maybe, Nothing, Some
 from returns.pipeline import flow
 
 T = TypeVar("T")
 
+# The maximum number of call sites whose bytecode analysis results are kept in memory.
+CACHE_SIZE = 1024
+
+_TARGET_OPS = frozenset(("LOAD_FAST", "LOAD_DEREF", "LOAD_GLOBAL", "LOAD_NAME"))
+
+# Instructions which may appear between the arguments and the call without pushing anything.
+_NEUTRAL_OPS = frozenset(("PRECALL", "KW_NAMES", "CACHE", "EXTENDED_ARG", "NOP"))
+
+# Python 3.13 pushes the NULL of a call between the function and its first argument.
+_RECEIVER_NEUTRAL_OPS = _NEUTRAL_OPS | {"PUSH_NULL"}
+
+_ATTRIBUTE_OPS = frozenset(("LOAD_METHOD", "LOAD_ATTR"))
+
 
 def get_current_frame(depth: int = 1) -> Maybe[FrameType]:
     if depth < 0:
         raise ValueError("Argument 'depth' must be zero or a positive integer.")
 
-    def move_up(frame: Maybe[FrameType]) -> Maybe[FrameType]:
-        return frame.bind(lambda f: Maybe.from_optional(f.f_back))
+    frame = inspect.currentframe()
+
+    # Walk up the stack with a plain loop, as it is on the hot path of 'observe'.
+    for _ in range(depth):
+        if frame is None:
+            break
 
-    return flow(Maybe.from_optional(inspect.currentframe()), *[move_up for _ in range(depth)])  # type:ignore
+        frame = frame.f_back
+
+    return Maybe.from_optional(frame)
 
 
 def get_property_reference(frame: FrameType) -> Maybe[Tuple[Any, str]]:
     if frame is None:
         raise ValueError("Argument 'frame' is required.")
 
-    def collect(inst: Iterable[Instruction]):
-        for i in inst:
-            if i.opname == "LOAD_FAST" or i.opname == "LOAD_DEREF":
-                yield i
-                return
-            yield i
-
     def unwrap(obj: Any, segments: Iterator[str]) -> Maybe[Any]:
         result: Maybe[Any]
 
         try:
             key = next(segments)
 
-            if type(obj) == dict:
+            if isinstance(obj, Mapping):
                 result = unwrap(obj[key], segments)
             else:
                 result = unwrap(getattr(obj, key), segments)
@@ -49,40 +63,138 @@ def get_property_reference(frame: FrameType) -> Maybe[Tuple[Any, str]]:
 
         return result
 
+    reference = _get_reference_path(frame.f_code, frame.f_lasti)
+
+    if reference is None:
+        return Nothing
+
+    (path, attr) = reference
+
+    return unwrap(frame.f_locals, iter(path)).map(lambda obj: (obj, attr))
+
+
+# The result only depends on the bytecode of the call site, so we can safely cache it with the code object and the
+# offset of the last instruction as the key.
+@lru_cache(maxsize=CACHE_SIZE)
+def _get_reference_path(code: CodeType, lasti: int) -> Optional[Tuple[Tuple[str, ...], str]]:
+    def collect(inst: Iterable[Instruction]):
+        for i in inst:
+            if i.opname == "LOAD_FAST" or i.opname == "LOAD_DEREF":
+                yield i
+                return
+            yield i
+
     try:
         *path, attr = flow(
-            dis.get_instructions(frame.f_code),
-            lambda s: takewhile(lambda i: i.offset != frame.f_lasti, s),
+            dis.get_instructions(code),
+            lambda s: takewhile(lambda i: i.offset <= lasti, s),
             lambda s: reversed(list(s)),
+            lambda s: dropwhile(lambda i: not i.opname.startswith("CALL"), s),
+            _skip_trailing_arguments,
             lambda s: list(collect(s)),
             lambda s: reversed(s),
             lambda s: map(lambda i: str(i.argval), s))
 
-        return unwrap(frame.f_locals, iter(path)).map(lambda obj: (obj, attr))
+        return tuple(path), attr
     except (StopIteration, ValueError):
         pass
 
-    return Nothing
+    return None
 
 
-def is_invoked_from_observe(frame: FrameType) -> bool:
+# Skips the instructions which push the arguments after the first one (e.g. 'scheduler=pool' in
+# 'observe(obj.value, scheduler=pool)'), given the reversed instructions starting from the call.
+def _skip_trailing_arguments(instructions: Iterator[Instruction]) -> Iterator[Instruction]:
+    call = next(instructions)
+
+    # The argument of a call instruction is the number of the arguments it takes.
+    assert call.arg is not None
+
+    # Keyword arguments have their names pushed as a tuple before the call, except in Python 3.11 and 3.12.
+    remaining = call.arg - 1 + (1 if call.opname in ("CALL_FUNCTION_KW", "CALL_KW") else 0)
+
+    for i in instructions:
+        if i.opname in _NEUTRAL_OPS:
+            continue
+
+        if remaining == 0:
+            yield i
+            break
+
+        remaining -= dis.stack_effect(i.opcode, i.arg)
+
+    yield from instructions
+
+
+# Returns the function which is going to receive the value being read at the given frame (e.g. 'rv.observe' of
+# 'rv.observe(obj.value)'), if the function is named 'observe'. As it relies on the bytecode of the caller, it should
+# only be used as a fallback when the intent can't be given explicitly.
+def get_observe_receiver(frame: FrameType) -> Maybe[Any]:
     if frame is None:
         raise ValueError("Argument 'frame' is required.")
 
+    path = _get_observe_receiver_path(frame.f_code, frame.f_lasti)
+
+    if path is None:
+        return Nothing
+
+    (name, *attrs) = path
+
+    for scope in (frame.f_locals, frame.f_globals, frame.f_builtins):
+        if name in scope:
+            receiver = scope[name]
+            break
+    else:
+        return Nothing
+
     try:
-        result = flow(
-            dis.get_instructions(frame.f_code),
-            lambda s: takewhile(lambda i: i.offset != frame.f_lasti, s),
-            lambda s: reversed(list(s)),
-            lambda s: dropwhile(lambda i: i.opname == "LOAD_FAST", s),
-            lambda s: next(s),
-            lambda s: s.opname == "LOAD_METHOD" and s.argval == "observe")
+        for attr in attrs:
+            receiver = getattr(receiver, attr)
+    except AttributeError:
+        return Nothing
 
-        return result
-    except (StopIteration, ValueError):
-        pass
+    return Some(receiver)
 
-    return False
+
+# Deprecated since the check for an uninitialized read resolves the receiver with get_observe_receiver instead, which
+# also tells if it is the actual 'observe' function, and not just another function with the same name.
+def is_invoked_from_observe(frame: FrameType) -> bool:
+    warnings.warn("Use 'get_observe_receiver' instead.", DeprecationWarning, stacklevel=2)
+
+    return get_observe_receiver(frame).map(lambda _: True).value_or(False)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _get_observe_receiver_path(code: CodeType, lasti: int) -> Optional[Tuple[str, ...]]:
+    # Skip the rest of the argument expression (e.g. 'obj.child' of 'observe(obj.child.value)') to find out which
+    # function is going to receive the value, which is loaded right before the argument.
+    instructions = flow(
+        dis.get_instructions(code),
+        lambda s: takewhile(lambda i: i.offset < lasti, s),
+        lambda s: reversed(list(s)),
+        lambda s: filter(lambda i: i.opname not in _RECEIVER_NEUTRAL_OPS, s),
+        lambda s: dropwhile(lambda i: i.opname == "LOAD_ATTR", s))
+
+    argument = next(instructions, None)
+
+    if argument is None or argument.opname not in _TARGET_OPS:
+        return None
+
+    # The segments of the path to the receiver (e.g. 'rv.observe'), in the reverse order.
+    path: List[str] = []
+
+    for i in instructions:
+        if i.opname in _ATTRIBUTE_OPS:
+            path.append(str(i.argval))
+        elif i.opname in _TARGET_OPS:
+            path.append(str(i.argval))
+            break
+        else:
+            return None
+    else:
+        return None
+
+    return tuple(reversed(path)) if path[0] == "observe" else None
 
 
 def get_instructions(frame: FrameType) -> Iterator[dis.Instruction]:
@@ -1,36 +1,123 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from functools import partial
-from typing import TypeVar, Generic, Callable, Optional, Union, Any, Mapping, Tuple
-
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from itertools import count
+from threading import Lock, RLock
+from types import MemberDescriptorType
+from weakref import ref
+from typing import TypeVar, Generic, Callable, Optional, Union, Any, Tuple, Dict, Iterator, Set, NamedTuple, Sequence, \
+    Mapping
+
+import rx
 from returns.context import RequiresContext
 from returns.functions import raise_exception, identity
 from returns.maybe import Maybe
-from returns.result import safe, Success
 from rx import Observable
 from rx import operators as ops
-from rx.core.typing import Disposable
+from rx.core.typing import Disposable, Observer, Scheduler
 from rx.subject import BehaviorSubject
 
-from alleycat.reactive import utils
+from alleycat.reactive import stats, timing, utils
+from alleycat.reactive.offload import offload
 
 T = TypeVar("T")
 U = TypeVar("U")
+F = TypeVar("F", bound=Callable[..., Any])
 
 DATA_KEY = "_rv_data"
 
 META_KEY_PREFIX = "_rv_meta_"
 
+LAZY_KEY = "_rv_lazy"
+
+LAYOUT_KEY = "_rv_layout"
+
+GLITCH_FREE_KEY = "_rv_glitch_free"
+
+THREAD_SAFE_KEY = "_rv_thread_safe"
+
+LOCK_KEY = "_rv_lock"
+
+TABLE_KEY = "_rv_table"
+
+HOOK_KEY = "_rv_hook"
+
+OBSERVER_KEY = "_rv_observer"
+
 Modifier = Callable[[Observable], Observable]
 
 
+class Batch:
+    __slots__ = ("updates", "notifications", "flushing")
+
+    def __init__(self) -> None:
+        # Deferred property updates, keyed by their data so that only the last assignment takes effect.
+        self.updates: Dict[Any, Callable[[], None]] = dict()
+        # The latest values emitted by views while flushing the updates, keyed by the rank of their pipelines.
+        self.notifications: Dict[Tuple[int, int], Tuple[Observer, Any]] = dict()
+
+        self.flushing = False
+
+    def flush(self) -> None:
+        self.flushing = True
+
+        try:
+            # Apply all the updates first, so that the views can see the final values of their sources. Emitting a
+            # notification may cause further updates or notifications, which are processed in the same loop.
+            while self.updates or self.notifications:
+                if self.updates:
+                    key = next(iter(self.updates))
+
+                    self.updates.pop(key)()
+                else:
+                    # Pipelines are ranked by their level in the dependency graph, so upstream ones have lower ranks.
+                    # By emitting from the lowest rank, a view can see all of its sources change before it emits.
+                    (observer, value) = self.notifications.pop(min(self.notifications))
+
+                    observer.on_next(value)
+        finally:
+            self.flushing = False
+
+
+BATCH: ContextVar[Optional[Batch]] = ContextVar("batch", default=None)
+
+
+@contextmanager
+def batch() -> Iterator[None]:
+    current = BATCH.get()
+
+    # Nested batches are merged into the outermost one.
+    if current is not None:
+        yield
+        return
+
+    current = Batch()
+    token = BATCH.set(current)
+
+    try:
+        yield
+    finally:
+        # The changes made before an error in the block have already been assigned (a property without a modifier even
+        # returns its new value inside the block), so they're published as well, instead of leaving the observers with
+        # values which no longer match those of the object.
+        try:
+            current.flush()
+        finally:
+            BATCH.reset(token)
+
+
 class ReactiveValue(Generic[T], ABC):
     __slots__ = ()
 
-    def __init__(self, read_only=False) -> None:
+    def __init__(self, read_only=False, scheduler: Optional[Scheduler] = None) -> None:
         self._name: Optional[str] = None
+        self._index: Optional[int] = None
+        self._key: Union[str, int, None] = None
         self._read_only = read_only
+        self._scheduler = scheduler
 
         data: RequiresContext[ReactiveValue.Data[T], Any] = RequiresContext(lambda obj: self._get_data(obj))
 
@@ -42,10 +129,19 @@ class ReactiveValue(Generic[T], ABC):
     def name(self) -> Optional[str]:
         return self._name
 
+    def label(self) -> str:
+        return "(anonymous)" if self._name is None else self._name
+
     @property
     def read_only(self) -> bool:
         return self._read_only
 
+    # The scheduler on which the observers of the value are notified, unless a different one is given when observing
+    # it. Values derived from it inside the object are not affected, so that they can stay in sync with it.
+    @property
+    def scheduler(self) -> Optional[Scheduler]:
+        return self._scheduler
+
     @property
     def context(self) -> RequiresContext[Observable, Any]:
         return self._context
@@ -54,25 +150,101 @@ class ReactiveValue(Generic[T], ABC):
     def value_context(self) -> RequiresContext[T, Any]:
         return self._value_context
 
-    def observable(self, obj: Any) -> Observable:
+    # If 'skip_current' is True, the current value is dropped before it reaches the scheduler, so that the observers
+    # only receive the changes even when they are notified on a different thread.
+    def observable(self, obj: Any, scheduler: Optional[Scheduler] = None, skip_current=False) -> Observable:
         if obj is None:
             raise ValueError("Cannot observe a None object.")
 
-        return self.context(obj)
+        # Lazy values build their pipelines when first observed, which should happen only once.
+        if getattr(type(obj), THREAD_SAFE_KEY, False):
+            with get_lock(obj):
+                observable = self.context(obj)
+        else:
+            observable = self.context(obj)
+
+        if skip_current:
+            observable = observable.pipe(_skip_current())
+
+        if scheduler is None:
+            scheduler = self.scheduler
+
+        if scheduler is not None:
+            observable = observable.pipe(ops.observe_on(scheduler))
+
+        # Measure the subscribers on the thread they are notified, after the scheduler.
+        if timing.TIMER is not None:
+            observable = observable.pipe(timing.TIMER.subscribers(type(obj), self.label()))
+
+        return observable
+
+    # The depth of the value in the dependency graph, which is used to propagate changes in topological order.
+    @property
+    def level(self) -> int:
+        return 0
+
+    # Lazy values are not initialized when an instance of the given class is constructed. Depending on the type of
+    # the value, it may also defer building its Rx pipeline until it is first observed.
+    def is_lazy(self, cls: type) -> bool:
+        return False
 
     def map(self, modifier: Callable[[Any, T], Any]) -> ReactiveValue:
-        return self.pipe(lambda o: (ops.map(lambda v: modifier(o, v)),))
+        return self._fuse(Stage(modifier, False))
+
+    def filter(self, predicate: Callable[[Any, T], bool]) -> ReactiveValue:
+        return self._fuse(Stage(predicate, True))
+
+    # Applies a pure function to the values in the given pool (e.g. a ProcessPoolExecutor), so that an expensive one
+    # doesn't block the thread which changes them. Unlike map(), the function only receives the value, since it may run
+    # in another process. See offload.offload() for the other arguments.
+    def map_in_process(
+            self,
+            function: Callable[[T], Any],
+            pool: Executor,
+            ordered=False,
+            scheduler: Optional[Scheduler] = None) -> ReactiveValue:
+        modifier = offload(function, pool, ordered, scheduler)
+
+        return self.pipe(lambda _: (modifier,))
+
+    # Subclasses may merge consecutive stages into a single operator, instead of adding one for each of them.
+    def _fuse(self, stage: Stage) -> ReactiveValue:
+        return self.pipe(lambda obj: (fuse((stage,), obj),))
 
     @abstractmethod
     def pipe(self, modifiers: Callable[[Any], Tuple[Modifier, ...]]) -> ReactiveValue:
         pass
 
     @staticmethod
-    def _check_hooks(cls: type, name: str) -> None:
+    def _get_metadata(cls: type) -> Optional[Dict[str, Any]]:
+        return vars(cls).get(META_KEY_PREFIX + cls.__qualname__)
+
+    @staticmethod
+    def _get_index(cls: type, name: str) -> Optional[int]:
+        # Values are stored in a dictionary keyed by their names unless the class declares DATA_KEY in its __slots__.
+        if not isinstance(getattr(cls, DATA_KEY, None), MemberDescriptorType):
+            if cls.__dictoffset__ == 0:
+                raise TypeError(f"Class '{cls.__name__}' must declare '{DATA_KEY}' in its __slots__.")
+
+            return None
+
+        indices: Dict[str, int] = {}
+
+        for base in reversed(cls.__mro__):
+            metadata = ReactiveValue._get_metadata(base)
+
+            if metadata is not None:
+                indices.update(metadata["indices"])
+
+        # Overriding values reuse the index of the inherited one, so the slot of the latter won't go to waste.
+        return indices[name] if name in indices else max(indices.values(), default=-1) + 1
+
+    @staticmethod
+    def _check_hooks(cls: type, name: str, index: Optional[int] = None) -> None:
         key = META_KEY_PREFIX + cls.__qualname__
 
         if not hasattr(cls, key):
-            setattr(cls, key, {"values": []})
+            setattr(cls, key, {"values": [], "indices": {}})
 
         metadata = getattr(cls, key)
         values = metadata["values"]
@@ -80,6 +252,13 @@ class ReactiveValue(Generic[T], ABC):
         if name not in values:
             values.append(name)
 
+        if index is not None:
+            metadata["indices"][name] = index
+
+        # The table of a class may have been built before all of its values were declared.
+        if TABLE_KEY in vars(cls):
+            delattr(cls, TABLE_KEY)
+
         if "init" not in metadata:
             metadata["init"] = getattr(cls, "__init__")
 
@@ -88,11 +267,23 @@ class ReactiveValue(Generic[T], ABC):
 
                 concrete_type = type(instance)
 
-                for value in metadata["values"]:
-                    getattr(concrete_type, value).context(instance)
+                # Leave it to the hook of a subclass, if there's one, which will run once its own __init__ is done.
+                if _is_hook(concrete_type.__init__, init_hook):
+                    return
+
+                _initialize(instance)
 
+            setattr(init_hook, HOOK_KEY, True)
             setattr(cls, "__init__", init_hook)
 
+        # The data of the values can't be pickled (or copied), as it holds subjects and subscriptions. So we replace
+        # it with a snapshot of the values, unless the class customizes pickling on its own.
+        if "reduce" not in metadata and _pickles_by_default(cls):
+            metadata["reduce"] = _reduce_ex
+
+            setattr(cls, "__reduce_ex__", _reduce_ex)
+            setattr(cls, "__setstate__", _set_state)
+
         if "del" not in metadata:
             try:
                 metadata["del"] = getattr(cls, "__del__")
@@ -103,30 +294,54 @@ class ReactiveValue(Generic[T], ABC):
                 metadata["del"] = noop
 
             def del_hook(instance):
-                data: Mapping[str, ReactiveValue.Data] = getattr(instance, DATA_KEY, [])
+                # The hook of a subclass, if there's one, has already disposed the values before calling this one.
+                if not _is_hook(type(instance).__del__, del_hook):
+                    for d in filter(lambda v: not v.disposed, get_data(instance)):
+                        d.dispose()
 
-                for d in filter(lambda v: not v.disposed, data.values()):
-                    d.dispose()
+                    if stats.COLLECTOR is not None:
+                        stats.COLLECTOR.on_del(instance)
 
                 metadata["del"](instance)
 
+            setattr(del_hook, HOOK_KEY, True)
             setattr(cls, "__del__", del_hook)
 
     def __set_name__(self, cls, name):
         self._name = name
+        self._index = ReactiveValue._get_index(cls, name)
+        self._key = name if self._index is None else self._index
 
-        ReactiveValue._check_hooks(cls, name)
+        ReactiveValue._check_hooks(cls, name, self._index)
 
     def __get__(self, obj: Any, obj_type: Optional[type] = None) -> Union[T, ReactiveValue[T]]:
         if obj is None:
             return self
 
-        return self.value_context(obj)
+        # Inlined version of _get_data() to save a function call on every property read.
+        try:
+            data = getattr(obj, DATA_KEY)[self._key]
+        except (AttributeError, KeyError, TypeError):
+            data = None
+
+        if data is None:
+            data = self._init_data(obj)
+
+        return data.value
 
     def __set__(self, obj: Any, value: Any) -> None:
         if obj is None:
             raise AttributeError("Cannot modify property of a None object.")
 
+        # Notifying the observers while holding the lock guarantees that they receive the changes of the object in
+        # the same order as they are made, even when they come from different threads.
+        if getattr(type(obj), THREAD_SAFE_KEY, False):
+            with get_lock(obj):
+                self._assign(obj, value)
+        else:
+            self._assign(obj, value)
+
+    def _assign(self, obj: Any, value: Any) -> None:
         data = self._get_data(obj)
 
         assert data is not None
@@ -137,37 +352,92 @@ class ReactiveValue(Generic[T], ABC):
         self._set_value(obj, data, value)
 
     class Data(Generic[U], Disposable):
+        __slots__ = ("_name", "_value", "_initialized", "_disposed", "_modifier", "_subject", "_observable",
+                     "_cancel_update", "_connection", "_level", "_version", "__weakref__")
 
         def __init__(self,
                      name: Optional[str],
-                     observable: Observable,
-                     modifier: Callable[[Observable], Observable] = identity):
-            assert observable is not None
-
-            self._name = Maybe.from_optional(name)
+                     observable: Optional[Observable],
+                     modifier: Callable[[Observable], Observable] = identity,
+                     level: int = 0):
+            self._name = name
+            self._level = level
             self._value: Optional[U] = None
 
             self._initialized = False
             self._disposed = False
+
+            # Incremented whenever the value changes, so that the values computed from it can tell if they are out of
+            # date without observing it (see ReactiveComputed).
+            self._version = 0
+
+            self._modifier = modifier
+
+            self._subject: Optional[BehaviorSubject] = None
+            self._observable: Optional[Observable] = None
+
+            self._cancel_update: Optional[Disposable] = None
+            self._connection: Optional[Disposable] = None
+
+            # Leave the pipeline unmaterialized when the observable is not given, so that subclasses can build it
+            # when it is first needed (see _materialize()).
+            if observable is not None:
+                self._connect(observable)
+
+        def _connect(self, observable: Observable) -> None:
             self._subject = BehaviorSubject(observable)
-            self._observable = modifier(self._subject.pipe(ops.switch_latest())) \
-                .pipe(ops.share(), ops.replay(buffer_size=1))
+            self._observable = self._modifier(self._subject.pipe(ops.switch_latest())) \
+                .pipe(coalesce(self._level), ops.share(), ops.replay(buffer_size=1))
+
+            # The pipeline must not keep a strong reference to the data, or it will form a reference cycle which
+            # keeps the object alive until the garbage collector finds it.
+            data = ref(self)
 
             def update(value):
-                if not self.initialized:
-                    self._initialized = True
+                target = data()
+
+                if target is None:
+                    return
 
-                self._value = value  # We don't use Some(value) here to avoid excessive object allocations.
+                target._initialized = True
+                target._value = value  # We don't use Some(value) here to avoid excessive object allocations.
+                target._version += 1
 
-            self._cancel_update = self.observable.subscribe(update, raise_exception)
+                if stats.COLLECTOR is not None:
+                    stats.COLLECTOR.on_emit(target)
+
+            self._cancel_update = self._observable.subscribe(update, raise_exception)
             self._connection = self._observable.connect()  # type:ignore
 
+        def _materialize(self) -> None:
+            self._connect(rx.empty())
+
+        @property
+        def materialized(self) -> bool:
+            return self._observable is not None
+
+        @property
+        def connected(self) -> bool:
+            return self._connection is not None
+
+        # The number of observers subscribed to the value, excluding the one which keeps track of its current value.
+        @property
+        def observer_count(self) -> int:
+            if self._observable is None or self.disposed:
+                return 0
+
+            # The observable is either a subject, or a pipeline which ends with ops.replay().
+            subject = getattr(self._observable, "subject", self._observable)
+            count = len(getattr(subject, "observers", ()))
+
+            return count - 1 if self._cancel_update is not None else count
+
         @property
         def name(self) -> Maybe[str]:
-            return self._name
+            return Maybe.from_optional(self._name)
 
         def label(self) -> str:
-            return self.name.value_or("(anonymous)")
+            return "(anonymous)" if self._name is None else self._name
 
         def _check_disposed(self) -> None:
             if self.disposed:
@@ -177,29 +447,34 @@ class ReactiveValue(Generic[T], ABC):
         def initialized(self) -> bool:
             return self._initialized
 
+        @property
+        def version(self) -> int:
+            return self._version
+
         @property
         def value(self) -> U:
-            if not self.initialized:
-                # FIXME: This is a bad design but also something unavoidable if we want to call 'observe' on
-                #  an uninitialized value.
-                def observed_from_frame(depth: int) -> bool:
-                    return utils.get_current_frame(depth).map(utils.is_invoked_from_observe).value_or(False)
+            if self._initialized:
+                return self._value  # type:ignore
 
-                observed = observed_from_frame(7) or observed_from_frame(8)
+            # The argument of 'observe(obj.value)' gets evaluated before 'observe' is invoked, so it can't tell us
+            # its intent in advance. Instead, we check the caller of ReactiveValue.__get__() (at the depth of 3) as a
+            # fallback, which 'observe(rv.ref(obj).value)' or 'observe(obj, "value")' don't need.
+            observed = utils.get_current_frame(3).bind(utils.get_observe_receiver).map(is_observer).value_or(False)
 
-                if observed:
-                    return None  # type:ignore
-                else:
-                    raise AttributeError(f"Property '{self.label()}' is not initialized yet.")
+            if observed:
+                return None  # type:ignore
 
-            assert self._value is not None  # Again, to appease the wrath of the Mypyan god.
-
-            return self._value
+            raise AttributeError(f"Property '{self.label()}' is not initialized yet.")
 
         @property
         def observable(self) -> Observable:
             self._check_disposed()
 
+            if self._observable is None:
+                self._materialize()
+
+            assert self._observable is not None
+
             return self._observable
 
         @observable.setter
@@ -207,7 +482,11 @@ class ReactiveValue(Generic[T], ABC):
             assert value is not None
 
             self._check_disposed()
-            self._subject.on_next(value)
+
+            if self._subject is None:
+                self._connect(value)
+            else:
+                self._subject.on_next(value)
 
         @property
         def disposed(self) -> bool:
@@ -215,8 +494,12 @@ class ReactiveValue(Generic[T], ABC):
 
         def dispose(self) -> None:
             self._check_disposed()
-            self._cancel_update.dispose()
-            self._connection.dispose()
+
+            if self._cancel_update is not None:
+                self._cancel_update.dispose()
+
+            if self._connection is not None:
+                self._connection.dispose()
 
             self._disposed = True
 
@@ -225,32 +508,359 @@ class ReactiveValue(Generic[T], ABC):
         pass
 
     def _get_data(self, obj: Any) -> Data[T]:
+        # The fast path for already initialized values, which is what we get with most of the property access.
+        # It should remain free of any object allocation, so please be careful when you modify it.
+        try:
+            data = getattr(obj, DATA_KEY)[self._key]
+        except (AttributeError, KeyError, TypeError):
+            data = None
+
+        return self._init_data(obj) if data is None else data
+
+    def _init_data(self, obj: Any) -> Data[T]:
         assert obj is not None
 
         if self.name is None:
             return self._create_data(obj)
 
-        def initialize(container: Any, key: str, default: Callable[[], Any], _: Exception):
-            value = default()
+        # Otherwise, two threads accessing a new value at the same time could end up with different instances of it.
+        if getattr(type(obj), THREAD_SAFE_KEY, False):
+            with get_lock(obj):
+                return self._init_data_unsafe(obj)
 
-            if type(container) == dict:
-                container[key] = value
+        return self._init_data_unsafe(obj)
+
+    def _init_data_unsafe(self, obj: Any) -> Data[T]:
+        container = getattr(obj, DATA_KEY, None)
+
+        if container is None:
+            container = {} if self._index is None else [None] * ReactiveValue._get_record_size(type(obj))
+
+            setattr(obj, DATA_KEY, container)
+
+        data = container[self._key] if self._index is not None else container.get(self._key)
+
+        if data is None:
+            if timing.TIMER is None:
+                data = self._create_data(obj)
             else:
-                setattr(container, key, value)
+                # Attribute the stages of the pipeline built in the meantime to this value.
+                with timing.TIMER.owner(type(obj), self.name):
+                    data = self._create_data(obj)
+
+            container[self._key] = data
+
+            if stats.COLLECTOR is not None:
+                stats.COLLECTOR.on_create(obj, data)
+
+        return data
+
+    @staticmethod
+    def _get_record_size(cls: type) -> int:
+        size = vars(cls).get(LAYOUT_KEY)
+
+        if size is None:
+            indices: Dict[int, str] = {}
+
+            for name in get_value_names(cls):
+                index = getattr(cls, name)._index
 
-            return Success(value)
+                if index is None:
+                    raise TypeError(f"Reactive value '{name}' was declared in a class without '{DATA_KEY}' slot.")
 
-        init_container = partial(initialize, obj, DATA_KEY, lambda: {})
-        new_instance = partial(self._create_data, obj)
+                if index in indices:
+                    raise TypeError(
+                        f"Reactive values '{indices[index]}' and '{name}' have a conflicting layout in "
+                        f"'{cls.__name__}'.")
 
-        def init_data(v: Any):
-            return partial(initialize, v, self.name, new_instance)
+                indices[index] = name
 
-        return safe(getattr)(obj, DATA_KEY) \
-            .lash(init_container) \
-            .bind(lambda v: safe(lambda: v[self.name])().lash(init_data(v))) \
-            .unwrap()
+            size = max(indices.keys(), default=-1) + 1
+
+            setattr(cls, LAYOUT_KEY, size)
+
+        return size
 
     @abstractmethod
     def _set_value(self, obj: Any, data: Data[T], value: Any) -> None:
         pass
+
+    # Adds the value of the given object to its snapshot (see get_state()), unless it is derived from other values.
+    def _save(self, obj: Any, state: Dict[str, Any]) -> None:
+        pass
+
+    # Applies a value taken from a snapshot, which doesn't need to be validated again.
+    def _restore(self, obj: Any, value: Any) -> None:
+        raise AttributeError(f"Cannot restore a derived value '{self.label()}'.")
+
+
+# Marks a function which takes the value of a reactive property to observe it (e.g. 'observe(obj.value)'), so that
+# reading an uninitialized value to pass it to the function returns None instead of raising an error.
+def observer(function: F) -> F:
+    setattr(function, OBSERVER_KEY, True)
+
+    return function
+
+
+def is_observer(function: Any) -> bool:
+    return getattr(function, OBSERVER_KEY, False) is True
+
+
+def get_value_names(cls: type) -> Iterator[str]:
+    names: Set[str] = set()
+
+    # Iterate from the base classes, so that the values are listed in the order in which they are declared.
+    for base in reversed(cls.__mro__):
+        metadata = ReactiveValue._get_metadata(base)
+
+        for name in [] if metadata is None else metadata["values"]:
+            if name not in names:
+                names.add(name)
+
+                yield name
+
+
+# The reactive values of a class, including the inherited ones, in the order in which they are declared.
+class Table(NamedTuple):
+    values: Tuple[ReactiveValue, ...]
+    # Those which are initialized along with the object (see ReactiveValue.is_lazy()).
+    eager: Tuple[ReactiveValue, ...]
+
+
+# Returns the table of the reactive values of the given class, which is built once for each class, so that the
+# construction of an object only needs to walk a flat tuple instead of resolving them by their names.
+def get_table(cls: type) -> Table:
+    table = vars(cls).get(TABLE_KEY)
+
+    if table is None:
+        values = tuple(getattr(cls, name) for name in get_value_names(cls))
+        table = Table(values, tuple(v for v in values if not v.is_lazy(cls)))
+
+        setattr(cls, TABLE_KEY, table)
+
+    return table
+
+
+# Returns the current values of the properties of the given object, keyed by their names. Views and other values
+# derived from them are left out, as they can be rebuilt from the properties.
+def get_state(obj: Any) -> Dict[str, Any]:
+    state: Dict[str, Any] = {}
+
+    for value in get_table(type(obj)).values:
+        value._save(obj, state)
+
+    return state
+
+
+# Applies the values taken from a snapshot (see get_state()) to the given object in a single batch.
+def set_state(obj: Any, state: Mapping[str, Any]) -> None:
+    cls = type(obj)
+
+    with batch():
+        for (name, value) in state.items():
+            descriptor = getattr(cls, name, None)
+
+            if not isinstance(descriptor, ReactiveValue):
+                raise AttributeError(f"Unknown property name: '{name}'.")
+
+            descriptor._restore(obj, value)
+
+
+# Initializes the values of an object which are not lazy, once it is constructed.
+def _initialize(obj: Any) -> None:
+    # Build the pipelines as well, unless they are deferred until the values are first observed.
+    for descriptor in get_table(type(obj)).eager:
+        descriptor.context(obj)
+
+    if stats.COLLECTOR is not None:
+        stats.COLLECTOR.on_init(obj)
+
+
+# Tells if the class leaves pickling to the default behaviour, or to the hooks below which it may have inherited.
+def _pickles_by_default(cls: type) -> bool:
+    def inherited(name: str, hook: Optional[Callable] = None) -> bool:
+        method = getattr(cls, name, None)
+
+        return method is getattr(object, name, None) or method is hook
+
+    return inherited("__reduce_ex__", _reduce_ex) and inherited("__reduce__") and inherited("__getstate__") and \
+        inherited("__setstate__", _set_state)
+
+
+def _reduce_ex(obj: Any, protocol: int) -> Union[str, Tuple[Any, ...]]:
+    # The hooks are inherited by the subclasses, which may customize pickling on their own.
+    if not _pickles_by_default(type(obj)):
+        return object.__reduce_ex__(obj, protocol)
+
+    # Protocols older than 2 can't pickle the attributes in __slots__ by default.
+    reduced = object.__reduce_ex__(obj, max(protocol, 2))
+
+    # Only global objects are reduced to a string, which isn't the case with instances.
+    assert isinstance(reduced, tuple)
+
+    (constructor, args, state, *rest) = reduced
+
+    # The state is either a dictionary of attributes, a pair of those in __dict__ and __slots__, or None.
+    (attrs, slots) = state if isinstance(state, tuple) else (state, None)
+
+    def strip(values: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        return None if values is None else {k: v for (k, v) in values.items() if k != DATA_KEY and k != LOCK_KEY}
+
+    return (constructor, args, (strip(attrs), strip(slots), get_state(obj)), *rest)
+
+
+def _set_state(obj: Any, state: Any) -> None:
+    # A subclass which only overrides __getstate__ gets the default behaviour, restoring the attributes as they are.
+    if not _pickles_by_default(type(obj)):
+        (attrs, slots) = state if isinstance(state, tuple) else (state, None)
+        values = None
+    else:
+        (attrs, slots, values) = state
+
+    if attrs:
+        vars(obj).update(attrs)
+
+    for (key, value) in (slots or {}).items():
+        setattr(obj, key, value)
+
+    # The object is created without calling its constructor, so we need to initialize its values here. Restore the
+    # properties first, so that the views see their values when they are built.
+    if values is not None:
+        set_state(obj, values)
+
+    _initialize(obj)
+
+
+# Tells if the given method is an init or del hook other than the given one, i.e. that of a subclass.
+def _is_hook(method: Any, hook: Callable) -> bool:
+    return method is not hook and getattr(method, HOOK_KEY, False)
+
+
+def get_data(obj: Any) -> Iterator[ReactiveValue.Data]:
+    container = getattr(obj, DATA_KEY, None)
+
+    if container is None:
+        return iter(())
+
+    return filter(None, container.values() if type(container) == dict else container)
+
+
+# Guards the creation of the lock of each object, which only happens once for each of them.
+_lock = Lock()
+
+
+# Returns the lock which guards the reactive values of the given object, creating it if necessary. It is reentrant, so
+# that observers can modify the object in response to its changes.
+def get_lock(obj: Any) -> RLock:
+    lock = getattr(obj, LOCK_KEY, None)
+
+    if lock is not None:
+        return lock
+
+    with _lock:
+        lock = getattr(obj, LOCK_KEY, None)
+
+        if lock is None:
+            lock = RLock()
+
+            try:
+                setattr(obj, LOCK_KEY, lock)
+            except AttributeError:
+                raise TypeError(f"Class '{type(obj).__name__}' must declare '{LOCK_KEY}' in its __slots__.")
+
+    return lock
+
+
+# Returns a weak reference to the given object, or a function which returns the object itself if it doesn't support
+# weak references (e.g. an instance of a class with __slots__ which doesn't declare '__weakref__').
+def weak_ref(obj: Any) -> Callable[[], Any]:
+    try:
+        return ref(obj)
+    except TypeError:
+        return lambda: obj
+
+
+# A map or filter stage of a pipeline, which can be fused with the adjacent ones (see fuse()).
+class Stage(NamedTuple):
+    function: Callable[[Any, Any], Any]
+    is_filter: bool
+
+
+# Compiles a chain of stages into a single operator, so that a value passes through all of them in one call.
+def fuse(stages: Sequence[Stage], obj: Any) -> Modifier:
+    # The pipeline belongs to the object, so it shouldn't keep a strong reference back to it.
+    owner = weak_ref(obj)
+
+    def process(source: Observable) -> Observable:
+        def subscribe(observer: Observer, scheduler=None) -> Disposable:
+            def on_next(value: Any) -> None:
+                target = owner()
+
+                try:
+                    for (function, is_filter) in stages:
+                        if not is_filter:
+                            value = function(target, value)
+                        elif not function(target, value):
+                            return
+                except Exception as e:
+                    observer.on_error(e)
+                    return
+
+                observer.on_next(value)
+
+            return source.subscribe_(on_next, observer.on_error, observer.on_completed, scheduler)
+
+        return Observable(subscribe)
+
+    # Name it after the stages, so that it can be identified when timing them (see timing.instrument()).
+    process.__name__ = "+".join("filter" if s.is_filter else "map" for s in stages)
+
+    return process
+
+
+_sequence = count()
+
+
+# Holds back the values emitted while flushing a batch, so that each pipeline only emits its final value once.
+def coalesce(level: int) -> Modifier:
+    def process(source: Observable) -> Observable:
+        def subscribe(observer: Observer, scheduler=None) -> Disposable:
+            # Pipelines of the same level are ordered by the time of subscription, which puts upstream ones first
+            # in most cases.
+            rank = (level, next(_sequence))
+
+            def on_next(value: Any) -> None:
+                batch = BATCH.get()
+
+                if batch is None or not batch.flushing:
+                    observer.on_next(value)
+                else:
+                    batch.notifications[rank] = (observer, value)
+
+            return source.subscribe_(on_next, observer.on_error, observer.on_completed, scheduler)
+
+        return Observable(subscribe)
+
+    return process
+
+
+# Drops the values emitted while subscribing (i.e. the current value of a reactive value), so that the observers only
+# receive the changes made after they have subscribed.
+def _skip_current() -> Modifier:
+    def process(source: Observable) -> Observable:
+        def subscribe(observer: Observer, scheduler=None) -> Disposable:
+            subscribing = [True]
+
+            def on_next(value: Any) -> None:
+                if not subscribing[0]:
+                    observer.on_next(value)
+
+            subscription = source.subscribe_(on_next, observer.on_error, observer.on_completed, scheduler)
+
+            subscribing[0] = False
+
+            return subscription
+
+        return Observable(subscribe)
+
+    return process
@@ -1,33 +1,95 @@
 from __future__ import annotations
 
-from typing import TypeVar, Generic, Any, Callable, Tuple
+from typing import TypeVar, Generic, Any, Callable, Tuple, Sequence, Optional
 
 from returns.context import RequiresContext
 from rx import Observable
+from rx.core.typing import Scheduler
 
-from . import ReactiveValue
-from .value import Modifier
+from . import ReactiveValue, timing
+from .value import Modifier, Stage, fuse
 
 T = TypeVar("T")
 
 
 class ReactiveView(Generic[T], ReactiveValue[T]):
 
-    def __init__(self, init_value: RequiresContext[Observable, Any], read_only=True) -> None:
-        super().__init__(read_only)
+    def __init__(
+            self,
+            init_value: RequiresContext[Observable, Any],
+            read_only=True,
+            dependencies: Sequence[ReactiveValue] = (),
+            scheduler: Optional[Scheduler] = None) -> None:
+        super().__init__(read_only, scheduler)
 
         self._init_value = init_value
+        self._dependencies = tuple(dependencies)
+        self._level = max((d.level + 1 for d in self._dependencies), default=0)
+
+        # The view and the stage it was derived from with map() or filter(), if it was.
+        self._derived_from: Optional[Tuple[ReactiveValue, Stage]] = None
+        # The source of the view and all the stages between them, which are resolved when it's first used.
+        self._fused: Optional[Tuple[Callable[[Any], Observable], Tuple[Stage, ...]]] = None
+
+    @property
+    def dependencies(self) -> Tuple[ReactiveValue, ...]:
+        return self._dependencies
+
+    @property
+    def level(self) -> int:
+        return self._level
 
     def pipe(self, modifiers: Callable[[Any], Tuple[Modifier, ...]]) -> ReactiveView:
-        return ReactiveView(RequiresContext(lambda i: self.context(i).pipe(*(modifiers(i)))), self.read_only)
+        def create(obj: Any) -> Observable:
+            return self._source(obj).pipe(*timing.instrument(modifiers(obj)))
+
+        return ReactiveView(RequiresContext(create), self.read_only, (self,), self.scheduler)
+
+    def _fuse(self, stage: Stage) -> ReactiveView:
+        def create(obj: Any) -> Observable:
+            if view._fused is None:
+                view._fused = view._resolve()
+
+            (source, stages) = view._fused
+
+            return source(obj).pipe(*timing.instrument((fuse(stages, obj),)))
+
+        view: ReactiveView = ReactiveView(RequiresContext(create), self.read_only, (self,), self.scheduler)
+        view._derived_from = (self, stage)
+
+        return view
+
+    # Finds the first view up the chain of map() and filter() calls which can't be fused, because it has its own data
+    # (i.e. it has a name) or it was not derived with them. We can only do it after the class is defined, since the
+    # views don't know their names before then.
+    def _resolve(self) -> Tuple[Callable[[Any], Observable], Tuple[Stage, ...]]:
+        assert self._derived_from is not None
+
+        (value, stage) = self._derived_from
+        stages = [stage]
+
+        while isinstance(value, ReactiveView) and value.name is None and value._derived_from is not None:
+            (value, stage) = value._derived_from
+            stages.append(stage)
+
+        source: Callable[[Any], Observable]
+
+        if isinstance(value, ReactiveView):
+            source = value._source
+        else:
+            source = value.context
+
+        return source, tuple(reversed(stages))
+
+    # An anonymous view doesn't keep its data, so it would build a whole pipeline just to feed another one. Instead,
+    # we use its source directly.
+    def _source(self, obj: Any) -> Observable:
+        return self._init_value(obj) if self.name is None else self.context(obj)
 
     def _create_data(self, obj: Any) -> ReactiveValue.Data:
         assert obj is not None
 
-        return self.Data(self.name, self._init_value(obj))
-
-    def _get_data(self, obj: Any) -> ReactiveValue.Data:
-        return super()._get_data(obj)
+        return self.Data(self.name, self._init_value(obj), level=self.level)
 
     def _set_value(self, obj: Any, data: ReactiveValue.Data, value: Any) -> None:
         assert obj is not None
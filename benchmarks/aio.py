@@ -0,0 +1,78 @@
+# Measures the memory used by a large number of coroutines watching a property with 'rv.aiter', while it changes
+# faster than they consume the values, with different sizes of buffer.
+#
+# Run it from the project root with 'python -m benchmarks.aio'.
+import asyncio
+import time
+import tracemalloc
+from typing import Optional, Tuple
+
+from alleycat.reactive import RP, functions as rv
+
+WATCHERS = 2_000
+
+WRITES = 200
+
+
+class Fixture:
+    value: RP[int] = rv.from_value(0)
+
+
+async def measure(buffer_size: Optional[int]) -> Tuple[float, float]:
+    fixture = Fixture()
+
+    started = asyncio.Event()
+    received = []
+
+    async def watch() -> None:
+        async with rv.aiter(fixture, "value", buffer_size) as values:
+            async for v in values:
+                if v == 0:
+                    continue
+
+                await started.wait()
+
+                if v == WRITES:
+                    received.append(v)
+                    break
+
+    tracemalloc.start()
+
+    tasks = [asyncio.create_task(watch()) for _ in range(WATCHERS)]
+
+    # Let all the watchers subscribe before changing the value.
+    await asyncio.sleep(0)
+
+    start = time.perf_counter()
+
+    for i in range(1, WRITES + 1):
+        fixture.value = i
+
+    (_, peak) = tracemalloc.get_traced_memory()
+
+    started.set()
+
+    await asyncio.gather(*tasks)
+
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.stop()
+
+    assert len(received) == WATCHERS
+
+    return peak / WATCHERS, WATCHERS * WRITES / elapsed
+
+
+def main() -> None:
+    print(f"{WATCHERS} coroutines watching a property which changes {WRITES} times before they wake up:")
+
+    for buffer_size in (None, 16, 1):
+        (memory, throughput) = asyncio.run(measure(buffer_size))
+
+        name = "unbounded" if buffer_size is None else f"{buffer_size}"
+
+        print(f"{name:>12}: {memory:10.1f} bytes/watcher, {throughput:12.1f} notifications/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# Measures the pause times of the garbage collector while creating and dropping a large number of short-lived
+# reactive objects, which should be freed by reference counting as soon as they go out of scope, without leaving any
+# work for the collector.
+#
+# Run it from the project root with 'python -m benchmarks.churn'.
+import gc
+import time
+from typing import Any, Dict, List
+
+from alleycat.reactive import RP, RV, functions as rv
+
+INSTANCES = 100_000
+
+
+class Simple:
+    value: RP[int] = rv.from_value(0)
+
+    name: RP[str] = rv.from_value("")
+
+
+class Observed:
+    value: RP[int] = rv.from_value(0)
+
+
+class Derived:
+    value: RP[int] = rv.from_value(0)
+
+    doubled: RV[int] = value.as_view().map(lambda _, v: v * 2)
+
+
+def churn(cls: type, observe: bool) -> None:
+    for i in range(INSTANCES):
+        obj = cls()
+        obj.value = i
+
+        if observe:
+            rv.observe(obj, "value").subscribe(lambda _: None)
+
+
+def measure(cls: type, observe: bool) -> Dict[str, Any]:
+    pauses: List[float] = []
+    started: List[float] = []
+
+    def callback(phase: str, info: Dict[str, int]) -> None:
+        if phase == "start":
+            started.append(time.perf_counter())
+        else:
+            pauses.append(time.perf_counter() - started.pop())
+
+    gc.collect()
+    gc.callbacks.append(callback)
+
+    start = time.perf_counter()
+
+    try:
+        churn(cls, observe)
+    finally:
+        gc.callbacks.remove(callback)
+
+    elapsed = time.perf_counter() - start
+
+    # Whatever is left for the collector after the last automatic collection.
+    leftover = gc.collect()
+
+    return {
+        "instances/sec": INSTANCES / elapsed,
+        "collections": len(pauses),
+        "max pause (ms)": max(pauses, default=0) * 1e3,
+        "total pause (ms)": sum(pauses) * 1e3,
+        "leftover": leftover
+    }
+
+
+def main() -> None:
+    print(f"Creating and dropping {INSTANCES} instances:")
+
+    cases = {
+        "simple": (Simple, False),
+        "observed": (Observed, True),
+        "derived": (Derived, False),
+    }
+
+    for (name, (cls, observe)) in cases.items():
+        result = measure(cls, observe)
+
+        print(f"{name:>10}: " + ", ".join(f"{k}: {v:.1f}" for (k, v) in result.items()))
+
+
+if __name__ == "__main__":
+    main()
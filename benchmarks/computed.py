@@ -0,0 +1,72 @@
+# Compares a derived value built as a view with 'combine_latest' against one built with 'rv.computed', when it is
+# rarely read (e.g. many writes to its sources per frame) and when it is read after every write.
+#
+# Run it from the project root with 'python -m benchmarks.computed'.
+import timeit
+from typing import Any, Callable, Dict
+
+from rx import operators as ops
+
+from alleycat.reactive import RC, RP, RV, functions as rv
+
+WRITES = 5_000
+
+REPEAT = 7
+
+
+class Combined:
+    x: RP[float] = rv.from_value(0.0)
+
+    y: RP[float] = rv.from_value(0.0)
+
+    total: RV[float] = rv.combine_latest(x, y)(ops.map(lambda v: v[0] + v[1]))
+
+
+class Computed:
+    x: RP[float] = rv.from_value(0.0)
+
+    y: RP[float] = rv.from_value(0.0)
+
+    total: RC[float] = rv.computed(x, y)(lambda _, x, y: x + y)
+
+
+def scenarios(fixture: Any) -> Dict[str, Callable[[], Any]]:
+    def write_only() -> None:
+        for i in range(WRITES):
+            fixture.x = i
+            fixture.y = i
+
+        assert fixture.total == (WRITES - 1) * 2
+
+    def write_read() -> None:
+        for i in range(WRITES):
+            fixture.x = i
+            fixture.y = i
+
+            assert fixture.total == i * 2
+
+    def read_only() -> None:
+        for _ in range(WRITES):
+            assert fixture.total is not None
+
+    return {"write 2, read once": write_only, "write 2, read each": write_read, "read only": read_only}
+
+
+def main() -> None:
+    print(f"Per iteration over {WRITES} iterations (best of {REPEAT}):")
+
+    for cls in (Combined, Computed):
+        print(f"{cls.__name__}:")
+
+        construct = min(timeit.repeat(cls, number=1_000, repeat=REPEAT)) / 1_000
+
+        print(f"{'construct':>20}: {construct * 1e6:8.2f} us")
+
+        for (name, scenario) in scenarios(cls()).items():
+            elapsed = min(timeit.repeat(scenario, number=1, repeat=REPEAT)) / WRITES
+
+            print(f"{name:>20}: {elapsed * 1e6:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
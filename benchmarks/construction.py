@@ -0,0 +1,53 @@
+# Measures the time and memory it takes to construct objects with many reactive properties, with and without
+# lazy initialization.
+#
+# Run it from the project root with 'python -m benchmarks.construction'.
+import timeit
+import tracemalloc
+from typing import Any, Dict
+
+from alleycat.reactive import functions as rv
+
+PROPERTIES = 20
+
+INSTANCES = 1_000
+
+
+def create_class(name: str, lazy: bool) -> type:
+    namespace: Dict[str, Any] = {f"value{i}": rv.from_value(i) for i in range(PROPERTIES)}
+    namespace["_rv_lazy"] = lazy
+
+    return type(name, (), namespace)
+
+
+def measure(cls: type) -> Dict[str, float]:
+    elapsed = min(timeit.repeat(cls, number=INSTANCES, repeat=3)) / INSTANCES
+
+    tracemalloc.start()
+
+    instances = [cls() for _ in range(INSTANCES)]
+
+    (current, _) = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+
+    # Touch every instance so that none of them gets collected before taking the measurement.
+    assert len(instances) == INSTANCES
+
+    return {"time": elapsed, "memory": current / INSTANCES}
+
+
+def main() -> None:
+    eager = create_class("Eager", False)
+    lazy = create_class("Lazy", True)
+
+    print(f"Constructing objects with {PROPERTIES} properties:")
+
+    for (name, cls) in (("eager", eager), ("lazy", lazy)):
+        result = measure(cls)
+
+        print(f"{name:>8}: {result['time'] * 1e6:8.1f} us/instance, {result['memory'] / 1024:8.1f} KiB/instance")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# Measures the time it takes to construct and dispose objects of classes which inherit their reactive values through
+# a deep hierarchy, where each level declares a few values of its own and may or may not override '__init__'. The lazy
+# variant doesn't create any data on construction, so it shows the overhead of the hooks which initialize the values.
+#
+# Run it from the project root with 'python -m benchmarks.hierarchy'.
+import timeit
+from typing import Any, Dict
+
+from alleycat.reactive import functions as rv
+
+DEPTHS = (1, 4, 8)
+
+PROPERTIES = 5
+
+INSTANCES = 1_000
+
+REPEAT = 5
+
+
+def create_hierarchy(depth: int, with_init: bool, lazy: bool) -> type:
+    cls: type = object
+
+    for level in range(depth):
+        namespace: Dict[str, Any] = {f"value{level}_{i}": rv.from_value(i) for i in range(PROPERTIES)}
+        namespace["_rv_lazy"] = lazy
+
+        if with_init:
+            def init(self, parent=cls) -> None:
+                parent.__init__(self)
+
+            namespace["__init__"] = init
+
+        cls = type(f"Level{level}", (cls,), namespace)
+
+    return cls
+
+
+def main() -> None:
+    print(f"Constructing and disposing objects with {PROPERTIES} properties per level (best of {REPEAT}):")
+
+    for (with_init, lazy) in ((False, False), (True, False), (True, True)):
+        for depth in DEPTHS:
+            cls = create_hierarchy(depth, with_init, lazy)
+
+            construct = min(timeit.repeat(cls, number=INSTANCES, repeat=REPEAT)) / INSTANCES
+
+            def dispose() -> None:
+                for instance in instances:
+                    rv.dispose(instance)
+
+            elapsed = []
+
+            for _ in range(REPEAT):
+                instances = [cls() for _ in range(INSTANCES)]
+                elapsed.append(timeit.timeit(dispose, number=1) / INSTANCES)
+
+            label = f"depth {depth}{', __init__' if with_init else ''}{', lazy' if lazy else ''}"
+
+            print(f"{label:>24}: construct {construct * 1e6:8.1f} us, dispose {min(elapsed) * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
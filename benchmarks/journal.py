@@ -0,0 +1,80 @@
+# Measures the cost of recording every change of a property, with the journal compared with subscribing to the
+# property and appending a tuple to a list for each change, and the memory allocated for each of them.
+#
+# Run it from the project root with 'python -m benchmarks.journal'.
+import time
+import timeit
+import tracemalloc
+from collections import deque
+from typing import Any, Callable
+
+from alleycat.reactive import RP, functions as rv
+
+WRITES = 20_000
+
+REPEAT = 7
+
+CAPACITY = 10_000
+
+
+class Entity:
+    value: RP[int] = rv.from_value(0)
+
+
+def measure(fixture: Any) -> float:
+    def write() -> None:
+        for i in range(WRITES):
+            fixture.value = i
+
+    return min(timeit.repeat(write, number=1, repeat=REPEAT)) / WRITES
+
+
+def allocated(action: Callable[[], None]) -> float:
+    tracemalloc.start()
+
+    before = tracemalloc.take_snapshot()
+
+    action()
+
+    after = tracemalloc.take_snapshot()
+
+    tracemalloc.stop()
+
+    return sum(s.size_diff for s in after.compare_to(before, "filename")) / WRITES
+
+
+def main() -> None:
+    print(f"Assigning a property {WRITES} times (best of {REPEAT}):")
+
+    plain = Entity()
+
+    elapsed = measure(plain)
+
+    print(f"{'not recorded':>20}: {elapsed * 1e9:8.1f} ns")
+
+    # Keep the same number of entries as the journal does, to make it a fair comparison.
+    log: deque = deque(maxlen=CAPACITY)
+
+    subscribed = Entity()
+
+    rv.observe(subscribed, "value").subscribe(lambda v: log.append((time.time(), id(subscribed), "value", v)))
+
+    elapsed = measure(subscribed)
+    memory = allocated(lambda: measure(subscribed))
+
+    print(f"{'subscribed':>20}: {elapsed * 1e9:8.1f} ns, {memory:6.1f} bytes retained/write")
+
+    rv.enable_journal(CAPACITY)
+
+    journaled = Entity()
+
+    elapsed = measure(journaled)
+    memory = allocated(lambda: measure(journaled))
+
+    rv.disable_journal()
+
+    print(f"{'journal':>20}: {elapsed * 1e9:8.1f} ns, {memory:6.1f} bytes retained/write")
+
+
+if __name__ == "__main__":
+    main()
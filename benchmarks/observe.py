@@ -0,0 +1,54 @@
+# Measures the cost of calling 'observe' without an explicit name, which requires inferring the property reference
+# from the bytecode of the call site. A cold call site is one which has not been analysed yet, while a warm one
+# resolves its reference from the cache.
+#
+# Run it from the project root with 'python -m benchmarks.observe'.
+import timeit
+
+from alleycat.reactive import RP, functions as rv, utils
+
+NUMBER = 2_000
+
+REPEAT = 5
+
+
+class Fixture:
+    value: RP[int] = rv.from_value(1)
+
+
+def observe_named(obj: Fixture) -> None:
+    rv.observe(obj, "value")
+
+
+def observe_inferred(obj: Fixture) -> None:
+    rv.observe(obj.value)
+
+
+def measure(function, obj: Fixture, cold: bool) -> float:
+    def run():
+        for _ in range(NUMBER):
+            if cold:
+                utils._get_reference_path.cache_clear()
+
+            function(obj)
+
+    return min(timeit.repeat(run, number=1, repeat=REPEAT)) / NUMBER
+
+
+def main() -> None:
+    obj = Fixture()
+
+    baseline = measure(observe_named, obj, False)
+
+    results = {
+        "explicit name": baseline,
+        "inferred (cold)": measure(observe_inferred, obj, True),
+        "inferred (warm)": measure(observe_inferred, obj, False),
+    }
+
+    for (name, elapsed) in results.items():
+        print(f"{name:>16}: {elapsed * 1e6:8.2f} us/call ({elapsed / baseline:5.2f}x of an explicit name)")
+
+
+if __name__ == "__main__":
+    main()
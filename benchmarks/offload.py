@@ -0,0 +1,84 @@
+# Simulates a game loop which changes the input of an expensive view every frame, and measures how long the loop takes
+# when the view computes its value inline, compared with computing it in a process pool with 'map_in_process'.
+#
+# Run it from the project root with 'python -m benchmarks.offload'.
+import time
+from concurrent.futures import ProcessPoolExecutor
+from threading import Event
+from typing import Any, List
+
+from alleycat.reactive import RP, RV, functions as rv
+
+FRAMES = 100
+
+# The time budget of a frame, which is spent on the game logic besides updating the input.
+FRAME_TIME = 0.005
+
+
+# e.g. a pathfinding cost, which is a pure function of its input.
+def path_cost(target: int) -> int:
+    return sum(i * i % 7 for i in range(target, target + 200_000))
+
+
+def run(fixture: Any, results: List[int], done: Event, expected: int) -> float:
+    start = time.perf_counter()
+
+    for frame in range(FRAMES):
+        fixture.target = frame
+
+        # Busy wait instead of sleeping, as a game loop keeps the CPU busy.
+        deadline = time.perf_counter() + FRAME_TIME
+
+        while time.perf_counter() < deadline:
+            pass
+
+    elapsed = time.perf_counter() - start
+
+    # The last result must be delivered eventually.
+    done.wait(60)
+
+    assert results[-1] == expected
+
+    return elapsed
+
+
+def main() -> None:
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        class Inline:
+            target: RP[int] = rv.from_value(0)
+
+            cost: RV[int] = target.as_view().map(lambda _, v: path_cost(v))
+
+        class Offloaded:
+            target: RP[int] = rv.from_value(0)
+
+            cost: RV[int] = target.as_view().map_in_process(path_cost, pool)
+
+        # Warm up the pool, so that the measurement doesn't include starting the processes.
+        list(pool.map(path_cost, range(2)))
+
+        expected = path_cost(FRAMES - 1)
+
+        print(f"Running {FRAMES} frames of {FRAME_TIME * 1e3:.0f} ms with an expensive view:")
+
+        for cls in (Inline, Offloaded):
+            fixture = cls()
+
+            results: List[int] = []
+            done = Event()
+
+            def append(value: int) -> None:
+                results.append(value)
+
+                if value == expected:
+                    done.set()
+
+            rv.observe(fixture, "cost").subscribe(append)
+
+            elapsed = run(fixture, results, done, expected)
+
+            print(f"{cls.__name__:>10}: {elapsed / FRAMES * 1e3:6.2f} ms/frame, {len(results)} results delivered")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# Compares updating a field of many entities, each having its own reactive property, against updating a single
+# reactive array property which holds the field for all of them.
+#
+# Run it from the project root with 'python -m benchmarks.population'. It requires NumPy to be installed.
+import timeit
+import tracemalloc
+from typing import List
+
+import numpy as np
+
+from alleycat.reactive import RP, ReactiveArrayProperty, functions as rv
+
+ENTITIES = 50_000
+
+REPEAT = 3
+
+
+class Entity:
+    x: RP[float] = rv.from_value(0.0)
+
+
+class Population:
+    x: ReactiveArrayProperty = rv.from_array(np.zeros(ENTITIES))
+
+
+def step_entities(entities: List[Entity], dx: np.ndarray) -> None:
+    for (entity, d) in zip(entities, dx):
+        entity.x += d
+
+
+def step_population(population: Population, dx: np.ndarray) -> None:
+    Population.x.update(population, slice(None), population.x + dx)
+
+
+def main() -> None:
+    dx = np.random.default_rng(0).random(ENTITIES)
+
+    tracemalloc.start()
+
+    entities = [Entity() for _ in range(ENTITIES)]
+
+    (entities_memory, _) = tracemalloc.get_traced_memory()
+
+    population = Population()
+
+    (total_memory, _) = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+
+    # Both of them should have an observer, as it's the reason why we use reactive values in the first place.
+    for entity in entities:
+        rv.observe(entity, "x").subscribe(lambda _: None)
+
+    rv.observe(population, "x").subscribe(lambda _: None)
+
+    results = {
+        "properties": (min(timeit.repeat(lambda: step_entities(entities, dx), number=1, repeat=REPEAT)),
+                       entities_memory),
+        "array": (min(timeit.repeat(lambda: step_population(population, dx), number=1, repeat=REPEAT)),
+                  total_memory - entities_memory)
+    }
+
+    print(f"Updating a field of {ENTITIES} entities:")
+
+    for (name, (elapsed, memory)) in results.items():
+        print(f"{name:>12}: {elapsed * 1e3:10.3f} ms/step, {memory / 1024:10.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
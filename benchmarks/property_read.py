@@ -0,0 +1,51 @@
+# Compares the cost of reading a reactive property against a plain attribute and a built-in property.
+#
+# Run it from the project root with 'python -m benchmarks.property_read'.
+import timeit
+
+from alleycat.reactive import RP, RV, functions as rv
+
+NUMBER = 200_000
+
+REPEAT = 5
+
+
+class Plain:
+
+    def __init__(self):
+        self._value = 1
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+
+class Reactive:
+    value: RP[int] = rv.from_value(1)
+
+    view: RV[int] = value.as_view()
+
+
+def measure(statement: str, **scope) -> float:
+    return min(timeit.repeat(statement, globals=scope, number=NUMBER, repeat=REPEAT)) / NUMBER
+
+
+def main() -> None:
+    plain = Plain()
+    reactive = Reactive()
+
+    baseline = measure("obj.value", obj=plain)
+
+    results = {
+        "attribute": measure("obj._value", obj=plain),
+        "property": baseline,
+        "reactive property": measure("obj.value", obj=reactive),
+        "reactive view": measure("obj.view", obj=reactive),
+    }
+
+    for (name, elapsed) in results.items():
+        print(f"{name:>20}: {elapsed * 1e9:8.1f} ns/read ({elapsed / baseline:5.2f}x of a property)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# Measures the throughput of assigning properties from several threads, when their observers are slow (e.g. doing
+# some I/O), with and without delivering the notifications through a scheduler.
+#
+# Run it from the project root with 'python -m benchmarks.scheduler'.
+import threading
+import time
+from typing import Optional, Tuple
+
+from rx.core.typing import Scheduler
+from rx.scheduler import EventLoopScheduler, ThreadPoolScheduler
+
+from alleycat.reactive import RP, functions as rv
+
+THREADS = 4
+
+WRITES = 500
+
+# The time each observer takes to process a notification.
+DELAY = 0.0002
+
+
+class Fixture:
+    value: RP[int] = rv.from_value(0)
+
+
+def measure(scheduler: Optional[Scheduler]) -> Tuple[float, float]:
+    done = threading.Semaphore(0)
+
+    def observe(v: int) -> None:
+        time.sleep(DELAY)
+
+        if v == WRITES:
+            done.release()
+
+    fixtures = [Fixture() for _ in range(THREADS)]
+
+    for fixture in fixtures:
+        rv.observe(fixture, "value", scheduler).subscribe(observe)
+
+    def write(fixture: Fixture) -> None:
+        for i in range(1, WRITES + 1):
+            fixture.value = i
+
+    threads = [threading.Thread(target=write, args=(f,)) for f in fixtures]
+
+    start = time.perf_counter()
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    written = time.perf_counter() - start
+
+    for _ in range(THREADS):
+        done.acquire()
+
+    delivered = time.perf_counter() - start
+
+    return THREADS * WRITES / written, THREADS * WRITES / delivered
+
+
+def main() -> None:
+    schedulers = {
+        "none": None,
+        "thread pool": ThreadPoolScheduler(THREADS),
+        "event loop": EventLoopScheduler(),
+    }
+
+    print(f"Assigning a property from {THREADS} threads, with observers taking {DELAY * 1e3:.1f} ms each:")
+
+    for (name, scheduler) in schedulers.items():
+        (written, delivered) = measure(scheduler)
+
+        print(f"{name:>12}: {written:10.1f} writes/sec, {delivered:10.1f} deliveries/sec")
+
+
+if __name__ == "__main__":
+    main()
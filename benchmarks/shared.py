@@ -0,0 +1,93 @@
+# Measures the cost of mirroring the properties of an object into shared memory on the writer's side, and how long
+# another process takes to get a consistent copy of them, compared with sending a snapshot through a pipe.
+#
+# Run it from the project root with 'python -m benchmarks.shared'.
+import timeit
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import Connection
+from typing import Any
+
+from alleycat.reactive import RP, functions as rv
+
+FIELDS = 16
+
+WRITES = 20_000
+
+READS = 5_000
+
+REPEAT = 5
+
+
+class Entity:
+    locals().update({f"f{i}": rv.from_value(0.0) for i in range(FIELDS)})
+
+    value: RP[float] = rv.from_value(0.0)
+
+
+def measure_writes(fixture: Any) -> float:
+    def write() -> None:
+        for i in range(WRITES):
+            fixture.value = i
+
+    return min(timeit.repeat(write, number=1, repeat=REPEAT)) / WRITES
+
+
+# Runs in another process and reads the mirror repeatedly, reporting the best time per read.
+def read_mirror(name: str, conn: Connection) -> None:
+    with rv.open_mirror(name) as reader:
+        conn.send(min(timeit.repeat(reader.snapshot, number=READS, repeat=REPEAT)) / READS)
+
+
+# Runs in another process and requests a snapshot through the pipe repeatedly, reporting the best time per request.
+def read_pipe(conn: Connection) -> None:
+    def request() -> None:
+        conn.send(None)
+        conn.recv()
+
+    result = min(timeit.repeat(request, number=READS, repeat=REPEAT)) / READS
+
+    conn.send(False)
+    conn.send(result)
+
+
+def main() -> None:
+    names = [f"f{i}" for i in range(FIELDS)] + ["value"]
+
+    print(f"Assigning a property {WRITES} times (best of {REPEAT}):")
+
+    plain = Entity()
+
+    print(f"{'not mirrored':>20}: {measure_writes(plain) * 1e9:8.1f} ns")
+
+    mirrored = Entity()
+
+    with rv.mirror(mirrored, *names) as mirror:
+        print(f"{'mirrored':>20}: {measure_writes(mirrored) * 1e9:8.1f} ns")
+
+        print(f"Reading {len(names)} fields from another process {READS} times (best of {REPEAT}):")
+
+        (parent, child) = Pipe()
+
+        process = Process(target=read_mirror, args=(mirror.name, child))
+        process.start()
+
+        print(f"{'shared memory':>20}: {parent.recv() * 1e9:8.1f} ns")
+
+        process.join()
+
+    (parent, child) = Pipe()
+
+    process = Process(target=read_pipe, args=(child,))
+    process.start()
+
+    # Serve the requests of the other process until it reports the result.
+    while parent.recv() is None:
+        parent.send(rv.snapshot(plain))
+
+    print(f"{'pipe':>20}: {parent.recv() * 1e9:8.1f} ns")
+
+    process.join()
+
+
+if __name__ == "__main__":
+    main()
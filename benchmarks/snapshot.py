@@ -0,0 +1,78 @@
+# Measures the time it takes to take snapshots of a large number of reactive objects and restore them, compared with
+# reading and assigning each property by hand, and the time it takes to pickle and unpickle them.
+#
+# Run it from the project root with 'python -m benchmarks.snapshot'.
+import pickle
+import time
+from typing import Any, Callable, Dict, List
+
+from alleycat.reactive import RP, RV, functions as rv
+
+INSTANCES = 100_000
+
+PICKLED = 10_000
+
+NAMES = ("x", "y", "health", "name", "level")
+
+
+class Entity:
+    x: RP[float] = rv.from_value(0.0)
+
+    y: RP[float] = rv.from_value(0.0)
+
+    health: RP[int] = rv.from_value(100).validate(lambda _, v: max(min(v, 100), 0))
+
+    name: RP[str] = rv.from_value("")
+
+    level: RP[int] = rv.from_value(1)
+
+    position: RV[str] = rv.combine_latest(x, y)(lambda o: o).map(lambda _, v: f"{v[0]:.1f}, {v[1]:.1f}")
+
+
+def measure(label: str, count: int, action: Callable[[], Any]) -> Any:
+    start = time.perf_counter()
+
+    result = action()
+
+    elapsed = time.perf_counter() - start
+
+    print(f"{label:>20}: {elapsed * 1e3:8.1f} ms ({elapsed / count * 1e6:6.2f} us/object)")
+
+    return result
+
+
+def main() -> None:
+    entities = [Entity() for _ in range(INSTANCES)]
+
+    for (i, entity) in enumerate(entities):
+        entity.x = float(i)
+        entity.name = f"entity-{i}"
+
+    print(f"Saving and restoring {INSTANCES} objects with {len(NAMES)} properties and a view:")
+
+    def read_by_hand() -> List[Dict[str, Any]]:
+        return [{n: getattr(e, n) for n in NAMES} for e in entities]
+
+    def write_by_hand(states: List[Dict[str, Any]]) -> None:
+        for (entity, state) in zip(entities, states):
+            for (name, value) in state.items():
+                setattr(entity, name, value)
+
+    def restore(states: List[Dict[str, Any]]) -> None:
+        for (entity, state) in zip(entities, states):
+            rv.restore(entity, state)
+
+    states = measure("read by hand", INSTANCES, read_by_hand)
+    measure("write by hand", INSTANCES, lambda: write_by_hand(states))
+
+    snapshots = measure("snapshot", INSTANCES, lambda: [rv.snapshot(e) for e in entities])
+    measure("restore", INSTANCES, lambda: restore(snapshots))
+
+    print(f"Pickling {PICKLED} of them:")
+
+    data = measure("dumps", PICKLED, lambda: pickle.dumps(entities[:PICKLED]))
+    measure("loads", PICKLED, lambda: pickle.loads(data))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# Compares the memory footprint of objects storing their reactive values in a dictionary against those declaring
+# '_rv_data' in their __slots__.
+#
+# Run it from the project root with 'python -m benchmarks.storage'.
+import gc
+import tracemalloc
+from typing import Any, Dict
+
+from alleycat.reactive import functions as rv
+from alleycat.reactive.value import DATA_KEY
+
+PROPERTIES = 10
+
+INSTANCES = 1_000
+
+
+def create_class(name: str, slots: bool, lazy: bool) -> type:
+    namespace: Dict[str, Any] = {f"value{i}": rv.from_value(float(i)) for i in range(PROPERTIES)}
+    namespace["_rv_lazy"] = lazy
+
+    if slots:
+        namespace["__slots__"] = (DATA_KEY,)
+
+    return type(name, (), namespace)
+
+
+def measure(cls: type) -> float:
+    # Reactive objects with eager pipelines produce a lot of garbage cycles which would make the measurement too slow.
+    gc.disable()
+    tracemalloc.start()
+
+    instances = [cls() for _ in range(INSTANCES)]
+
+    # Make sure every property has been initialized.
+    for obj in instances:
+        for i in range(PROPERTIES):
+            getattr(obj, f"value{i}")
+
+    (current, _) = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+    gc.enable()
+
+    return current / INSTANCES
+
+
+def main() -> None:
+    print(f"Memory usage of objects with {PROPERTIES} properties:")
+
+    for lazy in (False, True):
+        for slots in (False, True):
+            name = f"{'lazy' if lazy else 'eager'}, {'slots' if slots else 'dict'}"
+            usage = measure(create_class(name.replace(", ", "_"), slots, lazy))
+
+            print(f"{name:>12}: {usage:10.1f} bytes/instance")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+# Runs a set of benchmark scenarios covering the hot paths of the reactive core, and reports the throughput,
+# allocations and peak memory of each of them.
+#
+# Run it from the project root with 'python -m benchmarks.suite'. To compare two checkouts on the same machine,
+# save the results of one with '--output base.json' and run the other with '--compare base.json'. To measure the
+# overhead of collecting statistics or timings, compare the results with those of a run with '--stats' or '--timing'.
+import argparse
+import gc
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+import rx
+from rx import operators as ops
+
+from alleycat.reactive import RP, RV, functions as rv
+
+PROPERTIES = 10
+
+# The number of views derived from a single property, which are combined again in the 'fan-in' scenario.
+FAN_IN = 8
+
+# The number of operations to sample for measuring memory, and for scenarios which need a new state for each call.
+SAMPLES = 200
+
+
+class Scenario(NamedTuple):
+    name: str
+    # Creates a state (e.g. an object to read) which is passed to 'run'.
+    setup: Callable[[], Any]
+    run: Callable[[Any], Any]
+    # The number of times to call 'run' with the same state. Scenarios which can run only once on a state, like
+    # 'dispose', should set it to 1 so that a new state will be created for each call.
+    number: int
+
+
+def create_class(lazy: bool) -> type:
+    namespace: Dict[str, Any] = {f"value{i}": rv.from_value(i) for i in range(PROPERTIES)}
+    namespace["_rv_lazy"] = lazy
+
+    return type("Lazy" if lazy else "Eager", (), namespace)
+
+
+Eager = create_class(False)
+
+Lazy = create_class(True)
+
+
+class Plain:
+    value: RP[int] = rv.from_value(1)
+
+
+def create_unchanged(dedupe: bool) -> type:
+    class Unchanged:
+        # Starts with the value which 'assign' sets.
+        value: RP[int] = rv.from_value(3, dedupe=dedupe)
+
+        # Gives the property an observer to wake up with each assignment.
+        view: RV[int] = value.as_view().map(lambda _, v: v + 1)
+
+    return Unchanged
+
+
+class Fixture:
+    value: RP[int] = rv.from_value(1)
+
+    other: RP[int] = rv.from_value(2)
+
+    view: RV[int] = value.as_view()
+
+    mapped: RV[int] = value.as_view().map(lambda _, v: v + 1).map(lambda _, v: v * 2).map(lambda _, v: v - 1)
+
+    piped: RV[int] = value.as_view().pipe(lambda _: (ops.map(lambda v: v + 1), ops.filter(lambda v: v > 0)))
+
+    latest: RV[int] = rv.combine_latest(value, other)(ops.map(sum))
+
+    zipped: RV[int] = rv.zip(value, other)(ops.map(sum))
+
+    merged: RV[int] = rv.merge(value, other)
+
+
+class Chain:
+    value: RP[int] = rv.from_value(1)
+
+    # Five consecutive stages on a view and a property, which are fused into a single operator.
+    view: RV[int] = value.as_view().map(lambda _, v: v + 1).map(lambda _, v: v * 2).map(lambda _, v: v - 1) \
+        .map(lambda _, v: v * 3).map(lambda _, v: v + 2)
+
+    prop: RP[int] = rv.from_value(1).map(lambda _, v: v + 1).map(lambda _, v: v * 2).map(lambda _, v: v - 1) \
+        .map(lambda _, v: v * 3).map(lambda _, v: v + 2)
+
+
+def set_chain(obj: Chain) -> None:
+    obj.value += 1
+    obj.prop += 1
+
+
+class Position:
+    x: RP[float] = rv.from_value(0.0)
+
+    y: RP[float] = rv.from_value(0.0)
+
+    z: RP[float] = rv.from_value(0.0)
+
+    # A derived view doing some work downstream, which emits once for each change of its sources unless batched.
+    length: RV[float] = rv.combine_latest(x, y, z)(ops.map(lambda v: (v[0] ** 2 + v[1] ** 2 + v[2] ** 2) ** 0.5))
+
+
+def create_diamond(glitch_free: bool) -> type:
+    class Diamond:
+        _rv_glitch_free = glitch_free
+
+        value: RP[int] = rv.from_value(0)
+
+        left: RV[int] = value.as_view().map(lambda _, v: v + 1)
+
+        right: RV[int] = value.as_view().map(lambda _, v: v * 2)
+
+        combined: RV[int] = rv.combine_latest(left, right)(ops.map(sum))
+
+    return Diamond
+
+
+def create_fan_in(glitch_free: bool) -> type:
+    value = rv.from_value(0)
+    branches = [value.as_view().map(lambda _, v, i=i: v + i) for i in range(FAN_IN)]
+
+    namespace: Dict[str, Any] = {f"branch{i}": b for (i, b) in enumerate(branches)}
+
+    namespace["_rv_glitch_free"] = glitch_free
+    namespace["value"] = value
+    namespace["combined"] = rv.combine_latest(*branches)(ops.map(sum))
+
+    return type("FanIn", (), namespace)
+
+
+def increment(obj: Any) -> None:
+    obj.value += 1
+
+
+def move(obj: Position) -> None:
+    obj.x = 1.0
+    obj.y = 2.0
+    obj.z = 3.0
+
+
+def move_batched(obj: Position) -> None:
+    rv.update(obj, x=1.0, y=2.0, z=3.0)
+
+
+def observe_inferred(obj: Fixture) -> rx.Observable:
+    return rv.observe(obj.value)
+
+
+def observe_named(obj: Fixture) -> rx.Observable:
+    return rv.observe(obj, "value")
+
+
+def assign(obj: Any) -> None:
+    obj.value = 3
+
+
+def read(obj: Fixture) -> int:
+    return obj.value
+
+
+def read_view(obj: Fixture) -> int:
+    return obj.view
+
+
+def observe_all(obj: Fixture) -> Fixture:
+    # Make sure all the pipelines are materialized before disposing the object.
+    for name in ("value", "other", "view", "mapped", "piped", "latest", "zipped", "merged"):
+        rv.observe(obj, name).subscribe(lambda _: None)
+
+    return obj
+
+
+SCENARIOS: List[Scenario] = [
+    Scenario("construct (eager)", lambda: None, lambda _: Eager(), 200),
+    Scenario("construct (lazy)", lambda: None, lambda _: Lazy(), 5_000),
+    Scenario("get", Fixture, read, 200_000),
+    Scenario("get (view)", Fixture, read_view, 200_000),
+    Scenario("set", Plain, assign, 20_000),
+    Scenario("set (unchanged)", create_unchanged(False), assign, 20_000),
+    Scenario("set (unchanged, dedupe)", create_unchanged(True), assign, 20_000),
+    Scenario("set (with views)", Fixture, assign, 5_000),
+    Scenario("set x, y, z", Position, move, 5_000),
+    Scenario("update x, y, z", Position, move_batched, 5_000),
+    Scenario("diamond", create_diamond(False), increment, 5_000),
+    Scenario("diamond (glitch-free)", create_diamond(True), increment, 5_000),
+    Scenario("fan-in", create_fan_in(False), increment, 1_000),
+    Scenario("fan-in (glitch-free)", create_fan_in(True), increment, 1_000),
+    Scenario("observe (inferred)", Fixture, observe_inferred, 2_000),
+    Scenario("observe (named)", Fixture, observe_named, 2_000),
+    Scenario("combine_latest", Fixture, lambda obj: rv.observe(obj, "latest").subscribe(lambda _: None), 2_000),
+    Scenario("zip", Fixture, lambda obj: rv.observe(obj, "zipped").subscribe(lambda _: None), 2_000),
+    Scenario("merge", Fixture, lambda obj: rv.observe(obj, "merged").subscribe(lambda _: None), 2_000),
+    Scenario("map chain", Fixture, lambda obj: obj.mapped, 200_000),
+    Scenario("construct (map chain)", lambda: None, lambda _: Chain(), 500),
+    Scenario("set (map chain)", Chain, set_chain, 5_000),
+    Scenario("pipe chain", Fixture, lambda obj: rv.observe(obj, "piped").subscribe(lambda _: None), 2_000),
+    Scenario("dispose", lambda: observe_all(Fixture()), rv.dispose, 1),
+]
+
+
+def measure(scenario: Scenario, repeat: int) -> Dict[str, float]:
+    def run_all(state: Any) -> None:
+        for _ in range(scenario.number):
+            scenario.run(state)
+
+    timings = []
+
+    for _ in range(repeat):
+        if scenario.number > 1:
+            state = scenario.setup()
+            elapsed = timeit.timeit(lambda: run_all(state), number=1) / scenario.number
+        else:
+            states = [scenario.setup() for _ in range(SAMPLES)]
+            elapsed = timeit.timeit(lambda: [scenario.run(s) for s in states], number=1) / SAMPLES
+
+        timings.append(elapsed)
+
+    count = min(scenario.number, SAMPLES) if scenario.number > 1 else SAMPLES
+
+    def create_states() -> List[Any]:
+        return [scenario.setup() for _ in range(1 if scenario.number > 1 else SAMPLES)]
+
+    def sample(states: List[Any]) -> List[Any]:
+        # Keep the results, so that we can count the objects the scenario leaves behind (e.g. a constructed object).
+        return [scenario.run(states[i if scenario.number == 1 else 0]) for i in range(count)]
+
+    # Rx pipelines produce a lot of reference cycles, which would skew the numbers if the GC kicks in.
+    gc.disable()
+
+    # Measure the peak memory separately, as taking a snapshot would affect the value.
+    tracemalloc.start()
+
+    states = create_states()
+
+    (start, _) = tracemalloc.get_traced_memory()
+
+    sample(states)
+
+    (_, peak) = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+    tracemalloc.start()
+
+    states = create_states()
+    before = tracemalloc.take_snapshot()
+
+    results = sample(states)
+
+    after = tracemalloc.take_snapshot()
+
+    tracemalloc.stop()
+    gc.enable()
+
+    # Python only lets us trace memory blocks which are still alive, so it doesn't count temporary allocations, whose
+    # effect can be seen in the peak memory usage instead.
+    stats = [s for s in after.compare_to(before, "filename") if s.count_diff > 0]
+
+    blocks = sum(s.count_diff for s in stats)
+    memory = sum(s.size_diff for s in stats)
+
+    assert len(results) == count
+
+    return {
+        "ops": 1 / min(timings),
+        "blocks": blocks / count,
+        "memory": memory / count,
+        "peak": peak - start
+    }
+
+
+def report(results: Dict[str, Dict[str, float]], baseline: Optional[Dict[str, Dict[str, float]]]) -> None:
+    print(f"{'scenario':>24} {'ops/sec':>12} {'blocks/op':>10} {'bytes/op':>10} {'peak (B)':>10}",
+          " vs baseline" if baseline else "")
+
+    for (name, result) in results.items():
+        line = f"{name:>24} {result['ops']:12.1f} {result['blocks']:10.1f} {result['memory']:10.1f} " \
+               f"{result['peak']:10d}"
+
+        if baseline and name in baseline:
+            line += f"  {result['ops'] / baseline[name]['ops']:6.2f}x"
+
+        print(line)
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Runs the benchmark suite of the reactive core.")
+
+    parser.add_argument("--output", help="A path to save the results as JSON.")
+    parser.add_argument("--compare", help="A path to the JSON results of a previous run to compare against.")
+    parser.add_argument("--filter", help="Only run the scenarios whose names contain the given text.")
+    parser.add_argument("--repeat", type=int, default=3, help="The number of times to repeat each scenario.")
+    parser.add_argument("--stats", action="store_true", help="Run the scenarios while collecting statistics.")
+    parser.add_argument("--timing", action="store_true", help="Run the scenarios while timing their stages.")
+
+    options = parser.parse_args(args)
+
+    baseline: Optional[Dict[str, Dict[str, float]]] = None
+
+    if options.compare:
+        with open(options.compare) as f:
+            baseline = json.load(f)["results"]
+
+    if options.stats:
+        rv.enable_stats()
+
+    if options.timing:
+        rv.enable_timing()
+
+    scenarios = [s for s in SCENARIOS if not options.filter or options.filter in s.name]
+    results = {s.name: measure(s, options.repeat) for s in scenarios}
+
+    report(results, baseline)
+
+    if options.output:
+        with open(options.output, "w") as f:
+            json.dump({
+                "python": sys.version,
+                "platform": platform.platform(),
+                "results": results
+            }, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# Measures the throughput of assigning properties from a growing number of threads, writing either to their own
+# objects or to a shared one, with and without the thread-safe mode. Writes to different objects don't contend for
+# the same lock, so they should scale with the number of threads on a free-threaded build of Python, while on a build
+# with the GIL it only shows the overhead of locking.
+#
+# Run it from the project root with 'python -m benchmarks.threads'.
+import sys
+import threading
+import time
+from typing import List
+
+from alleycat.reactive import RP, RV, functions as rv
+
+WRITES = 20_000
+
+
+class Plain:
+    value: RP[int] = rv.from_value(0)
+
+    doubled: RV[int] = value.as_view().map(lambda _, v: v * 2)
+
+
+class ThreadSafe:
+    _rv_thread_safe = True
+
+    value: RP[int] = rv.from_value(0)
+
+    doubled: RV[int] = value.as_view().map(lambda _, v: v * 2)
+
+
+def measure(cls: type, threads: int, shared: bool) -> float:
+    shared_obj = cls()
+    fixtures: List = [shared_obj if shared else cls() for _ in range(threads)]
+
+    for fixture in set(fixtures):
+        rv.observe(fixture, "doubled").subscribe(lambda _: None)
+
+    barrier = threading.Barrier(threads + 1)
+    writes = WRITES // threads
+
+    def write(fixture) -> None:
+        barrier.wait()
+
+        for i in range(writes):
+            fixture.value = i
+
+    workers = [threading.Thread(target=write, args=(f,)) for f in fixtures]
+
+    for worker in workers:
+        worker.start()
+
+    barrier.wait()
+
+    start = time.perf_counter()
+
+    for worker in workers:
+        worker.join()
+
+    return writes * threads / (time.perf_counter() - start)
+
+
+def main() -> None:
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+
+    print(f"Assigning a property with a view {WRITES} times in total ({'with' if gil else 'without'} the GIL):")
+    print(f"{'threads':>8} {'plain':>12} {'safe':>12} {'safe, shared':>14}")
+
+    for threads in (1, 2, 4, 8):
+        plain = measure(Plain, threads, False)
+        safe = measure(ThreadSafe, threads, False)
+        shared = measure(ThreadSafe, threads, True)
+
+        print(f"{threads:>8} {plain:12.1f} {safe:12.1f} {shared:14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# Measures the overhead of timing the stages of reactive values, by assigning a property with a validator, a view
+# and a subscriber, with and without timing them. The stages either do nothing, or some work which is more typical of
+# a real application (e.g. updating a scene graph).
+#
+# Run it from the project root with 'python -m benchmarks.timing'.
+import timeit
+from typing import Any, Callable
+
+from alleycat.reactive import RP, RV, functions as rv
+
+WRITES = 5_000
+
+REPEAT = 7
+
+
+def create(work: Callable[[], Any]) -> Any:
+    class Fixture:
+        value: RP[int] = rv.from_value(0).validate(lambda _, v: work() and v)
+
+        doubled: RV[int] = value.as_view().map(lambda _, v: work() and v * 2)
+
+    fixture = Fixture()
+
+    rv.observe(fixture, "doubled").subscribe(lambda _: work())
+
+    return fixture
+
+
+def measure(fixture: Any) -> float:
+    def write() -> None:
+        for i in range(WRITES):
+            fixture.value = i
+
+    return min(timeit.repeat(write, number=1, repeat=REPEAT)) / WRITES
+
+
+def main() -> None:
+    def noop() -> bool:
+        return True
+
+    def busy() -> bool:
+        return sum(range(200)) > 0
+
+    print(f"Assigning a property with a validator, a view and a subscriber {WRITES} times:")
+
+    for (name, work) in (("trivial", noop), ("busy", busy)):
+        plain = create(work)
+
+        rv.enable_timing()
+
+        timed = create(work)
+
+        # Measure both while timing is enabled, as the uninstrumented one would only pay for checking it.
+        before = measure(plain)
+        after = measure(timed)
+
+        rv.disable_timing()
+
+        print(f"{name:>8}: {before * 1e6:8.2f} us -> {after * 1e6:8.2f} us ({(after / before - 1) * 100:+.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+# Measures the cost of assigning a property against the depth of its validator chain, i.e. the number of times
+# 'validate()' was called to declare it.
+#
+# Run it from the project root with 'python -m benchmarks.validators'.
+import timeit
+from typing import Any
+
+from alleycat.reactive import RP, functions as rv
+
+WRITES = 20_000
+
+REPEAT = 7
+
+DEPTHS = (0, 1, 2, 5, 10, 20)
+
+
+def create(depth: int) -> Any:
+    prop = rv.from_value(0)
+
+    for _ in range(depth):
+        prop = prop.validate(lambda _, v: v)
+
+    class Fixture:
+        value: RP[int] = prop
+
+    return Fixture()
+
+
+def main() -> None:
+    print(f"Assigning a property {WRITES} times (best of {REPEAT}):")
+
+    for depth in DEPTHS:
+        fixture = create(depth)
+
+        def write() -> None:
+            for i in range(WRITES):
+                fixture.value = i
+
+        elapsed = min(timeit.repeat(write, number=1, repeat=REPEAT)) / WRITES
+
+        print(f"{depth:>3} validators: {elapsed * 1e9:8.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+import unittest
+from importlib.util import find_spec
+from typing import Any
+
+from alleycat.reactive import ReactiveArrayProperty, functions as rv
+
+
+# noinspection DuplicatedCode
+@unittest.skipUnless(find_spec("numpy"), "NumPy is not installed.")
+class ReactiveArrayPropertyTest(unittest.TestCase):
+
+    def test_read_value(self):
+        import numpy as np
+
+        class Fixture:
+            value: ReactiveArrayProperty = rv.from_array([1.0, 2.0, 3.0])
+
+        fixture1 = Fixture()
+        fixture2 = Fixture()
+
+        self.assertEqual([1.0, 2.0, 3.0], fixture1.value.tolist())
+        self.assertEqual(np.float64, fixture1.value.dtype)
+
+        # Each instance should have its own array.
+        self.assertIsNot(fixture1.value.base, fixture2.value.base)
+
+        with self.assertRaises(ValueError):
+            fixture1.value[0] = 10.0
+
+    def test_update(self):
+        import numpy as np
+
+        class Fixture:
+            value: ReactiveArrayProperty = rv.from_array(np.zeros(5), dtype=np.float32)
+
+        fixture = Fixture()
+
+        changes = []
+
+        rv.observe(fixture, "value").subscribe(changes.append)
+
+        Fixture.value.update(fixture, slice(1, 3), 1.0)
+        Fixture.value.update(fixture, fixture.value > 0, 2.0)
+
+        self.assertEqual([0, 2, 2, 0, 0], fixture.value.tolist())
+        self.assertEqual(np.float32, fixture.value.dtype)
+
+        self.assertEqual(3, len(changes))
+        self.assertEqual(slice(None), changes[0].index)
+        self.assertEqual(slice(1, 3), changes[1].index)
+        self.assertEqual([False, True, True, False, False], changes[2].index.tolist())
+
+        fixture.value = [5, 4, 3, 2, 1]
+
+        self.assertEqual([5, 4, 3, 2, 1], fixture.value.tolist())
+        self.assertEqual(slice(None), changes[3].index)
+
+        # Assigning an array of a different shape should replace the array.
+        fixture.value = np.ones(2)
+
+        self.assertEqual([1, 1], changes[4].values.tolist())
+
+    def test_batch(self):
+        class Fixture:
+            value: ReactiveArrayProperty = rv.from_array([0, 0, 0, 0])
+
+        fixture = Fixture()
+
+        changes = []
+
+        rv.observe(fixture, "value").subscribe(changes.append)
+
+        with rv.batch():
+            Fixture.value.update(fixture, 0, 1)
+            Fixture.value.update(fixture, [2, 3], 2)
+
+        self.assertEqual(2, len(changes))
+        self.assertEqual([1, 0, 2, 2], changes[1].values.tolist())
+        self.assertEqual([True, False, True, True], changes[1].index.tolist())
+
+        Fixture.value.update(fixture, 1, 3)
+
+        # The values of a change are a view of the array, so they should reflect the later updates as well.
+        self.assertEqual([1, 3, 2, 2], changes[1].values.tolist())
+        self.assertIs(changes[1].values, changes[2].values)
+
+    def test_batch_multidimensional(self):
+        import numpy as np
+
+        class Fixture:
+            value: ReactiveArrayProperty = rv.from_array(np.zeros((4, 3), dtype=int))
+
+        fixture = Fixture()
+
+        changes = []
+        rows = []
+
+        rv.observe(fixture, "value").subscribe(changes.append)
+        Fixture.value.observe_item(fixture, 2).subscribe(lambda v: rows.append(v.tolist()))
+
+        with rv.batch():
+            Fixture.value.update(fixture, (1, 2), 1)
+            Fixture.value.update(fixture, (2, 0), 2)
+
+        self.assertEqual(2, len(changes))
+        self.assertEqual([[0, 0, 0], [0, 0, 1], [2, 0, 0], [0, 0, 0]], changes[1].values.tolist())
+        self.assertEqual([[False] * 3, [False, False, True], [True, False, False], [False] * 3],
+                         changes[1].index.tolist())
+
+        Fixture.value.update(fixture, (0, slice(None)), 3)
+        Fixture.value.update(fixture, (slice(2, 4), 1), 4)
+
+        self.assertEqual([[0, 0, 0], [2, 0, 0], [2, 4, 0]], rows)
+
+    def test_observe_item(self):
+        import numpy as np
+
+        class Fixture:
+            value: ReactiveArrayProperty = rv.from_array(np.arange(5))
+
+        fixture = Fixture()
+
+        items = []
+
+        Fixture.value.observe_item(fixture, 3).subscribe(items.append)
+
+        Fixture.value.update(fixture, 0, 10)
+        Fixture.value.update(fixture, slice(2, 5, 2), 20)
+        Fixture.value.update(fixture, -2, 30)
+        Fixture.value.update(fixture, [0, 1], 40)
+        Fixture.value.update(fixture, np.array([False, False, False, True, False]), 50)
+
+        self.assertEqual([3, 30, 50], items)
+
+    def test_map(self):
+        class Fixture:
+            value: ReactiveArrayProperty = rv.from_array([1, 2, 3])
+
+            total: Any = value.map(lambda _, c: int(c.values.sum()))
+
+        fixture = Fixture()
+
+        self.assertEqual(6, fixture.total)
+
+        Fixture.value.update(fixture, 0, 10)
+
+        self.assertEqual(15, fixture.total)
+
+    def test_read_only(self):
+        class Fixture:
+            value: ReactiveArrayProperty = rv.from_array([1, 2, 3], read_only=True)
+
+        fixture = Fixture()
+
+        with self.assertRaises(AttributeError) as cm:
+            Fixture.value.update(fixture, 0, 10)
+
+        self.assertEqual("Cannot modify a read-only property.", cm.exception.args[0])
+
+        with self.assertRaises(AttributeError):
+            fixture.value = [4, 5, 6]
+
+    def test_dispose(self):
+        class Fixture:
+            value: ReactiveArrayProperty = rv.from_array([1, 2, 3])
+
+        fixture = Fixture()
+
+        rv.dispose(fixture)
+
+        with self.assertRaises(AttributeError) as cm:
+            Fixture.value.update(fixture, 0, 10)
+
+        self.assertEqual("Property 'value' has been disposed.", cm.exception.args[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+import unittest
+
+from alleycat.reactive import functions as rv, RC, RP, RV
+
+
+class ComputedTest(unittest.TestCase):
+
+    def test_read(self):
+        calls = []
+
+        class Fixture:
+            x: RP[int] = rv.from_value(1)
+
+            y: RP[int] = rv.from_value(2)
+
+            doubled: RV[int] = x.as_view().map(lambda _, v: v * 2)
+
+            @rv.computed(x, y, doubled)
+            def total(self, x: int, y: int, doubled: int) -> int:
+                calls.append((x, y, doubled))
+
+                return x + y + doubled + self.offset
+
+            # Computed values can depend on other computed values.
+            negated: RC[int] = rv.computed(total)(lambda _, v: -v)
+
+            def __init__(self):
+                self.offset = 100
+
+        fixture = Fixture()
+
+        self.assertEqual([], calls)
+
+        self.assertEqual(105, fixture.total)
+        self.assertEqual(105, fixture.total)
+        self.assertEqual(-105, fixture.negated)
+
+        self.assertEqual([(1, 2, 2)], calls)
+
+        fixture.x = 3
+        fixture.y = 4
+
+        # Changing the sources doesn't compute anything until the value is read.
+        self.assertEqual([(1, 2, 2)], calls)
+
+        self.assertEqual(-113, fixture.negated)
+        self.assertEqual(113, fixture.total)
+
+        self.assertEqual([(1, 2, 2), (3, 4, 6)], calls)
+
+    def test_modify(self):
+        class Fixture:
+            value: RP[int] = rv.from_value(1)
+
+            doubled: RC[int] = rv.computed(value)(lambda _, v: v * 2)
+
+        fixture = Fixture()
+
+        with self.assertRaises(AttributeError):
+            # noinspection PyPropertyAccess
+            fixture.doubled = 3
+
+        self.assertEqual(2, fixture.doubled)
+
+    def test_uninitialized(self):
+        class Fixture:
+            value: RP[int] = rv.new_property()
+
+            doubled: RC[int] = rv.computed(value)(lambda _, v: v * 2)
+
+        fixture = Fixture()
+
+        with self.assertRaises(AttributeError):
+            # noinspection PyStatementEffect
+            fixture.doubled
+
+        values = []
+
+        rv.observe(fixture.doubled).subscribe(values.append)
+
+        self.assertEqual([], values)
+
+        fixture.value = 2
+
+        self.assertEqual([4], values)
+        self.assertEqual(4, fixture.doubled)
+
+    def test_observe(self):
+        class Fixture:
+            x: RP[int] = rv.from_value(1)
+
+            y: RP[int] = rv.from_value(2)
+
+            total: RC[int] = rv.computed(x, y)(lambda _, x, y: x + y)
+
+            doubled: RV[int] = total.map(lambda _, v: v * 2)
+
+        fixture = Fixture()
+
+        totals = []
+        doubled = []
+
+        rv.observe(fixture.total).subscribe(totals.append)
+        rv.observe(fixture, "doubled").subscribe(doubled.append)
+
+        self.assertEqual([3], totals)
+        self.assertEqual([6], doubled)
+
+        fixture.x = 3
+
+        self.assertEqual([3, 5], totals)
+        self.assertEqual([6, 10], doubled)
+
+        # Both sources change in a batch, but the observers are notified only once.
+        with rv.batch():
+            fixture.x = 4
+            fixture.y = 5
+
+        self.assertEqual([3, 5, 9], totals)
+        self.assertEqual([6, 10, 18], doubled)
+
+        self.assertEqual(9, fixture.total)
+
+
+if __name__ == '__main__':
+    unittest.main()
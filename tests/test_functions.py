@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 from typing import Optional
 
@@ -5,8 +6,11 @@ import rx
 from returns.functions import identity
 from rx import operators as ops
 from rx.subject import BehaviorSubject
+from rx.scheduler import EventLoopScheduler
+from rx.testing import TestScheduler
 
 from alleycat.reactive import ReactiveObject, functions as rv, RP, RV
+from alleycat.reactive.functions import observe
 
 
 # noinspection DuplicatedCode
@@ -137,6 +141,205 @@ class FunctionsTest(unittest.TestCase):
         self.assertEqual([1, 2], values1)
         self.assertEqual([1, 2], values2)
 
+    def test_observe_uninitialized_call_shapes(self):
+        class Fixture:
+            value: RP[int] = rv.new_property()
+
+        class Holder:
+            def __init__(self, fixture):
+                self.fixture = fixture
+
+        def check(name, subscribe):
+            fixture = Fixture()
+            values = []
+
+            subscribe(fixture).subscribe(values.append)
+
+            fixture.value = 1
+
+            self.assertEqual([1], values, name)
+
+        def from_closure(fixture):
+            def inner():
+                return rv.observe(fixture.value)
+
+            return inner()
+
+        def from_holder(fixture):
+            holder = Holder(fixture)
+
+            return rv.observe(holder.fixture.value)
+
+        check("attribute", lambda f: rv.observe(f.value))
+        check("nested attribute", from_holder)
+        check("closure", from_closure)
+        check("imported function", lambda f: observe(f.value))
+        check("explicit name", lambda f: rv.observe(f, "value"))
+        check("reference", lambda f: rv.observe(rv.ref(f).value))
+        check("nested reference", lambda f: rv.observe(rv.ref(Holder(f).fixture).value))
+
+        # Reading an uninitialized value should still fail when it is not passed to 'observe'.
+        fixture = Fixture()
+
+        class Other:
+            def observe(self, value):
+                return value
+
+        with self.assertRaises(AttributeError):
+            Other().observe(fixture.value)
+
+        with self.assertRaises(AttributeError):
+            _ = fixture.value
+
+        with self.assertRaises(AttributeError):
+            str(fixture.value)
+
+        with self.assertRaises(AttributeError):
+            rv.observe(str(fixture.value))
+
+    def test_observe_with_scheduler(self):
+        scheduler = TestScheduler()
+
+        class Fixture(ReactiveObject):
+            value: RP[int] = rv.from_value(1, scheduler=scheduler)
+
+            doubled: RV[int] = value.as_view().map(lambda _, v: v * 2)
+
+            other: RP[int] = rv.from_value(1)
+
+        fixture = Fixture()
+
+        values = []
+        doubled = []
+        others = []
+
+        rv.observe(fixture.value).subscribe(values.append)
+        rv.observe(fixture, "doubled").subscribe(doubled.append)
+        rv.observe(fixture.other, scheduler=scheduler).subscribe(others.append)
+        fixture.observe("other", scheduler).subscribe(others.append)
+
+        fixture.value = 2
+        fixture.other = 3
+
+        # Values derived from it inside the object should not be affected by the scheduler.
+        self.assertEqual(2, fixture.value)
+        self.assertEqual(4, fixture.doubled)
+
+        self.assertEqual([], values)
+        self.assertEqual([], doubled)
+        self.assertEqual([], others)
+
+        scheduler.start()
+
+        self.assertEqual([1, 2], values)
+        self.assertEqual([2, 4], doubled)
+        self.assertEqual([1, 1, 3, 3], sorted(others))
+
+    def test_aiter(self):
+        class Fixture:
+            value: RP[int] = rv.from_value(1)
+
+        fixture = Fixture()
+
+        async def consume(buffer_size: Optional[int]):
+            values = []
+
+            async with rv.aiter(fixture, "value", buffer_size) as iterator:
+                async for value in iterator:
+                    values.append(value)
+
+                    if value == 1:
+                        # Changes made while the consumer is busy are buffered.
+                        for v in range(2, 6):
+                            fixture.value = v
+                    elif value == 5:
+                        break
+
+                self.assertFalse(iterator.closed)
+
+            self.assertTrue(iterator.closed)
+
+            return values
+
+        fixture.value = 1
+        self.assertEqual([1, 2, 3, 4, 5], asyncio.run(consume(None)))
+
+        fixture.value = 1
+        self.assertEqual([1, 4, 5], asyncio.run(consume(2)))
+
+        fixture.value = 1
+        self.assertEqual([1, 5], asyncio.run(consume(1)))
+
+        with self.assertRaises(ValueError) as cm:
+            rv.aiter(fixture, "value", 0)
+
+        self.assertEqual("Argument 'buffer_size' must be a positive integer.", cm.exception.args[0])
+
+    def test_aiter_cancel(self):
+        class Fixture:
+            value: RP[int] = rv.from_value(1)
+
+        fixture = Fixture()
+
+        iterator = rv.aiter(fixture, "value")
+
+        async def consume():
+            async for _ in iterator:
+                pass
+
+        async def run():
+            task = asyncio.create_task(consume())
+
+            await asyncio.sleep(0)
+
+            fixture.value = 2
+
+            await asyncio.sleep(0)
+
+            task.cancel()
+
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+
+        self.assertTrue(iterator.closed)
+        self.assertEqual(0, len(next(rv.get_data(fixture)).observable.observers))
+
+    def test_next_change(self):
+        class Fixture:
+            value: RP[int] = rv.from_value(1)
+
+        fixture = Fixture()
+
+        async def run():
+            change = asyncio.create_task(rv.next_change(fixture, "value"))
+
+            await asyncio.sleep(0)
+
+            self.assertFalse(change.done())
+
+            fixture.value = 2
+            fixture.value = 3
+
+            return await change
+
+        self.assertEqual(3, asyncio.run(run()))
+
+        async def run_in_thread():
+            change = asyncio.create_task(rv.next_change(fixture, "value", scheduler=EventLoopScheduler()))
+
+            # Give the scheduler enough time to deliver the current value, which should be ignored.
+            await asyncio.sleep(0.1)
+
+            self.assertFalse(change.done())
+
+            fixture.value = 4
+
+            return await asyncio.wait_for(change, 5)
+
+        self.assertEqual(4, asyncio.run(run_in_thread()))
+
     def test_combine(self):
         class Fixture:
             value: RP[int] = rv.from_value(1)
@@ -177,6 +380,129 @@ class FunctionsTest(unittest.TestCase):
 
         self.assertEqual([(1, 6), (3, 6)], combined[1:])
 
+    def test_batch(self):
+        class Fixture:
+            x: RP[int] = rv.from_value(1)
+
+            y: RP[int] = rv.from_value(2)
+
+            doubled: RV[int] = x.as_view().map(lambda _, v: v * 2)
+
+            combined: RV[int] = rv.combine_latest(x, y, doubled)(identity)
+
+        fixture = Fixture()
+
+        xs = []
+        combined = []
+
+        rv.observe(fixture.x).subscribe(xs.append)
+        rv.observe(fixture.combined).subscribe(combined.append)
+
+        with rv.batch():
+            fixture.x = 3
+            fixture.y = 4
+            fixture.x = 5
+
+            # Nested batches should be merged into the outer one.
+            with rv.batch():
+                fixture.y = 6
+
+            self.assertEqual(5, fixture.x)
+            self.assertEqual([1], xs)
+            self.assertEqual([(1, 2, 2)], combined)
+
+        self.assertEqual([1, 5], xs)
+        self.assertEqual([(1, 2, 2), (5, 6, 10)], combined)
+
+        fixture.x = 7
+
+        self.assertEqual([1, 5, 7], xs)
+        self.assertEqual((7, 6, 14), combined[-1])
+
+        # The changes made before an error in the block should still be published.
+        with self.assertRaises(RuntimeError):
+            with rv.batch():
+                fixture.x = 8
+                raise RuntimeError()
+
+        self.assertEqual([1, 5, 7, 8], xs)
+        self.assertEqual((8, 6, 16), combined[-1])
+
+        # And the batch should end with the block.
+        fixture.x = 9
+
+        self.assertEqual([1, 5, 7, 8, 9], xs)
+
+    def test_update(self):
+        class Fixture:
+            x: RP[int] = rv.from_value(1)
+
+            y: RP[int] = rv.new_property()
+
+            total: RV[int] = rv.combine_latest(x, y)(ops.map(sum))
+
+        fixture = Fixture()
+
+        totals = []
+
+        rv.observe(fixture.total).subscribe(totals.append)
+
+        rv.update(fixture, x=2, y=3)
+
+        self.assertEqual((2, 3), (fixture.x, fixture.y))
+        self.assertEqual([5], totals)
+
+        rv.update(fixture, x=10, y=20)
+
+        self.assertEqual([5, 30], totals)
+
+        with self.assertRaises(ValueError) as cm:
+            rv.update(None, x=1)
+
+        self.assertEqual("Cannot update a None object.", cm.exception.args[0])
+
+    def test_glitch_free(self):
+        def create_fixture(glitch_free: bool):
+            class Fixture:
+                _rv_glitch_free = glitch_free
+
+                value: RP[int] = rv.from_value(1)
+
+                plus_one: RV[int] = value.as_view().map(lambda _, v: v + 1)
+
+                doubled: RV[int] = value.as_view().map(lambda _, v: v * 2)
+
+                combined: RV[int] = rv.combine_latest(plus_one, doubled)(identity)
+
+            return Fixture
+
+        Fixture = create_fixture(True)
+
+        self.assertEqual((0, 2, 2, 3), tuple(map(lambda v: v.level, (
+            Fixture.value, Fixture.plus_one, Fixture.doubled, Fixture.combined))))
+
+        fixture = Fixture()
+
+        combined = []
+
+        rv.observe(fixture.combined).subscribe(combined.append)
+
+        fixture.value = 2
+        fixture.value = 3
+
+        self.assertEqual([(2, 2), (3, 4), (4, 6)], combined)
+
+        # The same dependency graph emits an intermediate state without the flag.
+        fixture = create_fixture(False)()
+
+        combined = []
+
+        rv.observe(fixture.combined).subscribe(combined.append)
+
+        fixture.value = 2
+
+        self.assertEqual([(2, 2), (3, 2), (3, 4)], combined)
+
     def test_merge(self):
         class Fixture:
             cats: RP[str] = rv.new_property()
@@ -0,0 +1,149 @@
+import sys
+import threading
+import unittest
+
+from alleycat.reactive import functions as rv, RP, RV
+from alleycat.reactive.journal import Journal
+
+
+class JournalTest(unittest.TestCase):
+
+    def tearDown(self) -> None:
+        rv.disable_journal()
+
+    def test_disabled(self):
+        class Fixture:
+            value: RP[int] = rv.from_value(1)
+
+        Fixture().value = 2
+
+        self.assertEqual([], rv.journal())
+
+    def test_journal(self):
+        class Fixture:
+            # The validator isn't idempotent, so that replaying the validated values would reveal validating them again.
+            value: RP[int] = rv.from_value(1).validate(lambda _, v: v * 2)
+
+            doubled: RV[int] = value.as_view().map(lambda _, v: v * 2)
+
+        class Other:
+            value: RP[int] = rv.from_value(1)
+
+        first = Fixture()
+        second = Fixture()
+        other = Other()
+
+        rv.enable_journal(classes=(Fixture,))
+
+        first.value = -1
+        second.value = 2
+        other.value = 3
+        first.value = 4
+
+        entries = rv.journal()
+
+        # Only the instances of the given classes are recorded, with their validated values.
+        self.assertEqual([(id(first), "value", -2), (id(second), "value", 4), (id(first), "value", 8)],
+                         [(e.object_id, e.property, e.value) for e in entries])
+
+        self.assertTrue(all(e.cls is Fixture for e in entries))
+        self.assertEqual(sorted(e.timestamp for e in entries), [e.timestamp for e in entries])
+
+        self.assertEqual([-2, 8], [e.value for e in rv.journal(object_id=id(first))])
+        self.assertEqual([], rv.journal(cls=Other))
+        self.assertEqual(entries[1:], rv.journal(since=entries[1].timestamp))
+
+        replayed = rv.replay(rv.journal())
+
+        self.assertEqual({id(first), id(second)}, set(replayed.keys()))
+        self.assertEqual((8, 16), (replayed[id(first)].value, replayed[id(first)].doubled))
+        self.assertEqual(4, replayed[id(second)].value)
+
+    def test_capacity(self):
+        class Fixture:
+            value: RP[int] = rv.from_value(0)
+
+        fixture = Fixture()
+
+        journal = Journal(capacity=3)
+
+        for i in range(5):
+            journal.record(fixture, "value", i)
+
+        self.assertEqual([2, 3, 4], [e.value for e in journal.entries()])
+        self.assertEqual((5, 2), (journal.count, journal.dropped))
+
+        journal.clear()
+
+        self.assertEqual([], journal.entries())
+
+        with self.assertRaises(ValueError):
+            Journal(capacity=0)
+
+    def test_concurrent_record(self):
+        class Fixture:
+            value: RP[int] = rv.from_value(0)
+
+        fixture = Fixture()
+
+        journal = Journal(capacity=100)
+
+        barrier = threading.Barrier(8)
+
+        def run() -> None:
+            barrier.wait()
+
+            for i in range(500):
+                journal.record(fixture, "value", i)
+
+        interval = sys.getswitchinterval()
+
+        # Switch threads as often as possible, so that they finish their entries in a different order.
+        sys.setswitchinterval(1e-6)
+
+        try:
+            threads = [threading.Thread(target=run) for _ in range(8)]
+
+            for thread in threads:
+                thread.start()
+
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        self.assertEqual((4000, 3900), (journal.count, journal.dropped))
+        self.assertEqual(100, len(journal.entries()))
+
+    def test_replay_thread_safe(self):
+        class Fixture:
+            _rv_thread_safe = True
+
+            value: RP[int] = rv.from_value(1)
+
+        rv.enable_journal()
+
+        Fixture().value = 2
+
+        target = Fixture()
+        replayed = threading.Event()
+
+        def replay() -> None:
+            rv.replay(rv.journal(), {e.object_id: target for e in rv.journal()})
+            replayed.set()
+
+        # Replaying should wait for the other thread which holds the lock of the object.
+        with rv.lock(target):
+            thread = threading.Thread(target=replay)
+            thread.start()
+
+            self.assertFalse(replayed.wait(0.1))
+            self.assertEqual(1, target.value)
+
+        thread.join()
+
+        self.assertEqual(2, target.value)
+
+
+if __name__ == '__main__':
+    unittest.main()
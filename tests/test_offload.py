@@ -0,0 +1,207 @@
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from threading import Event
+from typing import Any, Callable, Dict, List
+
+from rx.scheduler import ThreadPoolScheduler
+from rx.subject import Subject
+
+from alleycat.reactive import functions as rv, RP, RV
+from alleycat.reactive.offload import offload
+
+TIMEOUT = 10
+
+
+# Functions run in another process must be declared at the module level.
+def square(value: int) -> int:
+    return value * value
+
+
+def collect(values: List[Any], count: int) -> Callable[[Any], None]:
+    done = Event()
+
+    def append(value: Any) -> None:
+        values.append(value)
+
+        if len(values) >= count:
+            done.set()
+
+    # noinspection PyTypeHints
+    append.done = done  # type:ignore
+
+    return append
+
+
+class OffloadTest(unittest.TestCase):
+
+    def test_map_in_process(self):
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            class Fixture:
+                value: RP[int] = rv.from_value(2)
+
+                squared: RV[int] = value.as_view().map_in_process(square, pool, ordered=True)
+
+            fixture = Fixture()
+
+            values = []
+            append = collect(values, 3)
+
+            rv.observe(fixture, "squared").subscribe(append)
+
+            fixture.value = 3
+            fixture.value = 4
+
+            self.assertTrue(append.done.wait(TIMEOUT))
+
+            self.assertEqual([4, 9, 16], values)
+            self.assertEqual(16, fixture.squared)
+
+    def test_latest(self):
+        started = Event()
+        release = Event()
+
+        calls = []
+
+        def compute(value: int) -> int:
+            calls.append(value)
+
+            if value == 1:
+                started.set()
+                release.wait(TIMEOUT)
+
+            return value * 10
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            class Fixture:
+                # A property with a modifier applies it to the values assigned to itself.
+                value: RP[int] = rv.new_property().map_in_process(compute, pool)
+
+            fixture = Fixture()
+
+            values = []
+            append = collect(values, 1)
+
+            rv.observe(fixture, "value").subscribe(append)
+
+            fixture.value = 1
+
+            self.assertTrue(started.wait(TIMEOUT))
+
+            # The computation of 2 is cancelled before it starts, and the result of 1 is discarded.
+            fixture.value = 2
+            fixture.value = 3
+
+            release.set()
+
+            self.assertTrue(append.done.wait(TIMEOUT))
+
+        self.assertEqual([1, 3], calls)
+        self.assertEqual([30], values)
+
+    def test_ordered(self):
+        events: Dict[int, Event] = {i: Event() for i in range(3)}
+
+        def compute(value: int) -> int:
+            events[value].wait(TIMEOUT)
+
+            return value
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            class Fixture:
+                value: RP[int] = rv.new_property()
+
+                result: RV[int] = value.as_view().map_in_process(compute, pool, ordered=True)
+
+            fixture = Fixture()
+
+            values = []
+            append = collect(values, 3)
+
+            rv.observe(fixture, "result").subscribe(append)
+
+            for i in range(3):
+                fixture.value = i
+
+            # Finish them in the reverse order.
+            for i in reversed(range(3)):
+                events[i].set()
+
+            self.assertTrue(append.done.wait(TIMEOUT))
+
+        self.assertEqual([0, 1, 2], values)
+
+    def test_ordered_with_scheduler(self):
+        count = 199
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            class Fixture:
+                value: RP[int] = rv.new_property()
+
+                squared: RV[int] = value.as_view().map_in_process(
+                    square, pool, ordered=True, scheduler=ThreadPoolScheduler(8))
+
+            fixture = Fixture()
+
+            values = []
+            append = collect(values, count)
+
+            rv.observe(fixture, "squared").subscribe(append)
+
+            for i in range(count):
+                fixture.value = i
+
+            self.assertTrue(append.done.wait(TIMEOUT))
+
+        # A scheduler which runs the actions concurrently shouldn't change the order of the results.
+        self.assertEqual([square(i) for i in range(count)], values)
+
+    def test_error_while_emitting(self):
+        computing = Event()
+        emitting = Event()
+        release = Event()
+        failed = Event()
+
+        notifications = []
+
+        def on_next(value: int) -> None:
+            notifications.append(("next", value))
+
+            emitting.set()
+            release.wait(TIMEOUT)
+
+        def on_error(e: Exception) -> None:
+            notifications.append(("error", e))
+
+            failed.set()
+
+        # Finish the computation after it has been submitted, so that the thread of the pool emits the result.
+        def compute(value: int) -> int:
+            computing.wait(TIMEOUT)
+
+            return square(value)
+
+        source = Subject()
+        error = ValueError("Failed.")
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            source.pipe(offload(compute, pool)).subscribe(on_next, on_error)
+
+            source.on_next(2)
+            computing.set()
+
+            self.assertTrue(emitting.wait(TIMEOUT))
+
+            source.on_error(error)
+
+            # The error should wait until the result being emitted by the thread of the pool is done.
+            self.assertEqual([("next", 4)], notifications)
+
+            release.set()
+
+            self.assertTrue(failed.wait(TIMEOUT))
+
+        self.assertEqual([("next", 4), ("error", error)], notifications)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,13 @@
+import inspect
 import unittest
-from typing import TypeVar, Callable, Any
+from importlib.util import find_spec
+from typing import TypeVar, Callable, Any, Tuple
 
 from returns.maybe import Some
 from rx import operators as ops
 
-from alleycat.reactive import ReactiveProperty, functions as rv, ReactiveView, RP, RV
+from alleycat.reactive import ReactiveProperty, functions as rv, ReactiveView, RP, RV, comparators
+from alleycat.reactive.value import DATA_KEY
 
 T = TypeVar("T")
 
@@ -119,6 +122,281 @@ class ReactivePropertyTest(unittest.TestCase):
 
         self.assertEqual(["ABC"], last_changed)
 
+    def test_lazy_pipeline(self):
+        class Fixture:
+            value: RP[str] = rv.from_value("Spam", lazy=True)
+
+            eager: RP[str] = rv.from_value("Eggs")
+
+        fixture = Fixture()
+
+        self.assertEqual({"eager"}, set(getattr(fixture, DATA_KEY).keys()))
+
+        self.assertEqual("Spam", fixture.value)
+
+        data = Fixture.value._get_data(fixture)
+
+        self.assertEqual(False, data.materialized)
+
+        fixture.value = "Ham"
+
+        self.assertEqual("Ham", fixture.value)
+        self.assertEqual(False, data.materialized)
+
+        values = []
+
+        rv.observe(fixture, "value").subscribe(values.append)
+
+        self.assertEqual(True, data.materialized)
+
+        fixture.value = "Bacon"
+
+        self.assertEqual("Bacon", fixture.value)
+        self.assertEqual(["Ham", "Bacon"], values)
+
+    def test_lazy_class(self):
+        class Fixture:
+            _rv_lazy = True
+
+            value: RP[str] = rv.new_property()
+
+            modified: RP[str] = rv.from_value("spam").map(lambda _, v: v.upper())
+
+            eager: RP[str] = rv.from_value("Eggs", lazy=False)
+
+        fixture = Fixture()
+
+        self.assertEqual({"eager"}, set(getattr(fixture, DATA_KEY).keys()))
+
+        with self.assertRaises(AttributeError) as cm:
+            # noinspection PyStatementEffect
+            fixture.value
+
+        self.assertEqual("Property 'value' is not initialized yet.", cm.exception.args[0])
+
+        # Properties with a modifier need their pipeline to produce a value.
+        self.assertEqual("SPAM", fixture.modified)
+        self.assertEqual(True, Fixture.modified._get_data(fixture).materialized)
+
+        values = []
+
+        rv.observe(fixture, "value").subscribe(values.append)
+
+        fixture.value = "Ham"
+
+        self.assertEqual("Ham", fixture.value)
+        self.assertEqual(["Ham"], values)
+
+    def test_fused_pipeline(self):
+        class Fixture:
+            value: RP[str] = rv.from_value("Spam")
+
+            empty: RP[str] = rv.new_property()
+
+            modified: RP[str] = value.map(lambda _, v: v.upper())
+
+        fixture = Fixture()
+
+        self.assertEqual(True, Fixture.value._get_data(fixture).fused)
+        self.assertEqual(True, Fixture.empty._get_data(fixture).fused)
+        self.assertEqual(False, Fixture.modified._get_data(fixture).fused)
+
+        values1 = []
+        values2 = []
+        empty = []
+
+        rv.observe(fixture, "value").subscribe(values1.append)
+        rv.observe(fixture, "empty").subscribe(empty.append)
+
+        fixture.value = "Ham"
+
+        # Late observers should receive the latest value.
+        rv.observe(fixture, "value").subscribe(values2.append)
+
+        fixture.value = "Eggs"
+
+        self.assertEqual(["Spam", "Ham", "Eggs"], values1)
+        self.assertEqual(["Ham", "Eggs"], values2)
+        self.assertEqual([], empty)
+        self.assertEqual("SPAM", fixture.modified)
+
+        fixture.empty = "Bacon"
+
+        self.assertEqual(["Bacon"], empty)
+
+        completed = []
+
+        rv.observe(fixture, "value").subscribe(on_completed=lambda: completed.append(True))
+        rv.dispose(fixture)
+
+        self.assertEqual([], completed)
+
+    def test_fused_stages(self):
+        class Fixture:
+            value: RP[int] = rv.from_value(1) \
+                .map(lambda _, v: v * 2) \
+                .validate(lambda _, v: max(v, 0)) \
+                .filter(lambda _, v: v < 10) \
+                .map(lambda o, v: v + o.offset)
+
+            def __init__(self):
+                self.offset = 1
+
+        rv.enable_timing()
+
+        try:
+            fixture = Fixture()
+
+            values = []
+
+            rv.observe(fixture, "value").subscribe(values.append)
+
+            stages = [t["stage"] for t in rv.timings() if t["stage"] != "subscribers"]
+        finally:
+            rv.disable_timing()
+
+        # Validating the value doesn't break the chain of the stages.
+        self.assertEqual(["validator", "map+filter+map[0]"], stages)
+
+        fixture.value = -1
+        fixture.value = 4
+        fixture.value = 8
+
+        self.assertEqual([3, 1, 9], values)
+        self.assertEqual(9, fixture.value)
+
+    def test_flattened_chains(self):
+        depths = []
+
+        def record(_, v):
+            depths.append(len(inspect.stack(0)))
+            return v
+
+        def chain(depth: int) -> RP[int]:
+            prop = rv.from_value(0)
+
+            for i in range(depth):
+                prop = prop.validate(lambda _, v: v + 1)
+
+            return prop.validate(record)
+
+        class Fixture:
+            shallow: RP[int] = chain(1)
+
+            deep: RP[int] = chain(10)
+
+            piped: RP[str] = rv.from_value(1) \
+                .map(lambda _, v: v * 2) \
+                .pipe(lambda _: (ops.map(lambda v: v + 1),)) \
+                .map(lambda _, v: str(v))
+
+        fixture = Fixture()
+
+        fixture.shallow = 0
+        fixture.deep = 0
+
+        self.assertEqual(1, fixture.shallow)
+        self.assertEqual(10, fixture.deep)
+
+        # The validators run in a loop, so the depth of the chain doesn't add to the call stack.
+        self.assertEqual(depths[-2], depths[-1])
+
+        fixture.piped = 4
+
+        # The modifiers are applied in the order they are declared.
+        self.assertEqual("9", fixture.piped)
+
+    def test_dedupe(self):
+        class Fixture:
+            value: RP[int] = rv.from_value(1, dedupe=True)
+
+            position: RP[Tuple[float, float]] = rv.from_value((0.0, 0.0), eq=comparators.approx_tuple(0.01))
+
+            modified: RP[int] = value.map(lambda _, v: v * 10)
+
+            duplicate: RP[int] = rv.from_value(1)
+
+        fixture = Fixture()
+
+        values = []
+        positions = []
+        modified = []
+        duplicates = []
+
+        rv.observe(fixture.value).subscribe(values.append)
+        rv.observe(fixture.position).subscribe(positions.append)
+        rv.observe(fixture.modified).subscribe(modified.append)
+        rv.observe(fixture.duplicate).subscribe(duplicates.append)
+
+        for v in (1, 2, 2, 1):
+            fixture.value = v
+            fixture.modified = v
+            fixture.duplicate = v
+
+        fixture.position = (0.005, 0.0)
+        fixture.position = (0.5, 0.0)
+
+        self.assertEqual([1, 2, 1], values)
+        self.assertEqual([10, 20, 10], modified)
+        self.assertEqual([1, 1, 2, 2, 1], duplicates)
+        self.assertEqual([(0.0, 0.0), (0.5, 0.0)], positions)
+
+        # Changing the value back to the current one in a batch shouldn't notify the observers.
+        with rv.batch():
+            fixture.value = 3
+            fixture.value = 3
+            fixture.value = 1
+            fixture.modified = 3
+            fixture.modified = 1
+
+        self.assertEqual([1, 2, 1], values)
+        self.assertEqual([10, 20, 10], modified)
+        self.assertEqual(1, fixture.value)
+
+        with rv.batch():
+            fixture.value = 3
+            fixture.value = 1
+            fixture.value = 4
+
+        self.assertEqual([1, 2, 1, 4], values)
+
+        self.assertEqual(None, Fixture.duplicate.eq)
+        self.assertEqual(comparators.equals, Fixture.value.eq)
+
+    @unittest.skipUnless(find_spec("numpy"), "NumPy is not installed.")
+    def test_dedupe_array(self):
+        import numpy as np
+
+        class Fixture:
+            default: RP[Any] = rv.from_value(np.zeros(3), dedupe=True)
+
+            exact: RP[Any] = rv.from_value(np.zeros(3), eq=comparators.array_equals)
+
+            approx: RP[Any] = rv.from_value(np.zeros(3), eq=comparators.array_approx(0.1))
+
+        fixture = Fixture()
+
+        default = []
+        exact = []
+        approx = []
+
+        rv.observe(fixture.default).subscribe(default.append)
+        rv.observe(fixture.exact).subscribe(exact.append)
+        rv.observe(fixture.approx).subscribe(approx.append)
+
+        for v in (np.zeros(3), np.array([0.05, 0, 0]), np.zeros(4)):
+            fixture.default = v
+            fixture.exact = v
+            fixture.approx = v
+
+        self.assertEqual(3, len(default))
+        self.assertEqual(3, len(exact))
+        self.assertEqual(2, len(approx))
+
+        self.assertTrue(comparators.equals(np.float64(1.0), 1.0))
+        self.assertFalse(comparators.equals(np.zeros(3), 0.0))
+        self.assertFalse(comparators.equals(np.zeros(3), None))
+
     def test_multiple_properties(self):
         class Fixture:
             name: RP[str] = ReactiveProperty(Some("Slim Shady"))
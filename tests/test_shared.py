@@ -0,0 +1,156 @@
+import math
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict
+
+from rx import operators as ops
+from rx.testing import TestScheduler
+
+from alleycat.reactive import functions as rv, RP, RV
+
+
+# Functions run in another process must be declared at the module level.
+def read_mirror(name: str) -> Dict[str, float]:
+    with rv.open_mirror(name) as reader:
+        return reader.snapshot()
+
+
+class Fixture:
+    x: RP[float] = rv.from_value(1.0)
+
+    y: RP[int] = rv.from_value(2)
+
+    distance: RV[float] = rv.combine_latest(x, y)(ops.map(lambda v: math.hypot(*v)))
+
+    target: RP[float] = rv.new_property()
+
+
+class SharedTest(unittest.TestCase):
+
+    def test_mirror(self):
+        fixture = Fixture()
+
+        with rv.mirror(fixture, "x", "y", "target") as mirror, rv.open_mirror(mirror.name) as reader:
+            self.assertEqual(("x", "y", "target"), reader.names)
+
+            snapshot = reader.snapshot()
+
+            # Uninitialized properties are mirrored as NaN.
+            self.assertEqual((1.0, 2.0), (snapshot["x"], snapshot["y"]))
+            self.assertTrue(math.isnan(snapshot["target"]))
+
+            sequence = reader.sequence
+
+            fixture.x = 3.0
+            fixture.target = 5.0
+
+            self.assertEqual({"x": 3.0, "y": 2.0, "target": 5.0}, reader.snapshot())
+            self.assertEqual(sequence + 2, reader.sequence)
+
+            # The changes made in a batch are written at once.
+            with rv.batch():
+                fixture.x = 6.0
+                fixture.y = 8
+
+                self.assertEqual(3.0, reader.snapshot()["x"])
+
+            self.assertEqual({"x": 6.0, "y": 8.0, "target": 5.0}, reader.snapshot())
+            self.assertEqual(sequence + 3, reader.sequence)
+            self.assertEqual([6.0, 8.0, 5.0], reader.values.tolist())
+
+        with self.assertRaises(FileNotFoundError):
+            rv.open_mirror(mirror.name)
+
+    def test_views(self):
+        fixture = Fixture()
+
+        with rv.mirror(fixture, "distance") as mirror, rv.open_mirror(mirror.name) as reader:
+            fixture.x = 3.0
+            fixture.y = 4
+
+            self.assertEqual({"distance": 5.0}, reader.snapshot())
+
+    def test_changes(self):
+        fixture = Fixture()
+        scheduler = TestScheduler()
+
+        with rv.mirror(fixture, "x") as mirror, rv.open_mirror(mirror.name) as reader:
+            values = []
+
+            subscription = reader.changes(1.0, scheduler).subscribe(lambda v: values.append(v["x"]))
+
+            scheduler.advance_by(1.5)
+
+            fixture.x = 2.0
+            fixture.x = 3.0
+
+            scheduler.advance_by(2.0)
+
+            fixture.x = 4.0
+
+            scheduler.advance_by(1.0)
+
+            subscription.dispose()
+
+        # The changes made between the polls are merged, and the polls without any change are ignored.
+        self.assertEqual([1.0, 3.0, 4.0], values)
+
+    def test_other_process(self):
+        fixture = Fixture()
+
+        with rv.mirror(fixture, "x", "y") as mirror, ProcessPoolExecutor(max_workers=1) as pool:
+            fixture.x = 7.0
+
+            self.assertEqual({"x": 7.0, "y": 2.0}, pool.submit(read_mirror, mirror.name).result(10))
+
+            fixture.y = 9
+
+            self.assertEqual({"x": 7.0, "y": 9.0}, pool.submit(read_mirror, mirror.name).result(10))
+
+    def test_validation(self):
+        fixture = Fixture()
+
+        with self.assertRaises(ValueError) as cm:
+            rv.mirror(None, "x")
+
+        self.assertEqual("Cannot mirror a None object.", cm.exception.args[0])
+
+        with self.assertRaises(ValueError) as cm:
+            rv.mirror(fixture)
+
+        self.assertEqual("At least one property name is required.", cm.exception.args[0])
+
+        with self.assertRaises(AttributeError) as cm:
+            rv.mirror(fixture, "x", "z")
+
+        self.assertEqual("Unknown property name: 'z'.", cm.exception.args[0])
+
+        class Named:
+            name: RP[str] = rv.from_value("Max")
+
+        with self.assertRaises(TypeError) as cm:
+            rv.mirror(Named(), "name")
+
+        self.assertEqual("Property 'name' must have a numeric value: 'Max'.", cm.exception.args[0])
+
+    def test_non_numeric(self):
+        class Target:
+            x: RP[float] = rv.from_value(1.0)
+
+            target: RP[Any] = rv.new_property()
+
+        fixture = Target()
+
+        with rv.mirror(fixture, "x", "target") as mirror, rv.open_mirror(mirror.name) as reader:
+            fixture.target = 2.0
+
+            # Values which aren't numbers are written as NaN, instead of failing the assignment.
+            fixture.x = None
+            fixture.target = "far away"
+
+            self.assertIsNone(fixture.x)
+            self.assertTrue(all(map(math.isnan, reader.snapshot().values())))
+
+
+if __name__ == '__main__':
+    unittest.main()
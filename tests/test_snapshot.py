@@ -0,0 +1,177 @@
+import copy
+import pickle
+import unittest
+from importlib.util import find_spec
+
+from returns.functions import identity
+
+from alleycat.reactive import functions as rv, RP, RV
+from alleycat.reactive.value import DATA_KEY, LOCK_KEY
+
+
+# Pickled classes must be declared at the module level.
+class Player:
+    name: RP[str] = rv.from_value("Nobody")
+
+    health: RP[int] = rv.from_value(100).validate(lambda _, v: min(v, 100))
+
+    score: RP[int] = rv.from_value(0).map(lambda _, v: v * 10)
+
+    level: RP[int] = rv.new_property()
+
+    title: RV[str] = rv.combine_latest(name, score)(identity).map(lambda _, v: f"{v[0]} ({v[1]})")
+
+    def __init__(self, team: str) -> None:
+        self.team = team
+
+
+class SlottedPlayer:
+    __slots__ = (DATA_KEY, LOCK_KEY, "team")
+
+    _rv_thread_safe = True
+
+    name: RP[str] = rv.from_value("Nobody")
+
+    upper: RV[str] = name.as_view().map(lambda _, v: v.upper())
+
+    def __init__(self, team: str) -> None:
+        self.team = team
+
+
+# A subclass which customizes pickling on its own, instead of using the hooks inherited from its parent.
+class CustomPlayer(Player):
+    rank: RP[int] = rv.from_value(1)
+
+    def __getstate__(self):
+        return {"team": self.team, "name": self.name, "rank": self.rank}
+
+    def __setstate__(self, state):
+        self.team = state["team"]
+        self.name = state["name"].upper()
+        self.rank = state["rank"]
+
+
+class TeamOnlyPlayer(Player):
+
+    def __getstate__(self):
+        return {"team": self.team}
+
+
+class SnapshotTest(unittest.TestCase):
+
+    def test_snapshot(self):
+        player = Player("Red")
+
+        player.name = "Alice"
+        player.health = 150
+        player.score = 3
+
+        # Values derived from the others and uninitialized properties are left out.
+        self.assertEqual({"name": "Alice", "health": 100, "score": 3}, rv.snapshot(player))
+
+        other = Player("Blue")
+
+        titles = []
+
+        rv.observe(other, "title").subscribe(titles.append)
+
+        rv.restore(other, dict(rv.snapshot(player), level=2))
+
+        self.assertEqual(("Alice", 100, 30, 2), (other.name, other.health, other.score, other.level))
+
+        # The values are applied in a single batch.
+        self.assertEqual(["Nobody (0)", "Alice (30)"], titles)
+
+        with self.assertRaises(AttributeError):
+            rv.restore(other, {"title": "Mallory (0)"})
+
+        with self.assertRaises(AttributeError):
+            rv.restore(other, {"unknown": 1})
+
+    def test_pickle(self):
+        player = Player("Red")
+
+        player.name = "Alice"
+        player.score = 3
+
+        loaded = pickle.loads(pickle.dumps(player))
+
+        self.assertEqual(("Red", "Alice", 30, "Alice (30)"), (loaded.team, loaded.name, loaded.score, loaded.title))
+
+        # The pipelines are rebuilt, rather than shared with the original object.
+        titles = []
+
+        rv.observe(loaded, "title").subscribe(titles.append)
+
+        loaded.score = 4
+
+        self.assertEqual(["Alice (30)", "Alice (40)"], titles)
+        self.assertEqual("Alice (30)", player.title)
+
+        copied = copy.copy(player)
+
+        copied.name = "Bob"
+
+        self.assertEqual(("Bob (30)", "Alice (30)"), (copied.title, player.title))
+
+    def test_pickle_custom(self):
+        player = CustomPlayer("Red")
+
+        player.name = "Alice"
+        player.rank = 3
+
+        loaded = pickle.loads(pickle.dumps(player))
+
+        self.assertEqual(("Red", "ALICE", 3, "ALICE (0)"), (loaded.team, loaded.name, loaded.rank, loaded.title))
+
+        player = TeamOnlyPlayer("Blue")
+
+        player.name = "Bob"
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            loaded = pickle.loads(pickle.dumps(player, protocol))
+
+            # The values are left out of the state, so they should be back to their initial values.
+            self.assertEqual(("Blue", "Nobody", "Nobody (0)"), (loaded.team, loaded.name, loaded.title))
+
+            loaded.score = 2
+
+            self.assertEqual("Nobody (20)", loaded.title)
+
+    def test_pickle_slots(self):
+        player = SlottedPlayer("Red")
+
+        player.name = "Alice"
+
+        with rv.lock(player):
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                loaded = pickle.loads(pickle.dumps(player, protocol))
+
+                self.assertEqual(("Red", "Alice", "ALICE"), (loaded.team, loaded.name, loaded.upper))
+
+                loaded.name = "Bob"
+
+                self.assertEqual("BOB", loaded.upper)
+
+    @unittest.skipIf(find_spec("numpy") is None, "NumPy is not installed.")
+    def test_array(self):
+        import numpy as np
+
+        class Population:
+            positions = rv.from_array([0.0, 0.0, 0.0])
+
+        population = Population()
+
+        snapshot = rv.snapshot(population)
+
+        Population.positions.update(population, 1, 5.0)
+
+        np.testing.assert_array_equal([0.0, 0.0, 0.0], snapshot["positions"])
+
+        rv.restore(population, snapshot)
+
+        np.testing.assert_array_equal([0.0, 0.0, 0.0], population.positions)
+
+
+if __name__ == '__main__':
+    unittest.main()
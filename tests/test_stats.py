@@ -0,0 +1,78 @@
+import unittest
+
+from alleycat.reactive import functions as rv, RP, RV
+from alleycat.reactive.stats import PropertyStats
+
+
+class StatsTest(unittest.TestCase):
+
+    def tearDown(self) -> None:
+        rv.disable_stats()
+
+    def test_disabled(self):
+        class Fixture:
+            value: RP[int] = rv.from_value(1)
+
+        Fixture().value = 2
+
+        self.assertEqual({}, rv.stats())
+
+    def test_stats(self):
+        class Fixture:
+            value: RP[int] = rv.from_value(1)
+
+            doubled: RV[int] = value.as_view().map(lambda _, v: v * 2)
+
+            unused: RP[int] = rv.from_value(0, lazy=True)
+
+        rv.enable_stats()
+
+        fixtures = [Fixture() for _ in range(3)]
+
+        self.assertEqual(3, rv.stats()[Fixture].instances)
+        self.assertEqual({"value", "doubled"}, set(rv.stats()[Fixture].properties.keys()))
+
+        rv.observe(fixtures[0], "value").subscribe(lambda _: None)
+        rv.observe(fixtures[0], "doubled").subscribe(lambda _: None)
+        rv.observe(fixtures[0], "doubled").subscribe(lambda _: None)
+
+        for i in range(3):
+            fixtures[0].value = i
+
+        fixtures[1].value = 4
+
+        stats = rv.stats()[Fixture].properties
+
+        # Each view counts as a subscriber of the property.
+        self.assertEqual(PropertyStats(
+            live=3, materialized=3, connected=0, subscribers=4, emissions=4, disposed=0), stats["value"])
+        self.assertEqual(PropertyStats(
+            live=3, materialized=3, connected=3, subscribers=2, emissions=4, disposed=0), stats["doubled"])
+
+        disposed = fixtures.pop(0)
+
+        rv.dispose(disposed)
+
+        stats = rv.stats()[Fixture].properties
+
+        self.assertEqual(1, stats["value"].disposed)
+        self.assertEqual(2, stats["value"].subscribers)
+        self.assertEqual(0, stats["doubled"].subscribers)
+        self.assertEqual(4, stats["value"].emissions)
+
+        del disposed
+        fixtures.clear()
+
+        stats = rv.stats()[Fixture]
+
+        self.assertEqual(0, stats.instances)
+        self.assertEqual(0, stats.properties["value"].live)
+        self.assertEqual(4, stats.properties["value"].emissions)
+
+        rv.disable_stats()
+
+        self.assertEqual({}, rv.stats())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+import sys
+import threading
+import unittest
+from typing import Callable, List
+
+from rx import operators as ops
+
+from alleycat.reactive import functions as rv, RP, RV
+
+THREADS = 8
+
+WRITES = 500
+
+
+class ThreadSafetyTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        # Switch threads as often as possible to make races more likely to happen.
+        self.interval = sys.getswitchinterval()
+
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self) -> None:
+        sys.setswitchinterval(self.interval)
+
+    @staticmethod
+    def run_threads(target: Callable[[int], None]) -> None:
+        barrier = threading.Barrier(THREADS)
+
+        def run(index: int) -> None:
+            barrier.wait()
+            target(index)
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(THREADS)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+    def test_concurrent_init(self):
+        class Fixture:
+            _rv_thread_safe = True
+
+            _rv_lazy = True
+
+            value: RP[int] = rv.from_value(1)
+
+        for _ in range(20):
+            fixture = Fixture()
+            observables = []
+
+            self.run_threads(lambda _: observables.append(rv.observe(fixture, "value")))
+
+            self.assertEqual(THREADS, len(observables))
+            self.assertEqual(1, len(set(map(id, observables))))
+            self.assertEqual(1, len(list(rv.get_data(fixture))))
+
+    def test_ordered_emission(self):
+        class Fixture:
+            _rv_thread_safe = True
+
+            value: RP[int] = rv.from_value(0)
+
+            doubled: RV[int] = value.as_view().map(lambda _, v: v * 2)
+
+        fixture = Fixture()
+
+        values: List[int] = []
+        inconsistent: List[int] = []
+
+        def check(v: int) -> None:
+            # The view is updated in the same lock, so no other thread can change the value in between.
+            if v != fixture.value * 2:
+                inconsistent.append(v)
+
+        rv.observe(fixture, "value").subscribe(values.append)
+        rv.observe(fixture, "doubled").subscribe(check)
+
+        def write(index: int) -> None:
+            for i in range(WRITES):
+                fixture.value = index * WRITES + i + 1
+
+        self.run_threads(write)
+
+        self.assertEqual(THREADS * WRITES + 1, len(values))
+        self.assertEqual(fixture.value, values[-1])
+        self.assertEqual([], inconsistent)
+
+        # Each thread's changes must be received in the order they were made.
+        for index in range(THREADS):
+            received = [v for v in values if index * WRITES < v <= (index + 1) * WRITES]
+
+            self.assertEqual(list(range(index * WRITES + 1, (index + 1) * WRITES + 1)), received)
+
+    def test_atomic_update(self):
+        class Fixture:
+            _rv_thread_safe = True
+
+            _rv_glitch_free = True
+
+            x: RP[int] = rv.from_value(0)
+
+            y: RP[int] = rv.from_value(0)
+
+            pair: RV[int] = rv.combine_latest(x, y)(ops.map(tuple))
+
+        fixture = Fixture()
+
+        pairs = []
+
+        rv.observe(fixture, "pair").subscribe(pairs.append)
+
+        def write(index: int) -> None:
+            for i in range(WRITES // 10):
+                v = index * WRITES + i
+                rv.update(fixture, x=v, y=v)
+
+        self.run_threads(write)
+
+        self.assertEqual([], [p for p in pairs if p[0] != p[1]])
+        self.assertEqual((fixture.x, fixture.y), pairs[-1])
+
+    def test_slots(self):
+        class Fixture:
+            __slots__ = ("_rv_data", "_rv_lock")
+
+            _rv_thread_safe = True
+
+            value: RP[int] = rv.from_value(0)
+
+        fixture = Fixture()
+
+        self.run_threads(lambda i: setattr(fixture, "value", i))
+
+        self.assertIn(fixture.value, range(THREADS))
+
+        class MissingLock:
+            __slots__ = ("_rv_data",)
+
+            _rv_thread_safe = True
+
+            value: RP[int] = rv.from_value(0)
+
+        with self.assertRaises(TypeError) as cm:
+            MissingLock().value = 1
+
+        self.assertEqual("Class 'MissingLock' must declare '_rv_lock' in its __slots__.", cm.exception.args[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
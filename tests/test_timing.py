@@ -0,0 +1,78 @@
+import unittest
+
+from rx import operators as ops
+
+from alleycat.reactive import functions as rv, RP, RV, timing
+
+
+class TimingTest(unittest.TestCase):
+
+    def tearDown(self) -> None:
+        rv.disable_timing()
+
+    def test_disabled(self):
+        modifiers = (ops.map(str),)
+
+        self.assertIs(modifiers, timing.instrument(modifiers))
+
+        self.assertEqual([], rv.timings())
+        self.assertEqual("", rv.export_timings())
+
+    def test_timings(self):
+        rv.enable_timing()
+
+        class Fixture:
+            value: RP[int] = rv.from_value(1).validate(lambda _, v: max(v, 0))
+
+            unchecked: RP[int] = rv.from_value(1)
+
+            doubled: RV[str] = value.as_view() \
+                .map(lambda _, v: v * 2) \
+                .pipe(lambda _: (ops.filter(lambda v: v > 2), ops.map(str)))
+
+        fixture = Fixture()
+
+        values = []
+
+        rv.observe(fixture, "doubled").subscribe(values.append)
+
+        for v in (-1, 2, 3):
+            fixture.value = v
+
+        fixture.unchecked = 2
+
+        self.assertEqual(["4", "6"], values)
+
+        counts = {(t["class"], t["property"], t["stage"]): t["count"] for t in rv.timings()}
+
+        owner = Fixture.__qualname__
+
+        # Stages are numbered in the order of the pipeline, and the default validator is not measured.
+        self.assertEqual({
+            (owner, "value", "validator"): 4,
+            (owner, "doubled", "map[0]"): 4,
+            (owner, "doubled", "filter[1]"): 4,
+            (owner, "doubled", "map[2]"): 2,
+            (owner, "doubled", "subscribers"): 2
+        }, counts)
+
+        timings = next(t for t in rv.timings() if t["stage"] == "subscribers")
+
+        self.assertEqual(2, timings["buckets"][1.0])
+        self.assertGreaterEqual(timings["sum"], timings["max"])
+
+        text = rv.export_timings()
+
+        labels = f'class="{owner}",property="doubled",stage="subscribers"'
+
+        self.assertIn("# TYPE alleycat_reactive_seconds histogram", text)
+        self.assertIn(f'alleycat_reactive_seconds_bucket{{{labels},le="+Inf"}} 2', text)
+        self.assertIn(f"alleycat_reactive_seconds_count{{{labels}}} 2", text)
+
+        rv.disable_timing()
+
+        self.assertEqual([], rv.timings())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -20,12 +20,13 @@ class UtilsTest(unittest.TestCase):
         frame = outer(1).value_or(None)
 
         self.assertIsNotNone(frame)
-        self.assertDictEqual({"chloe": "price", "depth": 1}, frame.f_locals)
+        # Python 3.13+ returns a proxy instead of a dictionary.
+        self.assertDictEqual({"chloe": "price", "depth": 1}, dict(frame.f_locals))
 
         frame = outer(2).value_or(None)
 
         self.assertIsNotNone(frame)
-        self.assertDictEqual({"maxine": "caulfield", "depth": 2, "inner": inner}, frame.f_locals)
+        self.assertDictEqual({"maxine": "caulfield", "depth": 2, "inner": inner}, dict(frame.f_locals))
 
     def test_get_property_reference(self):
         def fun(_):
@@ -47,6 +48,56 @@ class UtilsTest(unittest.TestCase):
         self.assertEqual(life, obj)
         self.assertEqual("is_strange", prop)
 
+    def test_get_property_reference_cache(self):
+        def fun(_):
+            frame = utils.get_current_frame(2)
+            return frame.bind(utils.get_property_reference).unwrap()
+
+        class Chloe:
+            hair = "blue"
+
+        class Rachel:
+            hair = "blonde"
+
+        utils._get_reference_path.cache_clear()
+
+        results = []
+
+        for friend in (Chloe(), Rachel()):
+            results.append(fun(friend.hair))
+
+        self.assertEqual("hair", results[0][1])
+        self.assertEqual("hair", results[1][1])
+
+        # The same call site should resolve to different objects while hitting the cache.
+        self.assertIsInstance(results[0][0], Chloe)
+        self.assertIsInstance(results[1][0], Rachel)
+
+        info = utils._get_reference_path.cache_info()
+
+        self.assertEqual((1, 1), (info.hits, info.misses))
+
+    def test_is_invoked_from_observe(self):
+        def read():
+            return utils.get_current_frame(3).map(utils.is_invoked_from_observe).unwrap()
+
+        class Life:
+            @property
+            def is_strange(self):
+                return read()
+
+        def observe(value):
+            return value
+
+        life = Life()
+
+        # It is deprecated in favour of get_observe_receiver, but should still work.
+        with self.assertWarns(DeprecationWarning):
+            self.assertTrue(observe(life.is_strange))
+
+        with self.assertWarns(DeprecationWarning):
+            self.assertFalse(bool(life.is_strange))
+
     def test_get_instructions(self):
         def outer(depth: int):
             value = inner(depth)
@@ -57,7 +108,8 @@ class UtilsTest(unittest.TestCase):
 
         self.assertEqual("RETURN_VALUE", next(outer(1)).opname)
         self.assertEqual("RETURN_VALUE", next(outer(2)).opname)
-        self.assertEqual("CALL_FUNCTION", next(outer(3)).opname)
+        # The instruction was renamed in Python 3.11.
+        self.assertIn(next(outer(3)).opname, ("CALL_FUNCTION", "CALL"))
 
 
 if __name__ == '__main__':
@@ -1,12 +1,13 @@
 import gc
 import unittest
+import weakref
 
 import rx
 from returns.functions import identity
 from rx import operators as ops
 
 from alleycat.reactive import functions as rv, RP, RV
-from alleycat.reactive.value import DATA_KEY
+from alleycat.reactive.value import DATA_KEY, get_table
 
 
 class ReactiveValueTest(unittest.TestCase):
@@ -126,6 +127,136 @@ class ReactiveValueTest(unittest.TestCase):
         # Eager initialization should still work with an explict constructor:
         self.assertEqual(2, bangles.hits)
 
+    def test_inherited_hooks(self):
+        created = []
+        disposed = []
+
+        def track(name: str) -> RV[str]:
+            def create(_):
+                created.append(name)
+
+                return rx.never().pipe(ops.finally_action(lambda: disposed.append(name)))
+
+            return rv.from_instance(create)
+
+        class Base:
+            first: RV[str] = track("first")
+
+            lazy: RP[int] = rv.from_value(1, lazy=True)
+
+        class Middle(Base):
+            second: RV[str] = track("second")
+
+            def __init__(self):
+                super().__init__()
+
+                # The values are initialized once the constructor of the concrete class is done.
+                self.created = list(created)
+
+        class Derived(Middle):
+            third: RV[str] = track("third")
+
+            # Overriding a value keeps its position in the table.
+            first: RV[str] = track("first (overridden)")
+
+        fixture = Derived()
+
+        self.assertEqual([], fixture.created)
+        self.assertEqual(["first (overridden)", "second", "third"], created)
+
+        table = get_table(Derived)
+
+        self.assertEqual(["first", "lazy", "second", "third"], [v.name for v in table.values])
+        self.assertEqual(["first", "second", "third"], [v.name for v in table.eager])
+        self.assertIs(Derived.first, table.values[0])
+
+        del fixture
+
+        self.assertEqual(["first (overridden)", "second", "third"], disposed)
+
+        created.clear()
+
+        Middle()
+
+        self.assertEqual(["first", "second"], created)
+
+    def test_data_lookup(self):
+        class Fixture:
+            value: RP[int] = rv.from_value(1)
+
+            def __init__(self):
+                pass
+
+        fixture = Fixture()
+
+        data = Fixture.value._get_data(fixture)
+
+        self.assertIs(data, Fixture.value._get_data(fixture))
+        self.assertIs(data, getattr(fixture, DATA_KEY)["value"])
+
+        # Instances which bypassed the constructor should still get initialized on their first access.
+        uninitialized = Fixture.__new__(Fixture)
+
+        self.assertEqual(1, uninitialized.value)
+        self.assertIsNot(data, Fixture.value._get_data(uninitialized))
+
+    def test_slots(self):
+        class Parent:
+            __slots__ = (DATA_KEY,)
+
+            name: RP[str] = rv.from_value("Max")
+
+            age: RP[int] = rv.new_property()
+
+        class Child(Parent):
+            __slots__ = ()
+
+            age: RP[int] = Parent.age.map(lambda _, v: v + 1)
+
+            friend: RV[str] = rv.from_observable(rx.of("Chloe"))
+
+        self.assertEqual((0, 1, 1, 2), (Parent.name._index, Parent.age._index, Child.age._index, Child.friend._index))
+
+        fixture = Child()
+
+        self.assertFalse(hasattr(fixture, "__dict__"))
+
+        fixture.age = 17
+
+        self.assertEqual("Max", fixture.name)
+        self.assertEqual(18, fixture.age)
+        self.assertEqual("Chloe", fixture.friend)
+
+        names = []
+
+        rv.observe(fixture.name).subscribe(names.append)
+
+        fixture.name = "Maxine"
+
+        self.assertEqual(["Max", "Maxine"], names)
+
+        record = getattr(fixture, DATA_KEY)
+
+        self.assertEqual(list, type(record))
+        self.assertEqual(3, len(record))
+
+        rv.dispose(fixture)
+
+        self.assertTrue(all(map(lambda d: d.disposed, record)))
+
+    def test_slots_without_data(self):
+        # Python 3.12+ no longer wraps the errors raised by __set_name__ in a RuntimeError.
+        with self.assertRaises((TypeError, RuntimeError)) as cm:
+            class Fixture:
+                __slots__ = ("name",)
+
+                value: RP[int] = rv.from_value(1)
+
+        error = cm.exception if isinstance(cm.exception, TypeError) else cm.exception.__cause__
+
+        self.assertIsInstance(error, TypeError)
+        self.assertEqual(f"Class 'Fixture' must declare '{DATA_KEY}' in its __slots__.", error.args[0])
+
     def test_del_hook(self):
         calls = []
 
@@ -150,6 +281,45 @@ class ReactiveValueTest(unittest.TestCase):
 
         self.assertEqual([True], calls)
 
+    def test_freed_without_gc(self):
+        class Fixture:
+            value: RP[int] = rv.from_value(1).validate(lambda o, v: v + o.offset)
+
+            doubled: RV[int] = value.as_view().map(lambda o, v: v * 2 + o.offset)
+
+            def __init__(self):
+                self.offset = 0
+
+        class Slotted:
+            __slots__ = ("_rv_data", "__weakref__")
+
+            value: RP[int] = rv.from_value(1)
+
+            doubled: RV[int] = value.as_view().map(lambda _, v: v * 2)
+
+        gc.collect()
+        gc.disable()
+
+        try:
+            for cls in (Fixture, Slotted):
+                values = []
+
+                obj = cls()
+                obj.value = 2
+
+                rv.observe(obj, "doubled").subscribe(values.append)
+
+                self.assertEqual([4], values)
+
+                reference = weakref.ref(obj)
+
+                del obj
+
+                # The instance should be freed by reference counting alone.
+                self.assertIsNone(reference())
+        finally:
+            gc.enable()
+
 
 if __name__ == '__main__':
     unittest.main()
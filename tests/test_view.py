@@ -7,7 +7,7 @@ from returns.iterables import Fold
 from rx import operators as ops
 from rx.subject import BehaviorSubject
 
-from alleycat.reactive import ReactiveView, functions as rv, RV
+from alleycat.reactive import ReactiveView, functions as rv, RP, RV
 
 
 # noinspection DuplicatedCode
@@ -161,6 +161,60 @@ class ReactiveViewTest(unittest.TestCase):
 
         self.assertEqual("Who's afraid of a big bad cat?", fixture.song)
 
+    def test_fused_stages(self):
+        calls = []
+
+        def track(label: str, result):
+            calls.append(label)
+            return result
+
+        class Fixture:
+            value: RP[int] = rv.from_value(1)
+
+            doubled: RV[int] = value.as_view() \
+                .map(lambda _, v: track("double", v * 2)) \
+                .filter(lambda _, v: track("filter", v > 2))
+
+            labelled: RV[str] = doubled \
+                .map(lambda _, v: track("increment", v + 1)) \
+                .map(lambda o, v: track("label", f"{o.prefix}{v}"))
+
+            def __init__(self):
+                self.prefix = "#"
+
+        rv.enable_timing()
+
+        try:
+            fixture = Fixture()
+
+            values = []
+
+            rv.observe(fixture, "labelled").subscribe(values.append)
+
+            stages = {(t["property"], t["stage"]) for t in rv.timings()}
+        finally:
+            rv.disable_timing()
+
+        # Consecutive stages are fused into a single operator, up to the named view which has its own data.
+        self.assertEqual({
+            ("doubled", "map+filter[0]"),
+            ("labelled", "map+map[0]"),
+            ("labelled", "subscribers")
+        }, stages)
+
+        self.assertEqual([], values)
+        self.assertEqual(["double", "filter"], calls)
+
+        fixture.value = 2
+
+        self.assertEqual(["#5"], values)
+        self.assertEqual(4, fixture.doubled)
+        self.assertEqual(["double", "filter", "double", "filter", "increment", "label"], calls)
+
+        fixture.value = 1
+
+        self.assertEqual(["#5"], values)
+
     def test_pipe(self):
         source = BehaviorSubject("wolf")
 